@@ -0,0 +1,97 @@
+"""Batch runs of a solution over many inputs."""
+
+import os
+import typing as t
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from pathlib import Path
+
+from advent_of_code_2025.registry import get_solution
+from advent_of_code_2025.server import solve_request
+
+
+def load_solution(day: int, part: int) -> None:
+    """Pool initializer importing the solution once per worker.
+
+    Args:
+        day (int): Day number.
+        part (int): Part number.
+    """
+    get_solution(day, part)
+
+
+def list_inputs(input_dir: Path, pattern: str) -> t.Iterator[Path]:
+    """Lazily list the input files of a folder, in name order.
+
+    Args:
+        input_dir (Path): Folder containing the inputs.
+        pattern (str): Glob pattern of the input file names.
+
+    Yields:
+        Path: Absolute path of each input file.
+    """
+    for input_path in sorted(input_dir.glob(pattern)):
+        if input_path.is_file():
+            yield input_path.absolute()
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def run_batch(
+    day: int,
+    part: int,
+    input_paths: t.Iterable[Path],
+    workers: int | None = None,
+    max_pending: int | None = None,
+    timeout: float | None = None,
+) -> t.Iterator[t.Dict[str, t.Any]]:
+    """Parse and solve many inputs through a bounded pool of processes.
+    At most `max_pending` inputs are queued at once, new ones are only
+    submitted as results are consumed.
+
+    Args:
+        day (int): Day number.
+        part (int): Part number.
+        input_paths (t.Iterable[Path]): Absolute paths of the inputs.
+        workers (int | None, optional):
+            Number of worker processes. Defaults to the number of CPUs.
+        max_pending (int | None, optional):
+            Maximum number of queued inputs. Defaults to twice the number
+            of workers.
+        timeout (float | None, optional):
+            Maximum duration of each input in seconds. Defaults to None.
+
+    Yields:
+        t.Dict[str, t.Any]: Result of each input, in completion order,
+            with the same fields as the `aoc serve` responses.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * workers
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=load_solution, initargs=(day, part)
+    ) as executor:
+        pending: t.Set[Future[t.Dict[str, t.Any]]] = set()
+        for input_path in input_paths:
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(
+                executor.submit(
+                    solve_request,
+                    {
+                        "id": str(input_path),
+                        "day": day,
+                        "part": part,
+                        "path": str(input_path),
+                        "timeout": timeout,
+                    },
+                )
+            )
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
@@ -0,0 +1,644 @@
+"""Benchmark suite for Advent of Code 2025 solutions."""
+
+import gc
+import json
+import math
+import platform
+import statistics
+import tempfile
+import time
+import tracemalloc
+import typing as t
+from datetime import datetime, timezone
+from pathlib import Path
+
+from advent_of_code_2025.generation import write_input
+from advent_of_code_2025.puzzle_input import InputSource
+from advent_of_code_2025.registry import Solution, get_solution
+from advent_of_code_2025.runner import time_limit
+
+BENCHMARK_INPUT: str = "inputs/real.txt"
+
+# Raw results of a JSON report, by day and part
+ResultsByPart = t.Dict[t.Tuple[int, int], t.Dict[str, t.Any]]
+
+
+class PhaseStats(t.NamedTuple):
+    """Timing statistics of a single benchmark phase."""
+
+    min: float
+    median: float
+    p95: float
+    samples: t.List[float]
+
+    @classmethod
+    def from_samples(cls, samples: t.List[float]) -> "PhaseStats":
+        """Compute statistics from raw timing samples.
+
+        Args:
+            samples (t.List[float]): Timing samples in seconds.
+
+        Returns:
+            PhaseStats: Statistics of the samples.
+        """
+        return cls(
+            min=min(samples),
+            median=statistics.median(samples),
+            p95=percentile(samples, 95),
+            samples=samples,
+        )
+
+
+class BenchmarkResult(t.NamedTuple):
+    """Benchmark result of a day/part."""
+
+    day: int
+    part: int
+    phases: t.Dict[str, PhaseStats]
+    peak_memory: int
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        """Convert the result to a JSON serializable dictionary.
+
+        Returns:
+            t.Dict[str, t.Any]: JSON serializable result.
+        """
+        return {
+            "day": self.day,
+            "part": self.part,
+            "phases": {
+                name: stats._asdict() for name, stats in self.phases.items()
+            },
+            "peak_memory": self.peak_memory,
+        }
+
+
+def percentile(samples: t.List[float], rank: int) -> float:
+    """Compute a percentile using linear interpolation between samples.
+
+    Args:
+        samples (t.List[float]): Samples to compute the percentile from.
+        rank (int): Percentile rank (0-100).
+
+    Returns:
+        float: Percentile value.
+    """
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[rank - 1]
+
+
+def measure_peak_memory(solution: Solution, source: InputSource) -> int:
+    """Measure the peak memory allocated while parsing and solving an input.
+    Tracing allocations is much slower, so timed runs are never traced.
+
+    Args:
+        solution (Solution): Solution to run.
+        source (InputSource): Input file name or stream.
+
+    Returns:
+        int: Peak memory in bytes.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        solution.solve(solution.parse(source))
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak_memory
+
+
+def time_phases(solution: Solution) -> t.Dict[str, float]:
+    """Run a solution once and time each of its stages.
+
+    Args:
+        solution (Solution): Solution to run.
+
+    Returns:
+        t.Dict[str, float]: Duration in seconds of each phase.
+    """
+    timings: t.Dict[str, float] = {}
+    # Garbage of the previous run must not be collected during this one
+    gc.collect()
+    start: float = time.perf_counter()
+    parsed: t.Any = solution.parse(BENCHMARK_INPUT)
+    timings["parse"] = time.perf_counter() - start
+    solution.solve(parsed)
+    timings["solve"] = time.perf_counter() - start - timings["parse"]
+    timings["total"] = time.perf_counter() - start
+    return timings
+
+
+def run_benchmark(
+    day: int, part: int, warmup: int, repetitions: int
+) -> BenchmarkResult:
+    """Benchmark a day/part solution.
+
+    Args:
+        day (int): Day number.
+        part (int): Part number.
+        warmup (int): Number of untimed runs before measuring.
+        repetitions (int): Number of timed runs.
+
+    Returns:
+        BenchmarkResult: Timing statistics of each phase.
+    """
+    solution: Solution = get_solution(day, part)
+    for _ in range(warmup):
+        time_phases(solution)
+
+    samples: t.Dict[str, t.List[float]] = {}
+    for _ in range(repetitions):
+        for phase, duration in time_phases(solution).items():
+            samples.setdefault(phase, []).append(duration)
+
+    return BenchmarkResult(
+        day=day,
+        part=part,
+        phases={
+            phase: PhaseStats.from_samples(phase_samples)
+            for phase, phase_samples in samples.items()
+        },
+        peak_memory=measure_peak_memory(solution, BENCHMARK_INPUT),
+    )
+
+
+def format_result(result: BenchmarkResult) -> t.List[str]:
+    """Format a benchmark result as table rows.
+
+    Args:
+        result (BenchmarkResult): Benchmark result to format.
+
+    Returns:
+        t.List[str]: One formatted row per phase.
+    """
+    return [
+        f"{result.day:>3} {result.part:>4}  {phase:<6}"
+        f"{stats.min * 1000:>12.3f}"
+        f"{stats.median * 1000:>12.3f}"
+        f"{stats.p95 * 1000:>12.3f}"
+        for phase, stats in result.phases.items()
+    ]
+
+
+class Comparison(t.NamedTuple):
+    """Comparison of a benchmark result with its baseline."""
+
+    day: int
+    part: int
+    baseline_min: float
+    min: float
+    p_value: float
+    baseline_peak_memory: int
+    peak_memory: int
+    slower: bool
+    bigger: bool
+
+    @property
+    def regressed(self) -> bool:
+        """Whether the day/part got slower or uses more memory.
+
+        Returns:
+            bool: True if the day/part regressed.
+        """
+        return self.slower or self.bigger
+
+
+def mann_whitney_p_value(
+    samples: t.List[float], baseline: t.List[float]
+) -> float:
+    """Compute the one-sided p-value of the Mann-Whitney U test that
+    samples tend to be greater than baseline samples.
+    Uses the normal approximation with tie and continuity corrections.
+
+    Args:
+        samples (t.List[float]): Current samples.
+        baseline (t.List[float]): Baseline samples.
+
+    Returns:
+        float: Probability of samples at least this much greater
+            if both come from the same distribution.
+    """
+    values: t.List[t.Tuple[float, int]] = sorted(
+        [(value, 0) for value in samples] + [(value, 1) for value in baseline]
+    )
+    # Average ranks (starting at 1) of tied values
+    ranks: t.List[float] = [0.0] * len(values)
+    ties_correction: float = 0.0
+    start: int = 0
+    while start < len(values):
+        end: int = start
+        while end + 1 < len(values) and values[end + 1][0] == values[start][0]:
+            end += 1
+        ranks[start : end + 1] = [(start + end) / 2 + 1] * (end - start + 1)
+        ties_correction += (end - start + 1) ** 3 - (end - start + 1)
+        start = end + 1
+
+    samples_count: int = len(samples)
+    baseline_count: int = len(baseline)
+    total_count: int = samples_count + baseline_count
+    u_statistic: float = (
+        sum(rank for rank, (_, group) in zip(ranks, values) if group == 0)
+        - samples_count * (samples_count + 1) / 2
+    )
+    mean: float = samples_count * baseline_count / 2
+    variance: float = (
+        samples_count
+        * baseline_count
+        / 12
+        * (
+            total_count
+            + 1
+            - ties_correction / (total_count * (total_count - 1))
+        )
+    )
+    if variance <= 0:
+        return 1.0
+    z_score: float = (u_statistic - mean - 0.5) / math.sqrt(variance)
+    return 1 - statistics.NormalDist().cdf(z_score)
+
+
+def compare_result(
+    result: BenchmarkResult,
+    baseline: t.Dict[str, t.Any],
+    threshold: float,
+    alpha: float,
+    min_delta: float = 0.0,
+) -> Comparison:
+    """Compare the total duration and peak memory of a benchmark result
+    with its baseline.
+    A day/part is slower when its total duration samples are significantly
+    greater (Mann-Whitney U test), and its minimum duration grew beyond
+    both the relative threshold and the absolute delta. Noise only ever
+    adds time, so minimums are the most stable durations of short runs.
+    It is bigger when its peak memory grew beyond the threshold.
+
+    Args:
+        result (BenchmarkResult): Benchmark result.
+        baseline (t.Dict[str, t.Any]): Raw baseline result of the day/part.
+        threshold (float): Allowed relative increase (0.1 for 10%).
+        alpha (float): Significance level of the test.
+        min_delta (float, optional): Allowed absolute increase of the
+            duration in seconds. Defaults to 0.
+
+    Returns:
+        Comparison: Comparison with the baseline.
+    """
+    samples: t.List[float] = result.phases["total"].samples
+    baseline_samples: t.List[float] = baseline["phases"]["total"]["samples"]
+    duration: float = min(samples)
+    baseline_duration: float = min(baseline_samples)
+    p_value: float = mann_whitney_p_value(samples, baseline_samples)
+    # Baselines written before peak memory was measured never regress
+    baseline_peak_memory: int = baseline.get("peak_memory", result.peak_memory)
+    return Comparison(
+        day=result.day,
+        part=result.part,
+        baseline_min=baseline_duration,
+        min=duration,
+        p_value=p_value,
+        baseline_peak_memory=baseline_peak_memory,
+        peak_memory=result.peak_memory,
+        slower=(
+            p_value < alpha
+            and duration > baseline_duration * (1 + threshold)
+            and duration - baseline_duration > min_delta
+        ),
+        bigger=result.peak_memory > baseline_peak_memory * (1 + threshold),
+    )
+
+
+def format_comparison(comparison: Comparison) -> str:
+    """Format a comparison as a table row.
+
+    Args:
+        comparison (Comparison): Comparison to format.
+
+    Returns:
+        str: Formatted row.
+    """
+    verdicts: t.List[str] = [
+        verdict
+        for verdict, regressed in (
+            ("slower", comparison.slower),
+            ("more memory", comparison.bigger),
+        )
+        if regressed
+    ]
+    time_change: float = comparison.min / comparison.baseline_min - 1
+    memory_change: float = (
+        comparison.peak_memory / max(comparison.baseline_peak_memory, 1) - 1
+    )
+    return (
+        f"{comparison.day:>3} {comparison.part:>4}"
+        f"{comparison.baseline_min * 1000:>12.3f}"
+        f"{comparison.min * 1000:>12.3f}"
+        f"{time_change * 100:>+9.1f}%{comparison.p_value:>9.3f}"
+        f"{memory_change * 100:>+9.1f}%  {', '.join(verdicts) or 'ok'}"
+    )
+
+
+def load_report(
+    report_path: Path,
+) -> t.Tuple[t.Dict[str, t.Any], ResultsByPart]:
+    """Load a JSON report written by `write_results`
+    or `write_scaling_results`.
+
+    Args:
+        report_path (Path): Path of the JSON report.
+
+    Returns:
+        t.Tuple[t.Dict[str, t.Any], ResultsByPart]:
+            Raw report, and its results by day and part.
+    """
+    with open(report_path, "r", encoding="utf-8") as report_fd:
+        report: t.Dict[str, t.Any] = json.load(report_fd)
+    return report, {
+        (result["day"], result["part"]): result for result in report["results"]
+    }
+
+
+def write_results(
+    results: t.List[BenchmarkResult],
+    output_path: Path,
+    warmup: int,
+    repetitions: int,
+) -> None:
+    """Write benchmark results to a JSON file.
+
+    Args:
+        results (t.List[BenchmarkResult]): Benchmark results.
+        output_path (Path): Path of the JSON file to write.
+        warmup (int): Number of untimed runs used.
+        repetitions (int): Number of timed runs used.
+    """
+    report: t.Dict[str, t.Any] = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "input": BENCHMARK_INPUT,
+        "warmup": warmup,
+        "repetitions": repetitions,
+        "results": [result.to_dict() for result in results],
+    }
+    with open(output_path, "w", encoding="utf-8") as output_fd:
+        json.dump(report, output_fd, indent=2)
+
+
+class ScalingPoint(t.NamedTuple):
+    """Measurements of a solution on a generated input of a given scale."""
+
+    scale: int
+    duration: float
+    peak_memory: int
+
+
+class ScalingResult(t.NamedTuple):
+    """Empirical complexity of a day/part, fitted over growing inputs."""
+
+    day: int
+    part: int
+    points: t.List[ScalingPoint]
+    time_exponent: float | None
+    memory_exponent: float | None
+    status: str
+
+    @classmethod
+    def from_points(
+        cls, day: int, part: int, points: t.List[ScalingPoint], status: str
+    ) -> "ScalingResult":
+        """Fit the time and memory exponents of the measured points.
+
+        Args:
+            day (int): Day number.
+            part (int): Part number.
+            points (t.List[ScalingPoint]): Measured points.
+            status (str): Status of the last measured scale.
+
+        Returns:
+            ScalingResult: Scaling result of the day/part.
+        """
+        scales: t.List[int] = [point.scale for point in points]
+        return cls(
+            day=day,
+            part=part,
+            points=points,
+            time_exponent=fit_exponent(
+                scales, [point.duration for point in points]
+            ),
+            memory_exponent=fit_exponent(
+                scales, [point.peak_memory for point in points]
+            ),
+            status=status,
+        )
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        """Convert the result to a JSON serializable dictionary.
+
+        Returns:
+            t.Dict[str, t.Any]: JSON serializable result.
+        """
+        return {
+            "day": self.day,
+            "part": self.part,
+            "points": [point._asdict() for point in self.points],
+            "time_exponent": self.time_exponent,
+            "memory_exponent": self.memory_exponent,
+            "status": self.status,
+        }
+
+
+def geometric_scales(min_scale: int, factor: float, steps: int) -> t.List[int]:
+    """Compute geometrically growing input scales.
+
+    Args:
+        min_scale (int): First scale.
+        factor (float): Ratio between two consecutive scales.
+        steps (int): Number of scales.
+
+    Returns:
+        t.List[int]: Distinct scales, in increasing order.
+    """
+    return sorted({round(min_scale * factor**step) for step in range(steps)})
+
+
+def fit_exponent(
+    scales: t.List[int], values: t.Sequence[float]
+) -> float | None:
+    """Fit `value = c * scale ** exponent` by least squares in log-log space.
+
+    Args:
+        scales (t.List[int]): Input scales.
+        values (t.Sequence[float]): Measured value at each scale.
+
+    Returns:
+        float | None: Fitted exponent, None if less than two usable points.
+    """
+    usable: t.List[t.Tuple[float, float]] = [
+        (math.log(scale), math.log(value))
+        for scale, value in zip(scales, values)
+        if scale > 0 and value > 0
+    ]
+    if len({log_scale for log_scale, _ in usable}) < 2:
+        return None
+    return statistics.linear_regression(*zip(*usable)).slope
+
+
+def measure_point(
+    solution: Solution, input_path: Path, repetitions: int
+) -> t.Tuple[float, int]:
+    """Measure the parse and solve stages of a solution on an input.
+    The peak memory is measured by an extra traced run.
+
+    Args:
+        solution (Solution): Solution to run.
+        input_path (Path): Absolute path of the input.
+        repetitions (int): Number of timed runs, the fastest is kept.
+
+    Returns:
+        t.Tuple[float, int]: Duration in seconds, and peak memory in bytes.
+    """
+    durations: t.List[float] = []
+    for _ in range(repetitions):
+        start: float = time.perf_counter()
+        solution.solve(solution.parse(input_path))
+        durations.append(time.perf_counter() - start)
+    return min(durations), measure_peak_memory(solution, input_path)
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def run_scaling(
+    day: int,
+    part: int,
+    scales: t.List[int],
+    seed: int,
+    repetitions: int,
+    timeout: float,
+) -> ScalingResult:
+    """Run a solution over generated inputs of growing scales.
+    Scaling stops at the first scale exceeding the timeout.
+
+    Args:
+        day (int): Day number.
+        part (int): Part number.
+        scales (t.List[int]): Input scales, in increasing order.
+        seed (int): Seed of the input generator.
+        repetitions (int): Number of timed runs of each scale.
+        timeout (float): Maximum duration of each scale in seconds.
+
+    Returns:
+        ScalingResult: Measured points and fitted exponents.
+    """
+    solution: Solution = get_solution(day, part)
+    points: t.List[ScalingPoint] = []
+    status: str = "ok"
+    with tempfile.TemporaryDirectory() as input_dir:
+        for scale in scales:
+            input_path: Path = Path(input_dir) / f"scale_{scale}.txt"
+            with open(input_path, "w", encoding="utf-8") as input_fd:
+                write_input(day, scale, seed, input_fd)
+            try:
+                with time_limit(timeout):
+                    duration, peak_memory = measure_point(
+                        solution, input_path, repetitions
+                    )
+            except TimeoutError:
+                status = f"timeout at scale {scale}"
+                break
+            points.append(ScalingPoint(scale, duration, peak_memory))
+    return ScalingResult.from_points(day, part, points, status)
+
+
+def format_scaling_result(result: ScalingResult) -> t.List[str]:
+    """Format a scaling result as table rows.
+
+    Args:
+        result (ScalingResult): Scaling result to format.
+
+    Returns:
+        t.List[str]: One formatted row per scale, then the fitted exponents.
+    """
+
+    def format_exponent(exponent: float | None) -> str:
+        """Format a fitted exponent.
+
+        Args:
+            exponent (float | None): Fitted exponent, if any.
+
+        Returns:
+            str: Formatted exponent.
+        """
+        return "n/a" if exponent is None else f"{exponent:.2f}"
+
+    rows: t.List[str] = [
+        f"{result.day:>3} {result.part:>4} {point.scale:>10}"
+        f"{point.duration * 1000:>14.3f}{point.peak_memory / 1024:>14.1f}"
+        for point in result.points
+    ]
+    rows.append(
+        f"{result.day:>3} {result.part:>4} {'exponent':>10}"
+        f"{format_exponent(result.time_exponent):>14}"
+        f"{format_exponent(result.memory_exponent):>14}  {result.status}"
+    )
+    return rows
+
+
+def find_exponent_regressions(
+    result: ScalingResult,
+    baseline: ResultsByPart,
+    tolerance: float,
+) -> t.List[str]:
+    """Compare the fitted exponents of a result with its baseline.
+
+    Args:
+        result (ScalingResult): Scaling result to check.
+        baseline (ResultsByPart): Baseline results by day and part.
+        tolerance (float): Allowed exponent increase.
+
+    Returns:
+        t.List[str]: Description of each regressed exponent.
+    """
+    baseline_result: t.Dict[str, t.Any] | None = baseline.get(
+        (result.day, result.part)
+    )
+    if baseline_result is None:
+        return []
+
+    regressions: t.List[str] = []
+    for name, exponent in (
+        ("time", result.time_exponent),
+        ("memory", result.memory_exponent),
+    ):
+        baseline_exponent: float | None = baseline_result[f"{name}_exponent"]
+        if (
+            exponent is not None
+            and baseline_exponent is not None
+            and exponent > baseline_exponent + tolerance
+        ):
+            regressions.append(
+                f"Day {result.day}, Part {result.part}: {name} exponent "
+                f"{baseline_exponent:.2f} -> {exponent:.2f}"
+            )
+    return regressions
+
+
+def write_scaling_results(
+    results: t.List[ScalingResult], output_path: Path, seed: int
+) -> None:
+    """Write scaling results to a JSON file.
+
+    Args:
+        results (t.List[ScalingResult]): Scaling results.
+        output_path (Path): Path of the JSON file to write.
+        seed (int): Seed of the input generators.
+    """
+    report: t.Dict[str, t.Any] = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "results": [result.to_dict() for result in results],
+    }
+    with open(output_path, "w", encoding="utf-8") as output_fd:
+        json.dump(report, output_fd, indent=2)
@@ -0,0 +1,302 @@
+"""On-disk caches shared by the Advent of Code 2025 solutions."""
+
+import hashlib
+import os
+import pickle
+import sys
+import typing as t
+from pathlib import Path
+from types import ModuleType
+
+CACHE_DIR_ENV: str = "AOC_CACHE_DIR"
+HASH_CHUNK_SIZE: int = 1 << 20
+
+
+def get_cache_dir() -> Path:
+    """Get the root folder of the caches.
+    Uses `$AOC_CACHE_DIR`, then `$XDG_CACHE_HOME/advent_of_code_2025`,
+    then `~/.cache/advent_of_code_2025`.
+
+    Returns:
+        Path: Root folder of the caches.
+    """
+    if CACHE_DIR_ENV in os.environ:
+        return Path(os.environ[CACHE_DIR_ENV])
+    return (
+        Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+        / "advent_of_code_2025"
+    )
+
+
+def hash_file(file_path: Path) -> str:
+    """Compute the SHA-256 digest of a file content.
+
+    Args:
+        file_path (Path): File to hash.
+
+    Returns:
+        str: Hexadecimal digest.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as input_fd:
+        while chunk := input_fd.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_modules(*modules: ModuleType) -> str:
+    """Compute a version digest from the source files of modules.
+
+    Args:
+        *modules (ModuleType): Modules whose code is versioned.
+
+    Returns:
+        str: Hexadecimal digest.
+    """
+    digest = hashlib.sha256()
+    for module in modules:
+        digest.update(module.__name__.encode())
+        if module.__file__ is not None:
+            digest.update(hash_file(Path(module.__file__)).encode())
+    return digest.hexdigest()
+
+
+def get_package_imports(module: ModuleType) -> t.List[ModuleType]:
+    """Get a module and the modules of its package it imports at module
+    level, directly or not.
+
+    Args:
+        module (ModuleType): Imported module.
+
+    Returns:
+        t.List[ModuleType]: Modules, sorted by name.
+    """
+    package: str = module.__name__.rpartition(".")[0] + "."
+    modules: t.Dict[str, ModuleType] = {}
+    pending: t.List[ModuleType] = [module]
+    while pending:
+        current: ModuleType = pending.pop()
+        if current.__name__ in modules:
+            continue
+        modules[current.__name__] = current
+        for value in vars(current).values():
+            # Imported modules, or functions and classes of imported modules
+            name: t.Any = (
+                value.__name__
+                if isinstance(value, ModuleType)
+                else getattr(value, "__module__", None)
+            )
+            if (
+                isinstance(name, str)
+                and name.startswith(package)
+                and name in sys.modules
+            ):
+                pending.append(sys.modules[name])
+    return [modules[name] for name in sorted(modules)]
+
+
+class DiskCache:
+    """Size-bounded LRU cache of pickled objects stored on disk.
+    Entries are files whose modification time is refreshed on every hit,
+    so the least recently used ones are evicted first.
+    """
+
+    directory: Path
+    max_bytes: int
+    max_entries: int | None
+
+    def __init__(
+        self, directory: Path, max_bytes: int, max_entries: int | None = None
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory (Path): Folder storing the entries.
+            max_bytes (int): Maximum total size of the entries.
+            max_entries (int | None, optional):
+                Maximum number of entries. Defaults to None (unbounded).
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+
+    def __entry_path(self, key: str) -> Path:
+        """Get the path of an entry.
+
+        Args:
+            key (str): Entry key.
+
+        Returns:
+            Path: Path of the entry file.
+        """
+        return self.directory / f"{key}.pickle"
+
+    def get(self, key: str) -> t.Tuple[bool, t.Any]:
+        """Get an entry.
+
+        Args:
+            key (str): Entry key.
+
+        Returns:
+            t.Tuple[bool, t.Any]:
+                Whether the entry was found, and its value if so.
+        """
+        entry_path: Path = self.__entry_path(key)
+        try:
+            with open(entry_path, "rb") as entry_fd:
+                value: t.Any = pickle.load(entry_fd)
+        except FileNotFoundError:
+            return False, None
+        except (pickle.UnpicklingError, EOFError, AttributeError):
+            entry_path.unlink(missing_ok=True)
+            return False, None
+        os.utime(entry_path)
+        return True, value
+
+    def set(self, key: str, value: t.Any) -> None:
+        """Store an entry, then evict the least recently used ones
+        until the cache fits in its budget.
+
+        Args:
+            key (str): Entry key.
+            value (t.Any): Picklable value to store.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry_path: Path = self.__entry_path(key)
+        # Write then rename, so concurrent readers never see partial entries
+        temporary_path: Path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temporary_path, "wb") as entry_fd:
+            pickle.dump(value, entry_fd, protocol=pickle.HIGHEST_PROTOCOL)
+        temporary_path.replace(entry_path)
+        self.evict()
+
+    def evict(self) -> None:
+        """Evict the least recently used entries exceeding the budget."""
+        entries: t.List[t.Tuple[float, int, Path]] = []
+        for entry_path in self.directory.glob("*.pickle"):
+            try:
+                stat: os.stat_result = entry_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+
+        total_bytes: int = sum(size for _, size, _ in entries)
+        total_entries: int = len(entries)
+        for _, size, entry_path in sorted(entries):
+            if total_bytes <= self.max_bytes and (
+                self.max_entries is None or total_entries <= self.max_entries
+            ):
+                break
+            entry_path.unlink(missing_ok=True)
+            total_bytes -= size
+            total_entries -= 1
+
+
+class ParsedInputCache(DiskCache):
+    """Cache of parsed inputs, keyed by input content and parser version.
+    Parts sharing the same parser share their cached parsed inputs.
+    """
+
+    max_input_bytes: int
+
+    def __init__(
+        self,
+        directory: Path | None = None,
+        max_bytes: int = 512 << 20,
+        max_input_bytes: int = 64 << 20,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            directory (Path | None, optional):
+                Folder storing the entries. Defaults to `<cache dir>/parsed`.
+            max_bytes (int, optional):
+                Maximum total size of the entries. Defaults to 512 MiB.
+            max_input_bytes (int, optional):
+                Bigger inputs are not cached, so they can still be streamed.
+                Defaults to 64 MiB.
+        """
+        super().__init__(directory or get_cache_dir() / "parsed", max_bytes)
+        self.max_input_bytes = max_input_bytes
+
+    def get_key(
+        self, parse: t.Callable[[t.Any], t.Any], file_path: Path
+    ) -> str | None:
+        """Compute the key of a parsed input.
+
+        Args:
+            parse (t.Callable[[t.Any], t.Any]): Parser of the input.
+            file_path (Path): Input file.
+
+        Returns:
+            str | None: Key of the entry, None if the input is not cacheable.
+        """
+        if file_path.stat().st_size > self.max_input_bytes:
+            return None
+        parser_module: ModuleType = sys.modules[parse.__module__]
+        parser_version: str = hash_modules(
+            parser_module, sys.modules["advent_of_code_2025.puzzle_input"]
+        )
+        return hashlib.sha256(
+            f"{parse.__module__}.{parse.__qualname__}:{parser_version}:"
+            f"{hash_file(file_path)}".encode()
+        ).hexdigest()
+
+
+class AnswerStore(DiskCache):
+    """Store of computed answers, keyed by day, part, input content
+    and version of the solution code.
+    """
+
+    def __init__(
+        self,
+        directory: Path | None = None,
+        max_bytes: int = 64 << 20,
+        max_entries: int = 10_000,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            directory (Path | None, optional):
+                Folder storing the entries. Defaults to `<cache dir>/answers`.
+            max_bytes (int, optional):
+                Maximum total size of the entries. Defaults to 64 MiB.
+            max_entries (int, optional):
+                Maximum number of entries. Defaults to 10 000.
+        """
+        super().__init__(
+            directory or get_cache_dir() / "answers", max_bytes, max_entries
+        )
+
+    @staticmethod
+    def get_key(
+        day: int,
+        part: int,
+        solution_module: ModuleType,
+        file_path: Path,
+        options: t.Dict[str, t.Any] | None = None,
+    ) -> str:
+        """Compute the key of an answer.
+        The code version covers the solution module and the modules of its
+        day package it imports, whatever else was loaded beforehand.
+
+        Args:
+            day (int): Day number.
+            part (int): Part number.
+            solution_module (ModuleType): Module of the solution.
+            file_path (Path): Input file.
+            options (t.Dict[str, t.Any] | None, optional):
+                Keyword arguments of the solution for this input.
+                Defaults to None.
+
+        Returns:
+            str: Key of the entry.
+        """
+        code_version: str = hash_modules(
+            *get_package_imports(solution_module),
+            sys.modules["advent_of_code_2025.puzzle_input"],
+        )
+        return hashlib.sha256(
+            f"{day}:{part}:{code_version}:{sorted((options or {}).items())}:"
+            f"{hash_file(file_path)}".encode()
+        ).hexdigest()
@@ -1,76 +1,323 @@
 """Interactive CLI for running Advent of Code 2025 solutions."""
 
-import importlib
+import json
 import sys
+import time
 import typing as t
 from pathlib import Path
 
 import click
 
+from advent_of_code_2025.cache import AnswerStore, ParsedInputCache
+from advent_of_code_2025.commands import (
+    batch,
+    bench,
+    gen,
+    scaling,
+    serve,
+    submit,
+)
+from advent_of_code_2025.metrics import METRICS
+from advent_of_code_2025.puzzle_input import InputSource
+from advent_of_code_2025.registry import (
+    SOLUTIONS,
+    Solution,
+    get_available_days,
+    get_available_parts,
+    get_module_path,
+    get_solution,
+)
 
-def get_available_days() -> t.List[t.Tuple[int, str]]:
-    """Get list of available day folders.
+# Parallel runner, profiling and startup report modules are imported by the
+# options using them, to keep the startup of a single solution run fast.
 
-    Returns:
-        t.List[t.Tuple[int, str]]:
-            List of tuples containing day number and folder name.
+PROFILE_DIR: Path = Path("profiles")
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def launch_solution(  # pylint: disable=too-many-locals
+    day: int,
+    part: int,
+    source: InputSource | None = None,
+    use_cache: bool = True,
+    profile: str | None = None,
+    profile_dir: Path = PROFILE_DIR,
+    metrics: bool = False,
+    metrics_json: Path | None = None,
+    workers: int | None = None,
+) -> None:
+    """Launch the selected solution.
+
+    Args:
+        day (int): Day number.
+        part (int): Part number.
+        source (InputSource | None, optional):
+            Input to solve instead of the example and real inputs.
+            Defaults to None.
+        use_cache (bool, optional):
+            Whether to use the parsed input and answer caches.
+            Ignored when profiling or collecting metrics. Defaults to True.
+        profile (str | None, optional):
+            Kind of profiling of the run (cpu or mem). Defaults to None.
+        profile_dir (Path, optional):
+            Folder to write the profiling reports to.
+            Defaults to PROFILE_DIR.
+        metrics (bool, optional):
+            Whether to print the metrics of each input. Defaults to False.
+        metrics_json (Path | None, optional):
+            JSON file to export the metrics of each input to.
+            Defaults to None.
+        workers (int | None, optional):
+            Number of worker processes of solutions supporting parallel
+            runs. Defaults to None (solved in the current process).
     """
-    base_path: Path = Path(__file__).parent
-    available_days: t.List[t.Tuple[int, str]] = []
-    for item in sorted(base_path.iterdir()):
-        if item.is_dir() and item.name.startswith("day_"):
-            available_days.append((int(item.name.split("_")[1]), item.name))
-    return available_days
+    click.echo(f"\n🚀 Running Day {day}, Part {part}...\n")
+    click.echo("=" * 50)
+
+    try:
+        solution: Solution = get_solution(day, part)
+    except ValueError as error:
+        click.echo(f"⚠️  {error}", err=True)
+        sys.exit(1)
+
+    inputs: t.Dict[str, InputSource] = (
+        dict(solution.inputs) if source is None else {"Input": source}
+    )
+    collect_metrics: bool = metrics or metrics_json is not None
+    # Cached answers would leave nothing to profile or measure
+    use_cache = use_cache and profile is None and not collect_metrics
+    cache: ParsedInputCache | None = ParsedInputCache() if use_cache else None
+    answers: AnswerStore | None = AnswerStore() if use_cache else None
+    metrics_by_input: t.Dict[str, t.Dict[str, t.Any]] = {}
+
+    def run_inputs() -> t.Dict[str, int]:
+        outputs: t.Dict[str, int] = {}
+        METRICS.enabled = collect_metrics
+        try:
+            for input_name, input_source in inputs.items():
+                METRICS.reset()
+                outputs[input_name] = solution.run(
+                    input_source, cache, answers, workers
+                )
+                metrics_by_input[input_name] = METRICS.snapshot()
+        finally:
+            METRICS.enabled = False
+        return outputs
+
+    if profile is None:
+        for input_name, answer in run_inputs().items():
+            click.echo(f"{input_name} output: {answer}")
+        click.echo("=" * 50)
+    else:
+        profile_solution(solution, run_inputs, profile, profile_dir)
+
+    if metrics:
+        print_metrics(metrics_by_input)
+    if metrics_json is not None:
+        with open(metrics_json, "w", encoding="utf-8") as metrics_fd:
+            json.dump(
+                {"day": day, "part": part, "inputs": metrics_by_input},
+                metrics_fd,
+                indent=2,
+            )
+        click.echo(f"Metrics written to {metrics_json}")
+    click.echo("\n✅ Done!")
 
 
-def get_available_parts(day_folder: str) -> t.List[t.Tuple[int, str]]:
-    """Get list of available parts for a given day.
+def print_metrics(metrics_by_input: t.Dict[str, t.Dict[str, t.Any]]) -> None:
+    """Print the counters and timers collected on each input.
 
     Args:
-        day_folder (str): Day folder name.
+        metrics_by_input (t.Dict[str, t.Dict[str, t.Any]]):
+            Metrics snapshot of each input, by input name.
+    """
+    for input_name, snapshot in metrics_by_input.items():
+        click.echo(f"\n📊 Metrics of {input_name}:")
+        if not snapshot["counters"] and not snapshot["timers"]:
+            click.echo("  (no metrics recorded by this solution)")
+        for name, value in snapshot["counters"].items():
+            click.echo(f"  {name:<32}{value:>16,}")
+        for name, stats in snapshot["timers"].items():
+            click.echo(
+                f"  {name:<32}{stats['total'] * 1000:>13.3f} ms"
+                f" ({stats['calls']:,} calls)"
+            )
+    click.echo("=" * 50)
 
-    Returns:
-        t.List[t.Tuple[int, str]]:
-            List of tuples containing part number and file name.
+
+def profile_solution(
+    solution: Solution,
+    run_inputs: t.Callable[[], t.Dict[str, int]],
+    profile: str,
+    profile_dir: Path,
+) -> None:
+    """Profile the run of a solution and print its answers and report.
+
+    Args:
+        solution (Solution): Profiled solution.
+        run_inputs (t.Callable[[], t.Dict[str, int]]):
+            Function solving every input, returning answers by input name.
+        profile (str): Kind of profiling (cpu or mem).
+        profile_dir (Path): Folder to write the profiling reports to.
     """
-    base_path: Path = Path(__file__).parent / day_folder
-    available_parts: t.List[t.Tuple[int, str]] = []
-    for item in sorted(base_path.iterdir()):
-        if (
-            item.is_file()
-            and item.name.startswith("part_")
-            and item.name.endswith(".py")
-        ):
-            available_parts.append((int(item.stem.split("_")[1]), item.stem))
-    return available_parts
-
-
-def launch_solution(day: int, part: int) -> None:
-    """Launch the selected solution.
+    # pylint: disable-next=import-outside-toplevel
+    from advent_of_code_2025.profiling import profile_run
+
+    answers, report, report_path = profile_run(
+        profile, run_inputs, profile_dir, solution.day, solution.part
+    )
+    for input_name, answer in answers.items():
+        click.echo(f"{input_name} output: {answer}")
+    click.echo("=" * 50)
+
+    click.echo(
+        f"\n🔬 {profile.upper()} profile of Day {solution.day}, "
+        f"Part {solution.part}:\n"
+    )
+    for row in report:
+        click.echo(row)
+    click.echo("=" * 50)
+    click.echo(f"Report written to {report_path}")
+
+
+def launch_all_solutions(
+    days: t.List[int],
+    workers: int | None,
+    timeout: float | None,
+    use_cache: bool,
+) -> None:
+    """Launch every part of the selected days in parallel.
 
     Args:
-        day (int): Day number.
-        part (int): Part number.
+        days (t.List[int]): Day numbers to run.
+        workers (int | None): Number of worker processes.
+        timeout (float | None): Maximum duration of each solution in seconds.
+        use_cache (bool): Whether to use the parsed input and answer caches.
     """
-    day_folder: str = f"day_{day:02d}"
-    part_file: str = f"part_{part:02d}"
-    module_path: str = f"advent_of_code_2025.{day_folder}.{part_file}"
+    # pylint: disable-next=import-outside-toplevel
+    from advent_of_code_2025.runner import RunResult, run_all
+
+    tasks: t.List[t.Tuple[int, int]] = [
+        (day_num, part_num)
+        for day_num, day_folder in get_available_days()
+        if day_num in days
+        for part_num, _ in get_available_parts(day_folder)
+    ]
+    results: t.List[RunResult] = []
+
+    click.echo(f"\n🚀 Running {len(tasks)} solutions in parallel...\n")
+    start: float = time.perf_counter()
+    for result in run_all(
+        tasks, workers=workers, timeout=timeout, use_cache=use_cache
+    ):
+        results.append(result)
+        click.echo("=" * 50)
+        click.echo(f"Day {result.day}, Part {result.part}:")
+        for input_name, answer in result.answers.items():
+            click.echo(f"{input_name} output: {answer}")
+        if result.error is not None:
+            click.echo(f"⚠️  {result.error}", err=True)
+    wall_time: float = time.perf_counter() - start
 
-    click.echo(f"\n🚀 Running Day {day}, Part {part}...\n")
     click.echo("=" * 50)
+    click.echo(f"\n{'day':>3} {'part':>4}  {'status':<8}{'time (s)':>10}")
+    for result in results:
+        click.echo(
+            f"{result.day:>3} {result.part:>4}  {result.status:<8}"
+            f"{result.duration:>10.3f}"
+        )
+    click.echo(
+        f"\n⏱️  Wall time: {wall_time:.3f}s "
+        f"(sum of solutions: {sum(r.duration for r in results):.3f}s)"
+    )
 
-    module = importlib.import_module(module_path)
-    if hasattr(module, "main"):
-        module.main()
-    else:
-        click.echo(f"⚠️  No main() function found in {part_file}.py", err=True)
+    if any(result.status != "ok" for result in results):
+        click.echo("\n❌ Some solutions failed!", err=True)
         sys.exit(1)
+    click.echo("\n✅ Done!")
+
+
+def print_startup_report(day: int | None, part: int | None) -> None:
+    """Print the startup time breakdown of the CLI and of a solution.
+
+    Args:
+        day (int | None): Day number of the solution to import, if any.
+        part (int | None): Part number of the solution to import, if any.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from advent_of_code_2025.startup import (
+        format_report,
+        measure_import_times,
+        measure_startup,
+    )
 
+    modules: t.List[str] = ["advent_of_code_2025.cli"]
+    if day is not None:
+        for part_num in SOLUTIONS.get(day, ()):
+            if part is None or part == part_num:
+                modules.append(get_module_path(day, part_num))
+
+    click.echo(f"\n⏱️  Startup report ({', '.join(modules)})\n")
+    for row in format_report(measure_import_times(modules), top=25):
+        click.echo(row)
+
+    interpreter_startup: float = measure_startup([])
+    aoc_startup: float = measure_startup(modules)
     click.echo("=" * 50)
-    click.echo("\n✅ Done!")
+    click.echo(f"Bare interpreter startup: {interpreter_startup * 1000:.1f} ms")
+    click.echo(
+        f"Startup with imports:     {aoc_startup * 1000:.1f} ms "
+        f"(+{(aoc_startup - interpreter_startup) * 1000:.1f} ms)"
+    )
+
+
+def get_input_source(input_path: Path | None) -> InputSource | None:
+    """Get the input source selected by the --input option.
+
+    Args:
+        input_path (Path | None): Value of the --input option.
+
+    Returns:
+        InputSource | None: Input source, None to use the default inputs.
+    """
+    if input_path is None:
+        return None
+    if input_path == Path("-"):
+        return sys.stdin.buffer
+    # Relative paths are resolved from the day folder by the parsers
+    return input_path.absolute()
+
+
+def parse_days_option(
+    ctx: click.Context,  # pylint: disable=unused-argument
+    param: click.Parameter,  # pylint: disable=unused-argument
+    value: str | None,
+) -> t.List[int] | None:
+    """Click callback parsing the --days option.
 
+    Args:
+        ctx (click.Context): Click context.
+        param (click.Parameter): Click parameter.
+        value (str | None): Raw option value.
+
+    Raises:
+        click.BadParameter: If the days specification is malformed.
+
+    Returns:
+        t.List[int] | None: Parsed day numbers.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from advent_of_code_2025.runner import parse_days
+
+    if value is None:
+        return None
+    try:
+        return parse_days(value)
+    except ValueError as error:
+        raise click.BadParameter(str(error)) from error
 
-@click.command()
+
+@click.group(invoke_without_command=True)
 @click.option(
     "--day",
     type=int,
@@ -81,11 +328,119 @@ def launch_solution(day: int, part: int) -> None:
     type=int,
     help="Part number to run (1 or 2)",
 )
-def main(day: int | None = None, part: int | None = None) -> None:
+@click.option(
+    "--all",
+    "run_all_days",
+    is_flag=True,
+    help="Run every day and part in parallel",
+)
+@click.option(
+    "--days",
+    callback=parse_days_option,
+    help="Days to run in parallel (e.g., 3,7-12)",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    help="Number of worker processes of --all/--days (default: number of "
+    "CPUs), or of a single solution supporting parallel runs",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Maximum duration of each solution in seconds",
+)
+@click.option(
+    "--input",
+    "input_path",
+    type=click.Path(
+        exists=True, dir_okay=False, allow_dash=True, path_type=Path
+    ),
+    help="Input file to solve, or - to read it from stdin",
+)
+@click.option(
+    "--startup-report",
+    is_flag=True,
+    help="Print an import time breakdown of the CLI and of the solution",
+)
+@click.option(
+    "--profile",
+    type=click.Choice(["cpu", "mem"]),
+    help="Profile the solution with cProfile (cpu) or tracemalloc (mem)",
+)
+@click.option(
+    "--profile-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=PROFILE_DIR,
+    show_default=True,
+    help="Folder to write the per day/part profiling reports to",
+)
+@click.option(
+    "--metrics",
+    is_flag=True,
+    help="Print the counters and timers recorded by the solution",
+)
+@click.option(
+    "--metrics-json",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="JSON file to export the counters and timers to",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Do not use the parsed input and answer caches",
+)
+@click.pass_context
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def main(  # pylint: disable=too-many-locals
+    ctx: click.Context,
+    day: int | None = None,
+    part: int | None = None,
+    input_path: Path | None = None,
+    run_all_days: bool = False,
+    days: t.List[int] | None = None,
+    workers: int | None = None,
+    timeout: float | None = None,
+    no_cache: bool = False,
+    startup_report: bool = False,
+    profile: str | None = None,
+    profile_dir: Path = PROFILE_DIR,
+    metrics: bool = False,
+    metrics_json: Path | None = None,
+) -> None:
     """Interactive CLI for running Advent of Code 2025 solutions.
 
     Run without arguments for interactive mode, or specify --day and --part.
+    Use --all or --days to run several solutions in parallel.
     """
+    # Subcommands handle their own arguments
+    if ctx.invoked_subcommand is not None:
+        return
+
+    if startup_report:
+        print_startup_report(day, part)
+        return
+
+    # Parallel mode over all or selected days
+    if run_all_days or days is not None:
+        if input_path is not None:
+            raise click.UsageError("--input cannot be used with --all/--days")
+        if profile is not None or metrics or metrics_json is not None:
+            raise click.UsageError(
+                "--profile and --metrics cannot be used with --all/--days"
+            )
+        launch_all_solutions(
+            days if days is not None else [d for d, _ in get_available_days()],
+            workers=workers,
+            timeout=timeout,
+            use_cache=not no_cache,
+        )
+        return
+
+    # Reading the input from stdin leaves no room for prompts
+    if input_path == Path("-") and (day is None or part is None):
+        raise click.UsageError("--input - requires --day and --part")
+
     # Interactive day selection if not provided
     if day is None:
         available_days: t.List[t.Tuple[int, str]] = get_available_days()
@@ -97,9 +452,9 @@ def main(day: int | None = None, part: int | None = None) -> None:
             type=click.IntRange(min=1, max=25),
         )
 
-    # Validate day folder existence
+    # Validate day existence
     day_folder = f"day_{day:02d}"
-    if not (Path(__file__).parent / day_folder).exists():
+    if day not in SOLUTIONS:
         click.echo(f"❌ Day {day} ({day_folder}) not found!", err=True)
         sys.exit(1)
 
@@ -117,17 +472,30 @@ def main(day: int | None = None, part: int | None = None) -> None:
             type=click.IntRange(min=1, max=2),
         )
 
-    # Validate part file existence
+    # Validate part existence
     part_file = f"part_{part:02d}"
-    if not (Path(__file__).parent / day_folder / f"{part_file}.py").exists():
+    if part not in SOLUTIONS[day]:
         click.echo(
             f"❌ Part {part} ({part_file}.py) not found in {day_folder}!",
             err=True,
         )
         sys.exit(1)
 
-    launch_solution(day, part)
+    launch_solution(
+        day,
+        part,
+        get_input_source(input_path),
+        use_cache=not no_cache,
+        profile=profile,
+        profile_dir=profile_dir,
+        metrics=metrics,
+        metrics_json=metrics_json,
+        workers=workers,
+    )
+
 
+for command in (bench, scaling, gen, serve, submit, batch):
+    main.add_command(command)
 
 if __name__ == "__main__":
     main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,586 @@
+"""Subcommands of the CLI: benchmarks, input generation, batch runs
+and solver daemon.
+
+Their modules are imported by the commands using them, to keep the startup
+of a single solution run fast.
+"""
+
+import json
+import platform
+import sys
+import time
+import typing as t
+from pathlib import Path
+
+import click
+
+from advent_of_code_2025.registry import (
+    SOLUTIONS,
+    get_available_days,
+    get_available_parts,
+)
+
+
+def load_baseline(
+    baseline_path: Path,
+) -> t.Tuple[t.Dict[str, t.Any], t.Dict[t.Tuple[int, int], t.Any]]:
+    """Load a benchmark baseline and check it can be compared with.
+
+    Args:
+        baseline_path (Path): JSON report written by `aoc bench`.
+
+    Raises:
+        click.UsageError: If the baseline was measured on another input.
+
+    Returns:
+        t.Tuple[t.Dict[str, t.Any], t.Dict[t.Tuple[int, int], t.Any]]:
+            Baseline report and its results by day/part.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from advent_of_code_2025.bench import BENCHMARK_INPUT, load_report
+
+    report, results = load_report(baseline_path)
+    if report.get("input") != BENCHMARK_INPUT:
+        raise click.UsageError(
+            f"{baseline_path} was not measured on {BENCHMARK_INPUT}"
+        )
+    if report.get("python") != platform.python_version():
+        click.echo(
+            f"⚠️  {baseline_path} was measured with Python "
+            f"{report.get('python')}",
+            err=True,
+        )
+    return report, results
+
+
+def report_comparisons(comparisons: t.List[t.Any], baseline_path: Path) -> bool:
+    """Print the comparisons of benchmark results with their baseline.
+
+    Args:
+        comparisons (t.List[t.Any]): Comparison of each day/part.
+        baseline_path (Path): JSON report of the baseline.
+
+    Returns:
+        bool: True if no day/part regressed.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from advent_of_code_2025.bench import format_comparison
+
+    click.echo(f"\n⚖️  Comparison with {baseline_path}:\n")
+    click.echo(
+        f"{'day':>3} {'part':>4}{'base (ms)':>12}{'now (ms)':>12}"
+        f"{'time':>10}{'p-value':>9}{'memory':>10}"
+    )
+    click.echo("=" * 50)
+    for comparison in comparisons:
+        click.echo(format_comparison(comparison))
+    click.echo("=" * 50)
+    if any(comparison.regressed for comparison in comparisons):
+        click.echo("\n❌ Some solutions regressed!", err=True)
+        return False
+    click.echo("\n✅ No regression")
+    return True
+
+
+@click.command()
+@click.option(
+    "--day",
+    "days",
+    type=int,
+    multiple=True,
+    help="Day number to benchmark, can be repeated (default: all days)",
+)
+@click.option(
+    "--part",
+    "parts",
+    type=int,
+    multiple=True,
+    help="Part number to benchmark, can be repeated (default: all parts)",
+)
+@click.option(
+    "--warmup",
+    type=click.IntRange(min=0),
+    help="Number of untimed runs before measuring (default: 1, or the one "
+    "of the compared baseline)",
+)
+@click.option(
+    "--repetitions",
+    type=click.IntRange(min=1),
+    help="Number of timed runs (default: 10, or the one of the compared "
+    "baseline)",
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=Path("bench.json"),
+    show_default=True,
+    help="JSON file to write the results to",
+)
+@click.option(
+    "--compare",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Baseline results to compare with, failing on regressions",
+)
+@click.option(
+    "--threshold",
+    type=click.FloatRange(min=0),
+    default=0.1,
+    show_default=True,
+    help="Allowed relative increase of the minimum time and peak memory",
+)
+@click.option(
+    "--min-delta-ms",
+    type=click.FloatRange(min=0),
+    default=1.0,
+    show_default=True,
+    help="Allowed absolute increase of the minimum time (milliseconds)",
+)
+@click.option(
+    "--alpha",
+    type=click.FloatRange(min=0, max=1, min_open=True),
+    default=0.05,
+    show_default=True,
+    help="Significance level of the Mann-Whitney U test on timings",
+)
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def bench(  # pylint: disable=too-many-locals
+    days: t.Tuple[int, ...],
+    parts: t.Tuple[int, ...],
+    warmup: int | None,
+    repetitions: int | None,
+    output: Path,
+    compare: Path | None,
+    threshold: float,
+    min_delta_ms: float,
+    alpha: float,
+) -> None:
+    """Benchmark every available day/part solution."""
+    # pylint: disable-next=import-outside-toplevel
+    from advent_of_code_2025.bench import (
+        BenchmarkResult,
+        ResultsByPart,
+        compare_result,
+        format_result,
+        run_benchmark,
+        write_results,
+    )
+
+    # Compared runs use the same conditions as their baseline
+    baseline_report: t.Dict[str, t.Any] = {}
+    baseline_results: ResultsByPart = {}
+    if compare is not None:
+        baseline_report, baseline_results = load_baseline(compare)
+    if warmup is None:
+        warmup = int(baseline_report.get("warmup", 1))
+    if repetitions is None:
+        repetitions = int(baseline_report.get("repetitions", 10))
+
+    results: t.List[BenchmarkResult] = []
+
+    click.echo(
+        f"\n⏱️  Benchmarking ({warmup} warmup, {repetitions} repetitions)...\n"
+    )
+    click.echo(
+        f"{'day':>3} {'part':>4}  {'phase':<6}"
+        f"{'min (ms)':>12}{'median (ms)':>12}{'p95 (ms)':>12}"
+    )
+    click.echo("=" * 50)
+
+    for day_num, day_folder in get_available_days():
+        if days and day_num not in days:
+            continue
+        for part_num, _ in get_available_parts(day_folder):
+            if parts and part_num not in parts:
+                continue
+            result: BenchmarkResult = run_benchmark(
+                day_num, part_num, warmup=warmup, repetitions=repetitions
+            )
+            results.append(result)
+            for row in format_result(result):
+                click.echo(row)
+
+    click.echo("=" * 50)
+    write_results(results, output, warmup=warmup, repetitions=repetitions)
+    click.echo(f"\n✅ Results written to {output}")
+
+    if compare is None:
+        return
+    if not report_comparisons(
+        [
+            compare_result(
+                result,
+                baseline_results[(result.day, result.part)],
+                threshold,
+                alpha,
+                min_delta_ms / 1000,
+            )
+            for result in results
+            if (result.day, result.part) in baseline_results
+        ],
+        compare,
+    ):
+        sys.exit(1)
+
+
+@click.command()
+@click.option(
+    "--day",
+    "days",
+    type=int,
+    multiple=True,
+    help="Day number to measure, can be repeated (default: all days)",
+)
+@click.option(
+    "--part",
+    "parts",
+    type=int,
+    multiple=True,
+    help="Part number to measure, can be repeated (default: all parts)",
+)
+@click.option(
+    "--min-scale",
+    type=click.IntRange(min=1),
+    default=100,
+    show_default=True,
+    help="Scale of the smallest generated input",
+)
+@click.option(
+    "--factor",
+    type=click.FloatRange(min=1, min_open=True),
+    default=2.0,
+    show_default=True,
+    help="Ratio between two consecutive scales",
+)
+@click.option(
+    "--steps",
+    type=click.IntRange(min=2),
+    default=6,
+    show_default=True,
+    help="Number of scales",
+)
+@click.option(
+    "--seed",
+    type=int,
+    default=0,
+    show_default=True,
+    help="Seed of the input generators",
+)
+@click.option(
+    "--repetitions",
+    type=click.IntRange(min=1),
+    default=3,
+    show_default=True,
+    help="Number of timed runs of each scale",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=10.0,
+    show_default=True,
+    help="Stop growing a solution once a scale takes longer (seconds)",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Previous scaling results to detect exponent regressions",
+)
+@click.option(
+    "--tolerance",
+    type=click.FloatRange(min=0),
+    default=0.25,
+    show_default=True,
+    help="Allowed exponent increase over the baseline",
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=Path("scaling.json"),
+    show_default=True,
+    help="JSON file to write the results to",
+)
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def scaling(  # pylint: disable=too-many-locals
+    days: t.Tuple[int, ...],
+    parts: t.Tuple[int, ...],
+    min_scale: int,
+    factor: float,
+    steps: int,
+    seed: int,
+    repetitions: int,
+    timeout: float,
+    baseline: Path | None,
+    tolerance: float,
+    output: Path,
+) -> None:
+    """Fit the empirical time and memory complexity of the solutions
+    over geometrically growing generated inputs.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from advent_of_code_2025.bench import (
+        ResultsByPart,
+        ScalingResult,
+        find_exponent_regressions,
+        format_scaling_result,
+        geometric_scales,
+        load_report,
+        run_scaling,
+        write_scaling_results,
+    )
+
+    scales: t.List[int] = geometric_scales(min_scale, factor, steps)
+    baseline_results: ResultsByPart = {}
+    if baseline is not None:
+        _, baseline_results = load_report(baseline)
+    results: t.List[ScalingResult] = []
+    regressions: t.List[str] = []
+
+    click.echo(f"\n📈 Measuring scaling over scales {scales}...\n")
+    click.echo(
+        f"{'day':>3} {'part':>4} {'scale':>10}"
+        f"{'time (ms)':>14}{'peak (KiB)':>14}"
+    )
+    click.echo("=" * 50)
+
+    for day_num, day_folder in get_available_days():
+        if days and day_num not in days:
+            continue
+        for part_num, _ in get_available_parts(day_folder):
+            if parts and part_num not in parts:
+                continue
+            result: ScalingResult = run_scaling(
+                day_num, part_num, scales, seed, repetitions, timeout
+            )
+            results.append(result)
+            regressions += find_exponent_regressions(
+                result, baseline_results, tolerance
+            )
+            for row in format_scaling_result(result):
+                click.echo(row)
+
+    click.echo("=" * 50)
+    write_scaling_results(results, output, seed=seed)
+    click.echo(f"\n✅ Results written to {output}")
+
+    if regressions:
+        click.echo("\n❌ Exponent regressions:", err=True)
+        for regression in regressions:
+            click.echo(f"  {regression}", err=True)
+        sys.exit(1)
+
+
+@click.command()
+@click.option(
+    "--day",
+    type=int,
+    required=True,
+    help="Day number whose input format is generated",
+)
+@click.option(
+    "--scale",
+    type=click.IntRange(min=1),
+    default=1000,
+    show_default=True,
+    help="Number of records (lines, ranges, machines...) to generate",
+)
+@click.option(
+    "--seed",
+    type=int,
+    default=0,
+    show_default=True,
+    help="Seed of the random generator",
+)
+@click.option(
+    "--output",
+    type=click.File("w", encoding="utf-8", lazy=True),
+    default="-",
+    show_default=True,
+    help="File to write the input to, or - for stdout",
+)
+def gen(day: int, scale: int, seed: int, output: t.IO[str]) -> None:
+    """Generate a seeded synthetic input in the format of a day."""
+    # pylint: disable-next=import-outside-toplevel
+    from advent_of_code_2025.generation import write_input
+
+    if day not in SOLUTIONS:
+        raise click.BadParameter(f"Day {day} not found!", param_hint="--day")
+    try:
+        write_input(day, scale, seed, output)
+    except ValueError as error:
+        raise click.ClickException(str(error)) from error
+
+
+@click.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Unix socket to listen on (default: in the temporary folder)",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    help="Number of worker processes (default: number of CPUs)",
+)
+def serve(socket_path: Path | None, workers: int | None) -> None:
+    """Run a solver daemon answering `aoc submit` requests."""
+    # pylint: disable-next=import-outside-toplevel
+    from advent_of_code_2025 import server
+
+    socket_path = socket_path or server.DEFAULT_SOCKET_PATH
+    try:
+        server.remove_stale_socket(socket_path)
+        click.echo(f"🛰️  Serving on {socket_path} (Ctrl+C to stop)")
+        server.serve(socket_path, workers=workers)
+    except FileExistsError as error:
+        raise click.ClickException(str(error)) from error
+    except KeyboardInterrupt:
+        click.echo("\n✅ Stopped")
+
+
+@click.command()
+@click.option("--day", type=int, required=True, help="Day number to run")
+@click.option("--part", type=int, required=True, help="Part number to run")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Unix socket of the daemon (default: in the temporary folder)",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Maximum duration of each solution in seconds",
+)
+@click.argument(
+    "input_paths",
+    nargs=-1,
+    type=click.Path(
+        exists=True, dir_okay=False, allow_dash=True, path_type=Path
+    ),
+)
+def submit(
+    day: int,
+    part: int,
+    socket_path: Path | None,
+    timeout: float | None,
+    input_paths: t.Tuple[Path, ...],
+) -> None:
+    """Solve input files (default: stdin) with a running `aoc serve` daemon."""
+    # pylint: disable-next=import-outside-toplevel
+    from advent_of_code_2025 import server
+
+    requests: t.List[t.Dict[str, t.Any]] = []
+    for input_path in input_paths or (Path("-"),):
+        request: t.Dict[str, t.Any] = {
+            "id": str(input_path),
+            "day": day,
+            "part": part,
+            "timeout": timeout,
+        }
+        if input_path == Path("-"):
+            request["input"] = sys.stdin.read()
+        else:
+            request["path"] = str(input_path.absolute())
+        requests.append(request)
+
+    failed: bool = False
+    try:
+        for response in server.submit(
+            socket_path or server.DEFAULT_SOCKET_PATH, requests
+        ):
+            if response["status"] != "ok":
+                failed = True
+                click.echo(
+                    f"⚠️  {response['id']}: {response['status']} "
+                    f"{response['error'] or ''}",
+                    err=True,
+                )
+                continue
+            click.echo(
+                f"{response['id']} output: {response['answer']} "
+                f"(parse {response['parse_time'] * 1000:.3f} ms, "
+                f"solve {response['solve_time'] * 1000:.3f} ms)"
+            )
+    except OSError as error:
+        raise click.ClickException(
+            f"Cannot reach the daemon, is `aoc serve` running? ({error})"
+        ) from error
+    if failed:
+        sys.exit(1)
+
+
+@click.command()
+@click.option("--day", type=int, required=True, help="Day number to run")
+@click.option("--part", type=int, required=True, help="Part number to run")
+@click.option(
+    "--pattern",
+    default="*",
+    show_default=True,
+    help="Glob pattern of the input files in the folder",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    help="Number of worker processes (default: number of CPUs)",
+)
+@click.option(
+    "--max-pending",
+    type=click.IntRange(min=1),
+    help="Maximum number of queued inputs (default: twice the workers)",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Maximum duration of each input in seconds",
+)
+@click.option(
+    "--output",
+    type=click.File("w", encoding="utf-8", lazy=True),
+    default="-",
+    show_default=True,
+    help="JSON Lines file to write the results to, or - for stdout",
+)
+@click.argument(
+    "input_dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+)
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments
+def batch(
+    day: int,
+    part: int,
+    pattern: str,
+    workers: int | None,
+    max_pending: int | None,
+    timeout: float | None,
+    output: t.IO[str],
+    input_dir: Path,
+) -> None:
+    """Solve every input file of a folder, writing JSON Lines results."""
+    # pylint: disable-next=import-outside-toplevel
+    from advent_of_code_2025.batch import list_inputs, run_batch
+
+    if day not in SOLUTIONS or part not in SOLUTIONS[day]:
+        raise click.BadParameter(f"Day {day}, Part {part} not found!")
+
+    statuses: t.Dict[str, int] = {}
+    start: float = time.perf_counter()
+    for result in run_batch(
+        day,
+        part,
+        list_inputs(input_dir, pattern),
+        workers=workers,
+        max_pending=max_pending,
+        timeout=timeout,
+    ):
+        output.write(json.dumps(result) + "\n")
+        output.flush()
+        statuses[result["status"]] = statuses.get(result["status"], 0) + 1
+
+    click.echo(
+        f"⏱️  {sum(statuses.values())} inputs in "
+        f"{time.perf_counter() - start:.3f}s "
+        f"({', '.join(f'{count} {s}' for s, count in statuses.items())})",
+        err=True,
+    )
+    if any(status != "ok" for status in statuses):
+        sys.exit(1)
@@ -3,12 +3,41 @@
 import typing as t
 from pathlib import Path
 
+from advent_of_code_2025.puzzle_input import InputSource, iter_lines, map_input
 
-def parse_rotations_file(file_name: str) -> t.List[t.Tuple[int, int]]:
+# numpy is slow to import, it is only loaded when rotation arrays are used
+if t.TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+# Rotation directions (-1 for left, 1 for right) and numbers of ticks
+RotationArrays = t.Tuple["npt.NDArray[np.int64]", "npt.NDArray[np.int64]"]
+
+# Bytes parsed at once into arrays, bounding the temporary arrays size
+PARSE_BLOCK_SIZE: int = 1 << 24
+
+
+def iter_rotations(source: InputSource) -> t.Iterator[t.Tuple[int, int]]:
+    """Lazily parse rotations from an input source.
+
+    Args:
+        source (InputSource): File name or stream to parse.
+
+    Yields:
+        t.Tuple[int, int]:
+            Tuple where the first element is the rotation
+            (-1 for left, 1 for right) and the second element
+            is the number of ticks to turn.
+    """
+    for line in iter_lines(source, Path(__file__).parent):
+        yield (-1 if line[0] == "L" else 1, int(line[1:]))
+
+
+def parse_rotations_file(source: InputSource) -> t.List[t.Tuple[int, int]]:
     """Parse TXT input file and generate list of rotations.
 
     Args:
-        file_name (str): Name of the file to parse.
+        source (InputSource): File name or stream to parse.
 
     Returns:
         t.List[t.Tuple[int, int]]:
@@ -16,25 +45,100 @@ def parse_rotations_file(file_name: str) -> t.List[t.Tuple[int, int]]:
             (-1 for left, 1 for right) and the second element
             is the number of ticks to turn.
     """
-    rotations: t.List[t.Tuple[int, int]] = []
-    file_path: Path = Path(__file__).parent / file_name
-    with open(file_path, "r", encoding="utf-8") as input_fd:
-        rotations = [
-            (-1 if line[0] == "L" else 1, int(line[1:]))
-            for line in input_fd.read().splitlines()
-        ]
-    return rotations
+    return list(iter_rotations(source))
+
+
+def count_zero_hits(pointed_number: int, direction: int, ticks: int) -> int:
+    """Count how many times the dial points at 0 during a rotation,
+    in constant time whatever the number of ticks.
+
+    Args:
+        pointed_number (int): Pointed number before the rotation.
+        direction (int): Rotation direction (-1 for left, 1 for right).
+        ticks (int): Number of ticks to turn.
+
+    Returns:
+        int: Number of ticks ending on 0.
+    """
+    # Ticks needed to reach 0 for the first time, then every 100 ticks
+    first_hit: int = (-direction * pointed_number) % 100 or 100
+    if ticks < first_hit:
+        return 0
+    return (ticks - first_hit) // 100 + 1
+
+
+class DialState(t.NamedTuple):
+    """Snapshot of a dial."""
+
+    pointed_number: int
+    # Rotations leaving the dial pointing at 0
+    pointed_zeros: int
+    # Ticks ending on 0, during or at the end of the rotations
+    zero_hits: int
+
+
+class Dial:
+    """Dial fed with batches of rotations as they come, keeping both
+    passwords up to date in constant memory.
+    """
+
+    state: DialState
+
+    def __init__(self, pointed_number: int = 50) -> None:
+        """Initialize the dial.
+
+        Args:
+            pointed_number (int, optional): Initial pointed number.
+                Defaults to 50.
+        """
+        self.state = DialState(
+            pointed_number=pointed_number % 100, pointed_zeros=0, zero_hits=0
+        )
+
+    def feed(self, rotations: t.Iterable[t.Tuple[int, int]]) -> DialState:
+        """Apply a batch of rotations.
+
+        Args:
+            rotations (t.Iterable[t.Tuple[int, int]]): Rotations to apply.
+
+        Returns:
+            DialState: State of the dial after the batch.
+        """
+        pointed_number, pointed_zeros, zero_hits = self.state
+        for direction, ticks in rotations:
+            zero_hits += count_zero_hits(pointed_number, direction, ticks)
+            pointed_number = (pointed_number + direction * ticks) % 100
+            if pointed_number == 0:
+                pointed_zeros += 1
+        self.state = DialState(pointed_number, pointed_zeros, zero_hits)
+        return self.state
+
+    def snapshot(self) -> DialState:
+        """Get the current state of the dial.
+
+        Returns:
+            DialState: Immutable state, to restore later.
+        """
+        return self.state
+
+    def restore(self, state: DialState) -> None:
+        """Restore a state of the dial.
+
+        Args:
+            state (DialState): State returned by `snapshot` or `feed`.
+        """
+        self.state = DialState(*state)
 
 
 def compute_password(
-    rotations: t.List[t.Tuple[int, int]],
+    rotations: t.Iterable[t.Tuple[int, int]],
     only_count_pointed: bool,
     pointed_number: int = 50,
 ) -> int:
     """Compute the password based on the rotations.
 
     Args:
-        rotations (t.List[t.Tuple[int, int]]): List of rotations.
+        rotations (t.Iterable[t.Tuple[int, int]]): Rotations to apply.
         only_count_pointed (bool): Whether to only count pointed numbers.
         pointed_number (int): Initial pointed number.
 
@@ -42,15 +146,112 @@ def compute_password(
     Returns:
         int: The computed password.
     """
-    password: int = 0
-    for rotation in rotations:
-        if not only_count_pointed:
-            password += sum(
-                1
-                for i in range(1, rotation[1] + 1)
-                if (pointed_number + rotation[0] * i) % 100 == 0
-            )
-        pointed_number = (pointed_number + rotation[0] * rotation[1]) % 100
-        if only_count_pointed and pointed_number == 0:
-            password += 1
-    return password
+    state: DialState = Dial(pointed_number).feed(rotations)
+    return state.pointed_zeros if only_count_pointed else state.zero_hits
+
+
+def parse_rotations_block(block: "npt.NDArray[np.uint8]") -> RotationArrays:
+    """Parse whole lines of rotations from bytes into arrays.
+
+    Args:
+        block (npt.NDArray[np.uint8]): Bytes of whole lines of the input.
+
+    Returns:
+        RotationArrays: Directions and numbers of ticks of the rotations.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    digit_positions: npt.NDArray[np.intp] = np.flatnonzero(
+        (block >= ord("0")) & (block <= ord("9"))
+    )
+    line_ends: npt.NDArray[np.intp] = np.flatnonzero(block == ord("\n"))
+    # Line of each digit, digits of a line being contiguous
+    digit_lines: npt.NDArray[np.intp] = np.searchsorted(
+        line_ends, digit_positions
+    )
+    digit_counts: npt.NDArray[np.intp] = np.bincount(digit_lines)
+    # Empty lines have no digit
+    digit_counts = digit_counts[digit_counts > 0]
+    last_digits: npt.NDArray[np.intp] = np.cumsum(digit_counts) - 1
+    first_digits: npt.NDArray[np.intp] = last_digits - digit_counts + 1
+
+    # Each digit weighted by its power of 10, summed line by line
+    exponents: npt.NDArray[np.intp] = np.repeat(
+        last_digits, digit_counts
+    ) - np.arange(len(digit_positions))
+    weighted_sums: npt.NDArray[np.int64] = np.cumsum(
+        (block[digit_positions] - ord("0")).astype(np.int64)
+        * np.int64(10) ** exponents
+    )
+    ticks: npt.NDArray[np.int64] = weighted_sums[last_digits] - np.where(
+        first_digits > 0, weighted_sums[first_digits - 1], 0
+    )
+    # The direction letter directly precedes the first digit of its line
+    directions: npt.NDArray[np.int64] = np.where(
+        block[digit_positions[first_digits] - 1] == ord("L"), -1, 1
+    ).astype(np.int64)
+    return directions, ticks
+
+
+def parse_rotations_arrays(source: InputSource) -> RotationArrays:
+    """Parse rotations from the bytes of an input source into arrays,
+    block by block, without building any Python object per rotation.
+
+    Args:
+        source (InputSource): File name or stream to parse.
+
+    Returns:
+        RotationArrays: Directions and numbers of ticks of the rotations.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    blocks: t.List[RotationArrays] = []
+    with map_input(source, Path(__file__).parent) as mapped:
+        for start, end in mapped.iter_blocks(PARSE_BLOCK_SIZE):
+            blocks.append(parse_rotations_block(mapped.as_array()[start:end]))
+    if not blocks:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    return (
+        np.concatenate([directions for directions, _ in blocks]),
+        np.concatenate([ticks for _, ticks in blocks]),
+    )
+
+
+def compute_password_arrays(
+    directions: "npt.NDArray[np.int64]",
+    ticks: "npt.NDArray[np.int64]",
+    only_count_pointed: bool,
+    pointed_number: int = 50,
+) -> int:
+    """Compute the password based on the rotations, vectorized.
+    Same answers as `compute_password`.
+
+    Args:
+        directions (npt.NDArray[np.int64]): Direction of each rotation.
+        ticks (npt.NDArray[np.int64]): Number of ticks of each rotation.
+        only_count_pointed (bool): Whether to only count pointed numbers.
+        pointed_number (int): Initial pointed number.
+
+    Returns:
+        int: The computed password.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    # Reduced modulo 100 first, so the cumulated sum cannot overflow
+    pointed_numbers: npt.NDArray[np.int64] = (
+        pointed_number + np.cumsum(directions * ticks % 100)
+    ) % 100
+    if only_count_pointed:
+        return int(np.count_nonzero(pointed_numbers == 0))
+
+    previous_numbers: npt.NDArray[np.int64] = np.concatenate(
+        ([pointed_number % 100], pointed_numbers[:-1])
+    )
+    # Same arithmetic as `count_zero_hits`, for every rotation at once
+    first_hits: npt.NDArray[np.int64] = -directions * previous_numbers % 100
+    first_hits[first_hits == 0] = 100
+    return int(
+        np.sum(
+            np.where(ticks >= first_hits, (ticks - first_hits) // 100 + 1, 0)
+        )
+    )
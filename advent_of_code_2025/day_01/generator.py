@@ -0,0 +1,18 @@
+"""Synthetic input generator for the Day 01"""
+
+import random
+import typing as t
+
+
+def generate(scale: int, rng: random.Random) -> t.Iterator[str]:
+    """Generate dial rotations, one per line.
+
+    Args:
+        scale (int): Number of rotations.
+        rng (random.Random): Seeded random generator.
+
+    Yields:
+        str: Lines of the input.
+    """
+    for _ in range(scale):
+        yield f"{rng.choice('LR')}{rng.randint(1, 999)}\n"
@@ -0,0 +1,215 @@
+"""Chunk-parallel dial scan of the Day 01
+
+The rotations of a chunk always shift the dial by the same amount, whatever
+its starting position, so a chunk is summarized by this shift and by its
+number of zeros for each of the 100 starting positions. Summaries are
+computed by worker processes over byte ranges of the input file, then
+composed in input order.
+"""
+
+import itertools
+import os
+import typing as t
+from pathlib import Path
+
+from advent_of_code_2025.day_01.common import (
+    PARSE_BLOCK_SIZE,
+    compute_password,
+    iter_rotations,
+    parse_rotations_block,
+)
+from advent_of_code_2025.puzzle_input import InputSource, map_input
+
+# numpy is slow to import, it is only loaded when rotations are summarized
+if t.TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+DIAL_SIZE: int = 100
+
+# Chunks per worker, so that workers finishing early pick up more work
+CHUNKS_PER_WORKER: int = 4
+
+
+class ChunkSummary(t.NamedTuple):
+    """Transfer table of a chunk of rotations: starting from position `s`,
+    the dial ends on `(s + shift) % 100` after `zeros[s]` zeros.
+    """
+
+    shift: int
+    zeros: t.Tuple[int, ...]
+
+    @classmethod
+    def identity(cls) -> "ChunkSummary":
+        """Get the summary of an empty chunk.
+
+        Returns:
+            ChunkSummary: Summary leaving the dial untouched.
+        """
+        return cls(shift=0, zeros=(0,) * DIAL_SIZE)
+
+    def then(self, following: "ChunkSummary") -> "ChunkSummary":
+        """Compose the summary with the one of the following chunk.
+
+        Args:
+            following (ChunkSummary): Summary of the following chunk.
+
+        Returns:
+            ChunkSummary: Summary of both chunks, in order.
+        """
+        return ChunkSummary(
+            shift=(self.shift + following.shift) % DIAL_SIZE,
+            zeros=tuple(
+                zeros + following.zeros[(start + self.shift) % DIAL_SIZE]
+                for start, zeros in enumerate(self.zeros)
+            ),
+        )
+
+
+def summarize_rotations(
+    directions: "npt.NDArray[np.int64]",
+    ticks: "npt.NDArray[np.int64]",
+    only_count_pointed: bool,
+) -> ChunkSummary:
+    """Summarize rotations for every starting position at once.
+
+    Args:
+        directions (npt.NDArray[np.int64]): Direction of each rotation.
+        ticks (npt.NDArray[np.int64]): Number of ticks of each rotation.
+        only_count_pointed (bool): Whether to only count pointed numbers.
+
+    Returns:
+        ChunkSummary: Summary of the rotations.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    if len(ticks) == 0:
+        return ChunkSummary.identity()
+
+    # Pointed numbers after each rotation, when starting from 0
+    offsets: npt.NDArray[np.int64] = (
+        np.cumsum(directions * ticks % DIAL_SIZE) % DIAL_SIZE
+    )
+    shift: int = int(offsets[-1])
+    if only_count_pointed:
+        # Starting from s, rotation i ends on 0 if s == -offsets[i]
+        return ChunkSummary(
+            shift=shift,
+            zeros=tuple(
+                np.bincount(-offsets % DIAL_SIZE, minlength=DIAL_SIZE).tolist()
+            ),
+        )
+
+    # Every full turn hits 0 once, whatever the starting position. The
+    # remaining ticks hit it only from a range of pointed numbers:
+    # [100 - remainder, 99] turning right, [1, remainder] turning left.
+    turns, remainders = np.divmod(ticks, DIAL_SIZE)
+    previous_offsets: npt.NDArray[np.int64] = np.concatenate(
+        ([0], offsets[:-1])
+    )
+    range_starts: npt.NDArray[np.int64] = (
+        np.where(directions > 0, DIAL_SIZE - remainders, 1) - previous_offsets
+    ) % DIAL_SIZE
+    # Cyclic ranges of starting positions, unrolled over two dial turns
+    hit_ranges: npt.NDArray[np.int64] = np.cumsum(
+        np.bincount(range_starts, minlength=2 * DIAL_SIZE)
+        - np.bincount(range_starts + remainders, minlength=2 * DIAL_SIZE)
+    )
+    return ChunkSummary(
+        shift=shift,
+        zeros=tuple(
+            (
+                hit_ranges[:DIAL_SIZE]
+                + hit_ranges[DIAL_SIZE : 2 * DIAL_SIZE]
+                + int(np.sum(turns))
+            ).tolist()
+        ),
+    )
+
+
+def summarize_chunk(
+    file_path: Path, start: int, end: int, only_count_pointed: bool
+) -> ChunkSummary:
+    """Summarize the rotations of a byte range of an input file.
+    Executed by the worker processes.
+
+    Args:
+        file_path (Path): Absolute path of the input file.
+        start (int): Offset of the first line of the chunk.
+        end (int): Offset following the last line of the chunk.
+        only_count_pointed (bool): Whether to only count pointed numbers.
+
+    Returns:
+        ChunkSummary: Summary of the chunk.
+    """
+    summary: ChunkSummary = ChunkSummary.identity()
+    with map_input(file_path, file_path.parent) as mapped:
+        for block_start, block_end in mapped.iter_blocks(
+            PARSE_BLOCK_SIZE, start, end
+        ):
+            summary = summary.then(
+                summarize_rotations(
+                    *parse_rotations_block(
+                        mapped.as_array()[block_start:block_end]
+                    ),
+                    only_count_pointed,
+                )
+            )
+    return summary
+
+
+def compute_password_parallel(
+    source: InputSource,
+    only_count_pointed: bool,
+    workers: int | None = None,
+    pointed_number: int = 50,
+) -> int:
+    """Compute the password based on the rotations of an input file,
+    with chunks summarized by worker processes.
+    Streams cannot be split, they are streamed sequentially in bounded
+    memory, and a single worker summarizes the file in the current process.
+
+    Args:
+        source (InputSource): File path or stream to solve.
+        only_count_pointed (bool): Whether to only count pointed numbers.
+        workers (int | None, optional):
+            Number of worker processes. Defaults to the number of CPUs.
+        pointed_number (int): Initial pointed number.
+
+    Returns:
+        int: The computed password.
+    """
+    if not isinstance(source, (str, Path)):
+        return compute_password(
+            iter_rotations(source), only_count_pointed, pointed_number
+        )
+
+    file_path: Path = Path(source).absolute()
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return summarize_chunk(
+            file_path, 0, file_path.stat().st_size, only_count_pointed
+        ).zeros[pointed_number % DIAL_SIZE]
+
+    # Only loaded by parallel runs, to keep the startup of the parts fast
+    # pylint: disable-next=import-outside-toplevel
+    from concurrent.futures import ProcessPoolExecutor
+
+    with map_input(file_path, file_path.parent) as mapped:
+        chunks: t.List[t.Tuple[int, int]] = list(
+            mapped.iter_blocks(
+                len(mapped.buffer) // (workers * CHUNKS_PER_WORKER) + 1
+            )
+        )
+
+    summary: ChunkSummary = ChunkSummary.identity()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_summary in executor.map(
+            summarize_chunk,
+            itertools.repeat(file_path),
+            [start for start, _ in chunks],
+            [end for _, end in chunks],
+            itertools.repeat(only_count_pointed),
+        ):
+            summary = summary.then(chunk_summary)
+    return summary.zeros[pointed_number % DIAL_SIZE]
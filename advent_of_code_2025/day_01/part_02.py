@@ -1,25 +1,44 @@
 """Advent of code - Day 01 - Part 02"""
 
-from advent_of_code_2025.day_01.common import (
-    compute_password,
-    parse_rotations_file,
-)
+import typing as t
 
+from advent_of_code_2025.day_01.common import compute_password
+from advent_of_code_2025.day_01.common import iter_rotations as parse
+from advent_of_code_2025.day_01.parallel import compute_password_parallel
+from advent_of_code_2025.puzzle_input import InputSource
+from advent_of_code_2025.registry import print_answers
+
+
+def solve(rotations: t.Iterable[t.Tuple[int, int]]) -> int:
+    """Solve the part from the parsed input.
+
+    Args:
+        rotations (t.Iterable[t.Tuple[int, int]]): Parsed rotations.
+
+    Returns:
+        int: Number of times the dial points at 0.
+    """
+    return compute_password(rotations, only_count_pointed=False)
 
-def main() -> None:
-    """Main function."""
-    invalid_ids_sum: int
-    invalid_ids_sum = compute_password(
-        parse_rotations_file(file_name="inputs/example.txt"),
-        only_count_pointed=False,
-    )
-    print(f"Example output: {invalid_ids_sum}")
 
-    invalid_ids_sum = compute_password(
-        parse_rotations_file(file_name="inputs/real.txt"),
-        only_count_pointed=False,
+def solve_parallel(source: InputSource, workers: int) -> int:
+    """Solve the part from an input source, with worker processes.
+
+    Args:
+        source (InputSource): Input file path or stream.
+        workers (int): Number of worker processes.
+
+    Returns:
+        int: Number of times the dial points at 0.
+    """
+    return compute_password_parallel(
+        source, only_count_pointed=False, workers=workers
     )
-    print(f"Real output: {invalid_ids_sum}")
+
+
+def main() -> None:
+    """Main function."""
+    print_answers(parse, solve)
 
 
 if __name__ == "__main__":
@@ -1,36 +1,151 @@
 """Common methods for the Day 02"""
 
-import re
+import heapq
 import typing as t
 from pathlib import Path
 
+from advent_of_code_2025.puzzle_input import InputSource, iter_records
 
-def parse_id_ranges_file(file_name: str) -> t.List[t.Tuple[int, int]]:
+
+def iter_id_ranges(source: InputSource) -> t.Iterator[t.Tuple[int, int]]:
+    """Lazily parse the comma separated ID ranges of an input source.
+
+    Args:
+        source (InputSource): File name or stream to parse.
+
+    Yields:
+        t.Tuple[int, int]: ID range as a tuple.
+    """
+    for record in iter_records(source, Path(__file__).parent, ","):
+        yield (int(record.split("-")[0]), int(record.split("-")[1]))
+
+
+def parse_id_ranges_file(source: InputSource) -> t.List[t.Tuple[int, int]]:
     """Parse the ID ranges from the input file.
 
     Args:
-        file_name (str): Name of the input file.
+        source (InputSource): File name or stream to parse.
 
     Returns:
         t.List[t.Tuple[int, int]]: List of ID ranges as tuples.
     """
-    id_ranges: t.List[t.Tuple[int, int]] = []
-    file_path: Path = Path(__file__).parent / file_name
-    with open(file_path, "r", encoding="utf-8") as input_fd:
-        id_ranges = [
-            (int(line.split("-")[0]), int(line.split("-")[1]))
-            for line in input_fd.read().split(",")
-        ]
-    return id_ranges
+    return list(iter_id_ranges(source))
+
+
+def iter_periods(length: int, match_many: bool) -> t.Iterator[int]:
+    """List the pattern lengths an invalid ID of a given length may have.
+
+    Args:
+        length (int): Number of digits of the ID.
+        match_many (bool): Whether to match many repetitions or just one.
+
+    Yields:
+        int: Pattern lengths, repeated at least twice to make the ID.
+    """
+    if not match_many:
+        if length % 2 == 0:
+            yield length // 2
+        return
+    for period in range(1, length // 2 + 1):
+        if length % period == 0:
+            yield period
+
+
+def is_repeated(pattern: str) -> bool:
+    """Check if a pattern is itself a repetition of a shorter pattern.
+
+    Args:
+        pattern (str): Pattern to check.
+
+    Returns:
+        bool: True if the pattern has a shorter period dividing its length.
+    """
+    return (pattern + pattern).find(pattern, 1) < len(pattern)
+
+
+def get_pattern_bounds(
+    range_start: int, range_end: int, length: int, period: int
+) -> t.Tuple[int, int, int]:
+    """Get the patterns of a given length whose repetitions fall in a range.
+
+    Args:
+        range_start (int): First ID of the range.
+        range_end (int): Last ID of the range.
+        length (int): Number of digits of the IDs.
+        period (int): Number of digits of the repeated pattern.
+
+    Returns:
+        t.Tuple[int, int, int]: First and last patterns (the last one being
+            lower than the first one if there is none), and the multiplier
+            turning a pattern into its ID.
+    """
+    # An ID is its pattern times 10^(length - period) + ... + 10^period + 1
+    multiplier: int = (10**length - 1) // (10**period - 1)
+    return (
+        max(10 ** (period - 1), -(-range_start // multiplier)),
+        min(10**period - 1, range_end // multiplier),
+        multiplier,
+    )
+
+
+def iter_period_ids(
+    range_start: int, range_end: int, length: int, period: int, primitive: bool
+) -> t.Iterator[int]:
+    """Build the IDs of a range made of a repeated pattern of a given length,
+    in increasing order.
+
+    Args:
+        range_start (int): First ID of the range.
+        range_end (int): Last ID of the range.
+        length (int): Number of digits of the IDs.
+        period (int): Number of digits of the repeated pattern.
+        primitive (bool): Whether to skip patterns that are repetitions
+            themselves, whose IDs are built from a shorter period.
+
+    Yields:
+        int: IDs of the range.
+    """
+    first_pattern, last_pattern, multiplier = get_pattern_bounds(
+        range_start, range_end, length, period
+    )
+    for pattern in range(first_pattern, last_pattern + 1):
+        if not primitive or not is_repeated(str(pattern)):
+            yield pattern * multiplier
+
+
+def iter_invalid_ids(
+    range_start: int, range_end: int, match_many: bool
+) -> t.Iterator[int]:
+    """Build the invalid IDs of a range in increasing order, in a time
+    proportional to their number rather than to the range width.
+
+    Args:
+        range_start (int): First ID of the range.
+        range_end (int): Last ID of the range.
+        match_many (bool): Whether to match many repetitions or just one.
+
+    Yields:
+        int: Invalid IDs of the range, each one once.
+    """
+    for length in range(len(str(range_start)), len(str(range_end)) + 1):
+        # IDs repeating several periods are only built from the shortest one
+        yield from heapq.merge(
+            *(
+                iter_period_ids(
+                    range_start, range_end, length, period, match_many
+                )
+                for period in iter_periods(length, match_many)
+            )
+        )
 
 
 def sum_invalid_ids(
-    id_ranges: t.List[t.Tuple[int, int]], match_many: bool
+    id_ranges: t.Iterable[t.Tuple[int, int]], match_many: bool
 ) -> int:
     """Sum all invalid IDs based on the given ID ranges.
 
     Args:
-        id_ranges (t.List[t.Tuple[int, int]]): List of ID ranges.
+        id_ranges (t.Iterable[t.Tuple[int, int]]): ID ranges.
         match_many (bool): Whether to match many repetitions or just one.
 
     Returns:
@@ -39,8 +154,5 @@ def sum_invalid_ids(
     return sum(
         id_number
         for range_start, range_end in id_ranges
-        for id_number in range(range_start, range_end + 1)
-        if re.fullmatch(
-            r"(.+?)\1+" if match_many else r"(.+?)\1", str(id_number)
-        )
+        for id_number in iter_invalid_ids(range_start, range_end, match_many)
     )
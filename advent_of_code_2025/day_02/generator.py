@@ -0,0 +1,30 @@
+"""Synthetic input generator for the Day 02"""
+
+import random
+import typing as t
+
+MAX_DIGITS: int = 10
+MAX_RANGE_SIZE: int = 250_000
+
+
+def generate(scale: int, rng: random.Random) -> t.Iterator[str]:
+    """Generate comma separated ID ranges on a single line.
+    Ranges never span a number of digits, like the real inputs.
+
+    Args:
+        scale (int): Number of ID ranges.
+        rng (random.Random): Seeded random generator.
+
+    Yields:
+        str: Chunks of the input.
+    """
+    for index in range(scale):
+        digits: int = rng.randint(1, MAX_DIGITS)
+        lowest: int = 10 ** (digits - 1)
+        highest: int = 10**digits - 1
+        range_start: int = rng.randint(lowest, highest)
+        range_end: int = min(
+            highest, range_start + rng.randint(0, MAX_RANGE_SIZE)
+        )
+        yield f"{',' if index else ''}{range_start}-{range_end}"
+    yield "\n"
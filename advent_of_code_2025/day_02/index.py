@@ -0,0 +1,172 @@
+"""Prefix-sum index of the invalid IDs of the Day 02
+
+Every invalid ID up to a number of digits is stored in a sorted array, along
+with its prefix sums, so that the sum of the invalid IDs of any range takes
+two binary searches. Indexes are built once, then persisted in the cache.
+"""
+
+import hashlib
+import sys
+import typing as t
+
+from advent_of_code_2025.cache import DiskCache, get_cache_dir, hash_modules
+from advent_of_code_2025.day_02.common import iter_invalid_ids
+
+# numpy is slow to import, it is only loaded when an index is used
+if t.TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+DEFAULT_INDEX_DIGITS: int = 12
+# Sums of the invalid IDs of 14 digits overflow 64 bits integers
+MAX_INDEX_DIGITS: int = 13
+
+
+class RangeSums(t.NamedTuple):
+    """Sums of the invalid IDs of a batch of ranges."""
+
+    sums: t.List[int]
+    total: int
+
+
+class InvalidIdIndex:
+    """Sorted invalid IDs up to a number of digits, with prefix sums."""
+
+    match_many: bool
+    max_digits: int
+    ids: "npt.NDArray[np.int64]"
+    prefix_sums: "npt.NDArray[np.int64]"
+
+    def __init__(
+        self,
+        match_many: bool,
+        max_digits: int,
+        ids: "npt.NDArray[np.int64]",
+        prefix_sums: "npt.NDArray[np.int64]",
+    ) -> None:
+        """Initialize the index.
+
+        Args:
+            match_many (bool): Whether to match many repetitions or just one.
+            max_digits (int): Maximum number of digits of the indexed IDs.
+            ids (npt.NDArray[np.int64]): Invalid IDs in increasing order.
+            prefix_sums (npt.NDArray[np.int64]):
+                Sums of the invalid IDs before each position, starting at 0.
+        """
+        self.match_many = match_many
+        self.max_digits = max_digits
+        self.ids = ids
+        self.prefix_sums = prefix_sums
+
+    @classmethod
+    def build(
+        cls, match_many: bool, max_digits: int = DEFAULT_INDEX_DIGITS
+    ) -> "InvalidIdIndex":
+        """Build the index by enumerating the invalid IDs.
+
+        Args:
+            match_many (bool): Whether to match many repetitions or just one.
+            max_digits (int, optional): Maximum number of digits of the
+                indexed IDs. Defaults to DEFAULT_INDEX_DIGITS.
+
+        Raises:
+            ValueError: If the sums of the IDs would overflow.
+
+        Returns:
+            InvalidIdIndex: Index of the invalid IDs.
+        """
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        if not 1 <= max_digits <= MAX_INDEX_DIGITS:
+            raise ValueError(
+                f"Indexes cover 1 to {MAX_INDEX_DIGITS} digits, "
+                f"not {max_digits}"
+            )
+        ids: npt.NDArray[np.int64] = np.fromiter(
+            iter_invalid_ids(1, 10**max_digits - 1, match_many), dtype=np.int64
+        )
+        return cls(
+            match_many,
+            max_digits,
+            ids,
+            np.concatenate(([0], np.cumsum(ids))).astype(np.int64),
+        )
+
+    @classmethod
+    def load(
+        cls,
+        match_many: bool,
+        max_digits: int = DEFAULT_INDEX_DIGITS,
+        cache: DiskCache | None = None,
+    ) -> "InvalidIdIndex":
+        """Load the index from the cache, building and storing it if needed.
+
+        Args:
+            match_many (bool): Whether to match many repetitions or just one.
+            max_digits (int, optional): Maximum number of digits of the
+                indexed IDs. Defaults to DEFAULT_INDEX_DIGITS.
+            cache (DiskCache | None, optional): Cache storing the indexes.
+                Defaults to `<cache dir>/indexes`.
+
+        Returns:
+            InvalidIdIndex: Index of the invalid IDs.
+        """
+        cache = cache or DiskCache(get_cache_dir() / "indexes", 256 << 20)
+        # Indexes are rebuilt whenever the enumeration code changes
+        key: str = hashlib.sha256(
+            f"day02:{match_many}:{max_digits}:"
+            f"{hash_modules(sys.modules[iter_invalid_ids.__module__])}".encode()
+        ).hexdigest()
+        found, index = cache.get(key)
+        if found and isinstance(index, cls):
+            return index
+        index = cls.build(match_many, max_digits)
+        cache.set(key, index)
+        return index
+
+    def sum_range(self, range_start: int, range_end: int) -> int:
+        """Sum the invalid IDs of a range.
+
+        Args:
+            range_start (int): First ID of the range.
+            range_end (int): Last ID of the range.
+
+        Returns:
+            int: Sum of the invalid IDs of the range.
+        """
+        return self.sum_ranges([(range_start, range_end)]).total
+
+    def sum_ranges(self, id_ranges: t.Iterable[t.Tuple[int, int]]) -> RangeSums:
+        """Sum the invalid IDs of a batch of ranges.
+
+        Args:
+            id_ranges (t.Iterable[t.Tuple[int, int]]): ID ranges.
+
+        Raises:
+            ValueError: If a range exceeds the indexed IDs.
+
+        Returns:
+            RangeSums: Sum of the invalid IDs of each range, and their total.
+        """
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        ranges: t.List[t.Tuple[int, int]] = list(id_ranges)
+        # Checked before any conversion, bigger IDs would overflow 64 bits
+        if any(range_end >= 10**self.max_digits for _, range_end in ranges):
+            raise ValueError(
+                f"Ranges exceed the {self.max_digits} digits of the index"
+            )
+        bounds: npt.NDArray[np.int64] = np.array(
+            ranges, dtype=np.int64
+        ).reshape(-1, 2)
+        starts: npt.NDArray[np.intp] = np.searchsorted(
+            self.ids, bounds[:, 0], side="left"
+        )
+        # Empty ranges, ending before their start, sum to 0
+        ends: npt.NDArray[np.intp] = np.maximum(
+            np.searchsorted(self.ids, bounds[:, 1], side="right"), starts
+        )
+        sums: t.List[int] = (
+            self.prefix_sums[ends] - self.prefix_sums[starts]
+        ).tolist()
+        return RangeSums(sums=sums, total=sum(sums))
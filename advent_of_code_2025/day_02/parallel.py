@@ -0,0 +1,202 @@
+"""Process-parallel sums of the invalid IDs of the Day 02
+
+Ranges are cut at digit length boundaries, then into sub-ranges holding
+about the same number of candidate patterns, so that a single wide range
+is spread over every worker process.
+"""
+
+import os
+import sys
+import typing as t
+
+from advent_of_code_2025.day_02.common import (
+    get_pattern_bounds,
+    iter_id_ranges,
+    iter_invalid_ids,
+    iter_periods,
+)
+from advent_of_code_2025.puzzle_input import InputSource
+
+# Chunks per worker, so that workers finishing early pick up more work
+CHUNKS_PER_WORKER: int = 4
+
+
+class ChunkResult(t.NamedTuple):
+    """Sum of the invalid IDs of a chunk of a range."""
+
+    range_start: int
+    range_end: int
+    total: int
+
+
+def split_by_length(
+    range_start: int, range_end: int
+) -> t.Iterator[t.Tuple[int, int]]:
+    """Cut a range at digit length boundaries.
+
+    Args:
+        range_start (int): First ID of the range.
+        range_end (int): Last ID of the range.
+
+    Yields:
+        t.Tuple[int, int]: Sub-ranges whose IDs all have the same length.
+    """
+    while range_start <= range_end:
+        length_end: int = min(range_end, 10 ** len(str(range_start)) - 1)
+        yield range_start, length_end
+        range_start = length_end + 1
+
+
+def count_patterns(range_start: int, range_end: int, match_many: bool) -> int:
+    """Count the patterns enumerated to find the invalid IDs of a range
+    whose IDs all have the same length.
+
+    Args:
+        range_start (int): First ID of the range.
+        range_end (int): Last ID of the range.
+        match_many (bool): Whether to match many repetitions or just one.
+
+    Returns:
+        int: Number of candidate patterns.
+    """
+    length: int = len(str(range_start))
+    patterns: int = 0
+    for period in iter_periods(length, match_many):
+        first_pattern, last_pattern, _ = get_pattern_bounds(
+            range_start, range_end, length, period
+        )
+        patterns += max(0, last_pattern - first_pattern + 1)
+    return patterns
+
+
+def split_balanced(
+    id_ranges: t.Iterable[t.Tuple[int, int]], match_many: bool, chunks: int
+) -> t.List[t.Tuple[int, int]]:
+    """Cut ranges into sub-ranges of about the same amount of work.
+
+    Args:
+        id_ranges (t.Iterable[t.Tuple[int, int]]): ID ranges.
+        match_many (bool): Whether to match many repetitions or just one.
+        chunks (int): Targeted number of sub-ranges.
+
+    Returns:
+        t.List[t.Tuple[int, int]]: Sub-ranges, in the order of the ranges.
+    """
+    segments: t.List[t.Tuple[int, int, int]] = [
+        (start, end, count_patterns(start, end, match_many))
+        for range_start, range_end in id_ranges
+        for start, end in split_by_length(range_start, range_end)
+    ]
+    target: int = max(1, sum(work for _, _, work in segments) // chunks)
+
+    sub_ranges: t.List[t.Tuple[int, int]] = []
+    for start, end, work in segments:
+        # Invalid IDs are spread evenly over the IDs of a same length
+        pieces: int = min(max(1, -(-work // target)), end - start + 1)
+        width: int = (end - start + 1) // pieces
+        for piece in range(pieces):
+            piece_start: int = start + piece * width
+            piece_end: int = piece_start + width - 1
+            # The last piece also takes the remainder of the division
+            sub_ranges.append(
+                (piece_start, end if piece == pieces - 1 else piece_end)
+            )
+    return sub_ranges
+
+
+def sum_chunk(
+    range_start: int, range_end: int, match_many: bool
+) -> ChunkResult:
+    """Sum the invalid IDs of a chunk.
+    Executed by the worker processes.
+
+    Args:
+        range_start (int): First ID of the chunk.
+        range_end (int): Last ID of the chunk.
+        match_many (bool): Whether to match many repetitions or just one.
+
+    Returns:
+        ChunkResult: Sum of the invalid IDs of the chunk.
+    """
+    return ChunkResult(
+        range_start,
+        range_end,
+        sum(iter_invalid_ids(range_start, range_end, match_many)),
+    )
+
+
+def print_progress(done: int, chunks: int, result: ChunkResult) -> None:
+    """Print the progress of a parallel sum on stderr.
+
+    Args:
+        done (int): Number of summed chunks.
+        chunks (int): Total number of chunks.
+        result (ChunkResult): Last summed chunk.
+    """
+    print(
+        f"[{done}/{chunks}] {result.range_start}-{result.range_end}: "
+        f"{result.total}",
+        file=sys.stderr,
+    )
+
+
+def sum_invalid_ids_parallel(
+    id_ranges: t.Iterable[t.Tuple[int, int]],
+    match_many: bool,
+    workers: int | None = None,
+    progress: t.Callable[[int, int, ChunkResult], None] | None = None,
+) -> int:
+    """Sum all invalid IDs based on the given ID ranges, with chunks of
+    the ranges summed by worker processes.
+
+    Args:
+        id_ranges (t.Iterable[t.Tuple[int, int]]): ID ranges.
+        match_many (bool): Whether to match many repetitions or just one.
+        workers (int | None, optional):
+            Number of worker processes. Defaults to the number of CPUs.
+        progress (t.Callable[[int, int, ChunkResult], None] | None, optional):
+            Called with the number of summed chunks, the total number of
+            chunks and the last summed chunk. Defaults to None.
+
+    Returns:
+        int: Sum of all invalid IDs.
+    """
+    # Only loaded by parallel runs, to keep the startup of the parts fast
+    # pylint: disable-next=import-outside-toplevel
+    from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+
+    workers = workers or os.cpu_count() or 1
+    sub_ranges: t.List[t.Tuple[int, int]] = split_balanced(
+        id_ranges, match_many, workers * CHUNKS_PER_WORKER
+    )
+    total: int = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures: t.List[Future[ChunkResult]] = [
+            executor.submit(sum_chunk, start, end, match_many)
+            for start, end in sub_ranges
+        ]
+        for done, future in enumerate(as_completed(futures), start=1):
+            result: ChunkResult = future.result()
+            total += result.total
+            if progress is not None:
+                progress(done, len(futures), result)
+    return total
+
+
+def solve_invalid_ids_parallel(
+    source: InputSource, match_many: bool, workers: int
+) -> int:
+    """Sum the invalid IDs of the ranges of an input source in parallel,
+    printing the progress of each chunk on stderr.
+
+    Args:
+        source (InputSource): Input file path or stream.
+        match_many (bool): Whether to match many repetitions or just one.
+        workers (int): Number of worker processes.
+
+    Returns:
+        int: Sum of all invalid IDs.
+    """
+    return sum_invalid_ids_parallel(
+        iter_id_ranges(source), match_many, workers, print_progress
+    )
@@ -1,23 +1,42 @@
 """Advent of code - Day 02 - Part 02"""
 
-from advent_of_code_2025.day_02.common import (
-    parse_id_ranges_file,
-    sum_invalid_ids,
-)
+import typing as t
+
+from advent_of_code_2025.day_02.common import iter_id_ranges as parse
+from advent_of_code_2025.day_02.common import sum_invalid_ids
+from advent_of_code_2025.day_02.parallel import solve_invalid_ids_parallel
+from advent_of_code_2025.puzzle_input import InputSource
+from advent_of_code_2025.registry import print_answers
+
+
+def solve(id_ranges: t.Iterable[t.Tuple[int, int]]) -> int:
+    """Solve the part from the parsed input.
+
+    Args:
+        id_ranges (t.Iterable[t.Tuple[int, int]]): Parsed ID ranges.
+
+    Returns:
+        int: Sum of all invalid IDs.
+    """
+    return sum_invalid_ids(id_ranges, match_many=True)
+
+
+def solve_parallel(source: InputSource, workers: int) -> int:
+    """Solve the part from an input source, with worker processes.
+
+    Args:
+        source (InputSource): Input file path or stream.
+        workers (int): Number of worker processes.
+
+    Returns:
+        int: Sum of all invalid IDs.
+    """
+    return solve_invalid_ids_parallel(source, match_many=True, workers=workers)
 
 
 def main() -> None:
     """Main function."""
-    invalid_ids_sum: int
-    invalid_ids_sum = sum_invalid_ids(
-        parse_id_ranges_file(file_name="inputs/example.txt"), match_many=True
-    )
-    print(f"Example output: {invalid_ids_sum}")
-
-    invalid_ids_sum = sum_invalid_ids(
-        parse_id_ranges_file(file_name="inputs/real.txt"), match_many=True
-    )
-    print(f"Real output: {invalid_ids_sum}")
+    print_answers(parse, solve)
 
 
 if __name__ == "__main__":
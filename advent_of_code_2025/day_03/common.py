@@ -1,60 +1,344 @@
 """Common methods for the Day 03"""
 
+import itertools
 import typing as t
 from pathlib import Path
 
+from advent_of_code_2025.puzzle_input import (
+    InputSource,
+    iter_byte_lines,
+    map_input,
+)
 
-def parse_battery_banks_file(file_name: str) -> t.List[str]:
+# numpy is slow to import, it is only loaded when banks are matrices
+if t.TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+# Banks of the same length, one ASCII digit per cell
+BankMatrix: t.TypeAlias = "npt.NDArray[np.uint8]"
+
+ZERO: int = ord("0")
+# Numbers longer than this are built from their two halves
+SPLIT_DIGITS: int = 64
+# Banks solved at once, bounding the size of the temporary arrays
+CHUNK_BANKS: int = 1 << 12
+# Voltages of more digits overflow 64 bits integers
+MAX_INT64_DIGITS: int = 18
+
+
+def iter_battery_banks(source: InputSource) -> t.Iterator[bytes]:
+    """Lazily parse battery banks from an input source, without decoding.
+
+    Args:
+        source (InputSource): File name or stream to parse.
+
+    Yields:
+        bytes: Battery bank, as ASCII digits.
+    """
+    for line in iter_byte_lines(source, Path(__file__).parent):
+        yield line.strip()
+
+
+def parse_battery_banks_file(source: InputSource) -> t.List[bytes]:
     """Parse battery banks from file.
 
     Args:
-        file_name (str): File name to parse from.
+        source (InputSource): File name or stream to parse.
+
+    Returns:
+        t.List[bytes]: List of battery banks.
+    """
+    return list(iter_battery_banks(source))
+
+
+def iter_bank_matrices(banks: t.Iterable[bytes]) -> t.Iterator[BankMatrix]:
+    """Group battery banks into matrices of banks of the same length,
+    chunk by chunk.
+
+    Args:
+        banks (t.Iterable[bytes]): Battery banks.
+
+    Yields:
+        BankMatrix: Banks of the same length.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    bank_iterator: t.Iterator[bytes] = iter(banks)
+    while chunk := list(itertools.islice(bank_iterator, CHUNK_BANKS)):
+        banks_by_length: t.Dict[int, t.List[bytes]] = {}
+        for bank in chunk:
+            # Empty banks have no battery to use
+            if bank:
+                banks_by_length.setdefault(len(bank), []).append(bank)
+        for length, same_length_banks in banks_by_length.items():
+            yield np.frombuffer(
+                b"".join(same_length_banks), dtype=np.uint8
+            ).reshape(len(same_length_banks), length)
+
+
+def iter_battery_matrices(source: InputSource) -> t.Iterator[BankMatrix]:
+    """Lazily parse battery banks into matrices, chunk by chunk.
+    Files whose banks all have the same length are memory-mapped,
+    and their chunks are views of the file bytes.
+
+    Args:
+        source (InputSource): File name or stream to parse.
+
+    Yields:
+        BankMatrix: Chunk of banks of the same length.
+    """
+    if isinstance(source, (str, Path)):
+        with map_input(source, Path(__file__).parent) as mapped:
+            try:
+                grid: BankMatrix | None = mapped.as_grid()
+            except ValueError:
+                grid = None
+            if grid is not None:
+                for start in range(0, len(grid), CHUNK_BANKS):
+                    yield grid[start : start + CHUNK_BANKS]
+                return
+    # Banks of different lengths, or streams, are grouped by length
+    yield from iter_bank_matrices(iter_battery_banks(source))
+
+
+def select_largest_digits(banks: BankMatrix, battery_size: int) -> BankMatrix:
+    """Greedily select the digits of the largest voltage of every bank at
+    once, column by column of the voltages.
+
+    Args:
+        banks (BankMatrix): Banks of the same length.
+        battery_size (int): Number of batteries to use, every battery of
+            shorter banks is used.
 
     Returns:
-        t.List[str]: List of battery banks.
+        BankMatrix: Selected digits of each bank.
     """
-    battery_banks: t.List[str] = []
-    file_path: Path = Path(__file__).parent / file_name
-    with open(file_path, "r", encoding="utf-8") as input_fd:
-        battery_banks = [line.strip() for line in input_fd.readlines()]
-    return battery_banks
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    rows, length = banks.shape
+    battery_size = min(battery_size, length)
+    digits: BankMatrix = np.empty((rows, battery_size), dtype=np.uint8)
+    # Empty banks have no battery to use
+    if battery_size == 0:
+        return digits
+    # Each digit is picked in a window of the positions leaving enough
+    # batteries after it, starting after the previously picked digit.
+    # Banks are padded with zeros so that windows never go past their end.
+    window_size: int = length - battery_size + 1
+    padded: BankMatrix = np.zeros(
+        (rows, length + window_size - 1), dtype=np.uint8
+    )
+    padded[:, :length] = banks
+    windows: BankMatrix = np.lib.stride_tricks.sliding_window_view(
+        padded, window_size, axis=1
+    )
+    row_indexes: npt.NDArray[np.intp] = np.arange(rows)
+    window_offsets: npt.NDArray[np.intp] = np.arange(window_size)
+    starts: npt.NDArray[np.intp] = np.zeros(rows, dtype=np.intp)
+    for column in range(battery_size):
+        # Windows are cut after the last position leaving enough batteries
+        candidates: BankMatrix = np.where(
+            window_offsets
+            <= (window_size - 1 + column - starts)[:, np.newaxis],
+            windows[row_indexes, starts],
+            0,
+        )
+        # argmax picks the first largest digit, leaving the most choices
+        positions: npt.NDArray[np.intp] = starts + np.argmax(candidates, axis=1)
+        digits[:, column] = padded[row_indexes, positions]
+        starts = positions + 1
+    return digits
+
+
+def sum_voltages(digits: BankMatrix) -> int:
+    """Sum voltages given by their ASCII digits.
+
+    Args:
+        digits (BankMatrix): Digits of each voltage.
+
+    Returns:
+        int: Sum of the voltages.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    if digits.shape[1] > MAX_INT64_DIGITS:
+        return sum(digits_to_int(row.tobytes()) for row in digits)
+    powers: npt.NDArray[np.int64] = 10 ** np.arange(
+        digits.shape[1] - 1, -1, -1, dtype=np.int64
+    )
+    voltages: npt.NDArray[np.int64] = (digits.astype(np.int64) - ZERO) @ powers
+    # Summed as Python integers, which cannot overflow
+    return sum(voltages.tolist())
 
 
-def compute_largest_voltage(battery_bank: str, battery_size: int) -> int:
+def sum_largest_voltages_matrices(
+    bank_matrices: t.Iterable[BankMatrix], battery_size: int
+) -> int:
+    """Sum the largest voltages of battery banks, vectorized over each
+    matrix of banks. Same answers as `sum_largest_voltages`.
+
+    Args:
+        bank_matrices (t.Iterable[BankMatrix]): Matrices of banks.
+        battery_size (int): Number of batteries to use for each bank.
+
+    Returns:
+        int: Sum of the largest voltages from each battery bank.
+    """
+    return sum(
+        sum_voltages(select_largest_digits(banks, battery_size))
+        for banks in bank_matrices
+    )
+
+
+def digits_to_int(digits: bytes | bytearray) -> int:
+    """Build a number from its ASCII digits arithmetically.
+    Long numbers are split in halves, so that their conversion stays
+    subquadratic.
+
+    Args:
+        digits (bytes | bytearray): ASCII digits of the number.
+
+    Returns:
+        int: Number.
+    """
+    if len(digits) > SPLIT_DIGITS:
+        middle: int = len(digits) // 2
+        # Integer powers with a variable exponent are typed as Any
+        scale: int = 10 ** (len(digits) - middle)
+        return digits_to_int(digits[:middle]) * scale + digits_to_int(
+            digits[middle:]
+        )
+    number: int = 0
+    for digit in digits:
+        number = number * 10 + digit - ZERO
+    return number
+
+
+def compute_largest_voltage(battery_bank: bytes, battery_size: int) -> int:
     """Use a greedy algorithm to find the largest number that can be formed
     by removing digits from the battery bank.
+    The digits are kept in a monotonic stack, each one being pushed and
+    popped at most once, so the bank is scanned in linear time.
 
     Args:
-        battery_bank (str): Battery bank as a string of digits.
+        battery_bank (bytes): Battery bank as ASCII digits.
         battery_size (int): Number of batteries to use.
 
     Returns:
-        int: Largest voltage that can be formed from two batteries.
+        int: Largest voltage that can be formed from the batteries.
     """
     removable_banks: int = len(battery_bank) - battery_size
-    largest_voltage: t.List[int] = []
-
-    for digit in battery_bank:
-        while removable_banks > 0:
-            # Stop if there is nothing to remove in the stack
-            if len(largest_voltage) == 0:
-                break
-            # Stop if current digit is less than the last one in the stack
-            if largest_voltage[-1] >= int(digit):
-                break
-            # Remove the last digit from the stack
-            largest_voltage = largest_voltage[:-1]
+    largest_voltage: bytearray = bytearray()
+    for position, digit in enumerate(battery_bank):
+        # Once nothing can be removed, the remaining digits are all kept
+        if removable_banks <= 0:
+            largest_voltage += battery_bank[position:]
+            break
+        # Remove the last digits of the stack lower than the current one
+        while (
+            removable_banks > 0
+            and largest_voltage
+            and largest_voltage[-1] < digit
+        ):
+            largest_voltage.pop()
             removable_banks -= 1
-        largest_voltage.append(int(digit))
+        largest_voltage.append(digit)
+    del largest_voltage[battery_size:]
+    return digits_to_int(largest_voltage)
 
-    return int("".join(map(str, largest_voltage[:battery_size])))
+
+def build_next_digit_table(battery_bank: bytes) -> t.List[t.List[int]]:
+    """Build the table of the next occurrence of each digit in a bank.
+
+    Args:
+        battery_bank (bytes): Battery bank as ASCII digits.
+
+    Returns:
+        t.List[t.List[int]]: For each digit from 0 to 9, and each position
+            of the bank, the position of the next occurrence of the digit
+            from there (the bank length if there is none).
+    """
+    table: t.List[t.List[int]] = []
+    for digit in range(ZERO, ZERO + 10):
+        next_positions: t.List[int] = []
+        # Positions up to an occurrence all point to this occurrence
+        position: int = battery_bank.find(digit)
+        while position != -1:
+            next_positions.extend(
+                [position] * (position + 1 - len(next_positions))
+            )
+            position = battery_bank.find(digit, position + 1)
+        next_positions.extend(
+            [len(battery_bank)] * (len(battery_bank) + 1 - len(next_positions))
+        )
+        table.append(next_positions)
+    return table
+
+
+def compute_largest_voltages(
+    battery_bank: bytes, battery_sizes: t.Iterable[int] | None = None
+) -> t.Dict[int, int]:
+    """Find the largest voltage of a bank for many numbers of batteries,
+    sharing a single table of the next occurrence of each digit.
+    Each battery of a voltage is then picked with at most 10 lookups.
+
+    Args:
+        battery_bank (bytes): Battery bank as ASCII digits.
+        battery_sizes (t.Iterable[int] | None, optional): Numbers of
+            batteries to use. Defaults to None (every size of the bank).
+
+    Raises:
+        ValueError: If a number of batteries exceeds the bank size.
+
+    Returns:
+        t.Dict[int, int]: Largest voltage of each number of batteries.
+    """
+    sizes: t.List[int] = sorted(
+        set(
+            range(1, len(battery_bank) + 1)
+            if battery_sizes is None
+            else battery_sizes
+        )
+    )
+    if sizes and not 1 <= sizes[0] <= sizes[-1] <= len(battery_bank):
+        raise ValueError(
+            f"Numbers of batteries must be between 1 and {len(battery_bank)}"
+        )
+    table: t.List[t.List[int]] = build_next_digit_table(battery_bank)
+    # Largest digits first, absent ones never need a lookup
+    lookups: t.List[t.Tuple[int, t.List[int]]] = [
+        (ZERO + digit, table[digit])
+        for digit in range(9, -1, -1)
+        if table[digit][0] < len(battery_bank)
+    ]
+
+    voltages: t.Dict[int, int] = {}
+    for battery_size in sizes:
+        digits: bytearray = bytearray()
+        start: int = 0
+        for remaining in range(battery_size, 0, -1):
+            # Once every battery left has to be used, they are all kept
+            if start + remaining == len(battery_bank):
+                digits += battery_bank[start:]
+                break
+            # Pick the largest digit leaving enough batteries after it
+            for digit, next_positions in lookups:
+                if next_positions[start] <= len(battery_bank) - remaining:
+                    digits.append(digit)
+                    start = next_positions[start] + 1
+                    break
+        voltages[battery_size] = digits_to_int(digits)
+    return voltages
 
 
-def sum_largest_voltages(battery_banks: t.List[str], battery_size: int) -> int:
+def sum_largest_voltages(
+    battery_banks: t.Iterable[bytes], battery_size: int
+) -> int:
     """Sum the largest voltages from a list of battery banks.
 
     Args:
-        battery_banks (t.List[str]): List of battery banks.
+        battery_banks (t.Iterable[bytes]): Battery banks.
         battery_size (int): Number of batteries to use for each bank.
 
     Returns:
@@ -0,0 +1,20 @@
+"""Synthetic input generator for the Day 03"""
+
+import random
+import typing as t
+
+BANK_SIZE: int = 100
+
+
+def generate(scale: int, rng: random.Random) -> t.Iterator[str]:
+    """Generate battery banks of digits, one per line.
+
+    Args:
+        scale (int): Number of battery banks.
+        rng (random.Random): Seeded random generator.
+
+    Yields:
+        str: Lines of the input.
+    """
+    for _ in range(scale):
+        yield "".join(rng.choices("123456789", k=BANK_SIZE)) + "\n"
@@ -1,23 +1,28 @@
 """Advent of code - Day 03 - Part 01"""
 
-from advent_of_code_2025.day_03.common import (
-    parse_battery_banks_file,
-    sum_largest_voltages,
-)
+import typing as t
+
+from advent_of_code_2025.day_03.common import BankMatrix
+from advent_of_code_2025.day_03.common import iter_battery_matrices as parse
+from advent_of_code_2025.day_03.common import sum_largest_voltages_matrices
+from advent_of_code_2025.registry import print_answers
+
+
+def solve(bank_matrices: t.Iterable[BankMatrix]) -> int:
+    """Solve the part from the parsed input.
+
+    Args:
+        bank_matrices (t.Iterable[BankMatrix]): Parsed battery banks.
+
+    Returns:
+        int: Sum of the largest voltages of each battery bank.
+    """
+    return sum_largest_voltages_matrices(bank_matrices, battery_size=2)
 
 
 def main() -> None:
     """Main function."""
-    largest_voltages_sum: int
-    largest_voltages_sum = sum_largest_voltages(
-        parse_battery_banks_file(file_name="inputs/example.txt"), battery_size=2
-    )
-    print(f"Example output: {largest_voltages_sum}")
-
-    largest_voltages_sum = sum_largest_voltages(
-        parse_battery_banks_file(file_name="inputs/real.txt"), battery_size=2
-    )
-    print(f"Real output: {largest_voltages_sum}")
+    print_answers(parse, solve)
 
 
 if __name__ == "__main__":
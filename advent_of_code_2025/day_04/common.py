@@ -4,29 +4,32 @@ import itertools
 import typing as t
 from pathlib import Path
 
+from advent_of_code_2025.puzzle_input import InputSource, map_input
 
-def parse_grid_file(file_name: str) -> t.List[t.List[str]]:
-    """Parse a grid file into a 2D list of strings.
+ROLL: int = ord("@")
+REMOVED_ROLL: int = ord("X")
+
+
+def parse_grid_file(source: InputSource) -> t.List[bytearray]:
+    """Parse a grid file into a list of byte rows.
+    The file is memory-mapped, cells are never decoded.
 
     Args:
-        file_name (str): The name of the file to parse.
+        source (InputSource): The file name or stream to parse.
 
     Returns:
-        t.List[t.List[str]]: A 2D list representing the grid.
+        t.List[bytearray]: A list of rows representing the grid.
     """
-    grid: t.List[t.List[str]] = []
-    file_path: Path = Path(__file__).parent / file_name
-    with open(file_path, "r", encoding="utf-8") as input_fd:
-        grid = [list(line.strip()) for line in input_fd.readlines()]
-    return grid
+    with map_input(source, Path(__file__).parent) as mapped:
+        return [bytearray(line).strip() for line in mapped.iter_lines()]
 
 
-def is_roll_accessible(grid: t.List[t.List[str]], row: int, col: int) -> bool:
+def is_roll_accessible(grid: t.List[bytearray], row: int, col: int) -> bool:
     """Check if a roll at a given position is accessible.
     An accessible roll is defined as one that has less than 4 adjacent rolls.
 
     Args:
-        grid (t.List[t.List[str]]): The grid representing the rolls.
+        grid (t.List[bytearray]): The grid representing the rolls.
         row (int): The row index of the roll.
         col (int): The column index of the roll.
 
@@ -43,7 +46,7 @@ def is_roll_accessible(grid: t.List[t.List[str]], row: int, col: int) -> bool:
     for row_direction, col_direction in directions:
         r, c = row + row_direction, col + col_direction
         if 0 <= r < len(grid) and 0 <= c < len(grid[0]):
-            if grid[r][c] == "@":
+            if grid[r][c] == ROLL:
                 adjacent_rolls += 1
 
     if adjacent_rolls >= 4:
@@ -53,12 +56,12 @@ def is_roll_accessible(grid: t.List[t.List[str]], row: int, col: int) -> bool:
 
 
 def rec_compute_accessible_rolls(
-    grid: t.List[t.List[str]], accessible_rolls: int = 0, part_01: bool = False
+    grid: t.List[bytearray], accessible_rolls: int = 0, part_01: bool = False
 ) -> int:
     """Recursively compute the number of accessible rolls in the grid.
 
     Args:
-        grid (t.List[t.List[str]]):
+        grid (t.List[bytearray]):
             The grid representing the rolls.
         accessible_rolls (int, optional):
             The current count of accessible rolls. Defaults to 0.
@@ -72,11 +75,11 @@ def rec_compute_accessible_rolls(
 
     for i, row in enumerate(grid):
         for j, cell in enumerate(row):
-            if cell == "@" and is_roll_accessible(grid, i, j):
+            if cell == ROLL and is_roll_accessible(grid, i, j):
                 accessible_rolls += 1
                 # In part two, we mark the roll as accessed
                 if not part_01:
-                    grid[i][j] = "X"
+                    grid[i][j] = REMOVED_ROLL
                 accessed_new_rolls = True
 
     # In part one, we do not recurse
@@ -0,0 +1,24 @@
+"""Synthetic input generator for the Day 04"""
+
+import random
+import typing as t
+
+GRID_WIDTH: int = 140
+ROLL_DENSITY: float = 0.6
+
+
+def generate(scale: int, rng: random.Random) -> t.Iterator[str]:
+    """Generate a grid of paper rolls (`@`) and empty cells (`.`).
+
+    Args:
+        scale (int): Number of grid rows.
+        rng (random.Random): Seeded random generator.
+
+    Yields:
+        str: Lines of the input.
+    """
+    for _ in range(scale):
+        yield "".join(
+            "@" if rng.random() < ROLL_DENSITY else "."
+            for _ in range(GRID_WIDTH)
+        ) + "\n"
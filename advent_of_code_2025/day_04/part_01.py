@@ -1,25 +1,27 @@
 """Advent of code - Day 04 - Part 01"""
 
-from advent_of_code_2025.day_04.common import (
-    parse_grid_file,
-    rec_compute_accessible_rolls,
-)
+import typing as t
+
+from advent_of_code_2025.day_04.common import parse_grid_file as parse
+from advent_of_code_2025.day_04.common import rec_compute_accessible_rolls
+from advent_of_code_2025.registry import print_answers
+
+
+def solve(grid: t.List[bytearray]) -> int:
+    """Solve the part from the parsed input.
+
+    Args:
+        grid (t.List[bytearray]): Parsed grid.
+
+    Returns:
+        int: Number of accessible rolls.
+    """
+    return rec_compute_accessible_rolls(grid, part_01=True)
 
 
 def main() -> None:
     """Main function."""
-    largest_voltages_sum: int
-    largest_voltages_sum = rec_compute_accessible_rolls(
-        parse_grid_file(file_name="inputs/example.txt"),
-        part_01=True,
-    )
-    print(f"Example output: {largest_voltages_sum}")
-
-    largest_voltages_sum = rec_compute_accessible_rolls(
-        parse_grid_file(file_name="inputs/real.txt"),
-        part_01=True,
-    )
-    print(f"Real output: {largest_voltages_sum}")
+    print_answers(parse, solve)
 
 
 if __name__ == "__main__":
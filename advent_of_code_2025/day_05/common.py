@@ -4,6 +4,8 @@ import typing as t
 from enum import Enum
 from pathlib import Path
 
+from advent_of_code_2025.puzzle_input import InputSource, iter_lines
+
 
 class ParsingMode(Enum):
     """Parsing modes enumeration."""
@@ -13,13 +15,13 @@ class ParsingMode(Enum):
 
 
 def parse_database_file(
-    file_name: str,
+    source: InputSource,
 ) -> t.Tuple[t.List[t.Tuple[int, int]], t.List[int]]:
     """Parse the database file into ranges and ingredients.
 
     Args:
-        file_name (str):
-            The name of the file to parse.
+        source (InputSource):
+            The file name or stream to parse.
 
     Returns:
         t.Tuple[t.List[t.Tuple[int, int]], t.List[int]]:
@@ -28,21 +30,19 @@ def parse_database_file(
     mode: ParsingMode = ParsingMode.RANGES
     ingredients: t.List[int] = []
     ranges: t.List[t.Tuple[int, int]] = []
-    file_path: Path = Path(__file__).parent / file_name
-
-    with open(file_path, "r", encoding="utf-8") as input_fd:
-        for line in input_fd.readlines():
-            if len(line.strip()) == 0:
-                mode = ParsingMode.INGREDIENTS
-                continue
-            if mode == ParsingMode.RANGES:
-                ranges.append(
-                    t.cast(
-                        t.Tuple[int, int],
-                        tuple(int(x) for x in line.strip().split("-")),
-                    )
+
+    for line in iter_lines(source, Path(__file__).parent):
+        if len(line.strip()) == 0:
+            mode = ParsingMode.INGREDIENTS
+            continue
+        if mode == ParsingMode.RANGES:
+            ranges.append(
+                t.cast(
+                    t.Tuple[int, int],
+                    tuple(int(x) for x in line.strip().split("-")),
                 )
-            elif mode == ParsingMode.INGREDIENTS:
-                ingredients.append(int(line.strip()))
+            )
+        elif mode == ParsingMode.INGREDIENTS:
+            ingredients.append(int(line.strip()))
 
     return ranges, ingredients
@@ -0,0 +1,26 @@
+"""Synthetic input generator for the Day 05"""
+
+import random
+import typing as t
+
+MAX_ID: int = 10**15
+MAX_RANGE_SIZE: int = 10**12
+
+
+def generate(scale: int, rng: random.Random) -> t.Iterator[str]:
+    """Generate a database of fresh ID ranges, possibly overlapping,
+    then of available ingredient IDs after a blank line.
+
+    Args:
+        scale (int): Number of ranges, and of ingredients.
+        rng (random.Random): Seeded random generator.
+
+    Yields:
+        str: Lines of the input.
+    """
+    for _ in range(scale):
+        range_start: int = rng.randint(1, MAX_ID)
+        yield f"{range_start}-{range_start + rng.randint(0, MAX_RANGE_SIZE)}\n"
+    yield "\n"
+    for _ in range(scale):
+        yield f"{rng.randint(1, MAX_ID)}\n"
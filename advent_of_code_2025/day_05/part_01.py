@@ -2,7 +2,8 @@
 
 import typing as t
 
-from advent_of_code_2025.day_05.common import parse_database_file
+from advent_of_code_2025.day_05.common import parse_database_file as parse
+from advent_of_code_2025.registry import print_answers
 
 
 def count_fresh_ingredients(
@@ -30,20 +31,22 @@ def count_fresh_ingredients(
     )
 
 
+def solve(database: t.Tuple[t.List[t.Tuple[int, int]], t.List[int]]) -> int:
+    """Solve the part from the parsed input.
+
+    Args:
+        database (t.Tuple[t.List[t.Tuple[int, int]], t.List[int]]):
+            Parsed ranges and ingredients.
+
+    Returns:
+        int: Number of fresh ingredients.
+    """
+    return count_fresh_ingredients(*database)
+
+
 def main() -> None:
     """Main function."""
-    fresh_ingredients_count: int
-    ranges, ingredients = parse_database_file(
-        file_name="inputs/example.txt",
-    )
-    fresh_ingredients_count = count_fresh_ingredients(ranges, ingredients)
-    print(f"Example output: {fresh_ingredients_count}")
-
-    ranges, ingredients = parse_database_file(
-        file_name="inputs/real.txt",
-    )
-    fresh_ingredients_count = count_fresh_ingredients(ranges, ingredients)
-    print(f"Real output: {fresh_ingredients_count}")
+    print_answers(parse, solve)
 
 
 if __name__ == "__main__":
@@ -2,7 +2,8 @@
 
 import typing as t
 
-from advent_of_code_2025.day_05.common import parse_database_file
+from advent_of_code_2025.day_05.common import parse_database_file as parse
+from advent_of_code_2025.registry import print_answers
 
 
 def count_fresh_ingredients(ranges: t.List[t.Tuple[int, int]]) -> int:
@@ -51,26 +52,22 @@ def normalize_ranges(
     return normalized_ranges
 
 
+def solve(database: t.Tuple[t.List[t.Tuple[int, int]], t.List[int]]) -> int:
+    """Solve the part from the parsed input.
+
+    Args:
+        database (t.Tuple[t.List[t.Tuple[int, int]], t.List[int]]):
+            Parsed ranges and ingredients.
+
+    Returns:
+        int: Number of fresh ingredient IDs.
+    """
+    return count_fresh_ingredients(normalize_ranges(database[0]))
+
+
 def main() -> None:
     """Main function."""
-    fresh_ingredients_count: int
-    fresh_ingredients_count = count_fresh_ingredients(
-        normalize_ranges(
-            parse_database_file(
-                file_name="inputs/example.txt",
-            )[0]
-        )
-    )
-    print(f"Example output: {fresh_ingredients_count}")
-
-    fresh_ingredients_count = count_fresh_ingredients(
-        normalize_ranges(
-            parse_database_file(
-                file_name="inputs/real.txt",
-            )[0]
-        )
-    )
-    print(f"Real output: {fresh_ingredients_count}")
+    print_answers(parse, solve)
 
 
 if __name__ == "__main__":
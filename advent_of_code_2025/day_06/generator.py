@@ -0,0 +1,40 @@
+"""Synthetic input generator for the Day 06"""
+
+import random
+import typing as t
+
+OPERANDS_COUNT: int = 4
+MAX_DIGITS: int = 4
+
+
+def generate(scale: int, rng: random.Random) -> t.Iterator[str]:
+    """Generate a worksheet of problems laid out in columns:
+    one row per operand, then a row of operators.
+    Operands of a problem are all left or all right aligned, and sorted by
+    digits count so that each column of digits is contiguous.
+
+    Args:
+        scale (int): Number of problems.
+        rng (random.Random): Seeded random generator.
+
+    Yields:
+        str: Lines of the input.
+    """
+    rows: t.List[t.List[str]] = [[] for _ in range(OPERANDS_COUNT + 1)]
+    for _ in range(scale):
+        operands: t.List[str] = sorted(
+            (
+                str(rng.randint(1, 10 ** rng.randint(1, MAX_DIGITS) - 1))
+                for _ in range(OPERANDS_COUNT)
+            ),
+            key=len,
+            reverse=rng.random() < 0.5,
+        )
+        width: int = max(len(operand) for operand in operands)
+        align: t.Callable[[str, int], str] = rng.choice([str.ljust, str.rjust])
+        for row, operand in zip(rows, operands):
+            row.append(align(operand, width))
+        rows[-1].append(rng.choice("+*").ljust(width))
+
+    for row in rows:
+        yield " ".join(row) + "\n"
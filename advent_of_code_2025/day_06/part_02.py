@@ -8,65 +8,64 @@ from advent_of_code_2025.day_06.common import (
     MathProblem,
     evaluate_and_sum_problems,
 )
+from advent_of_code_2025.puzzle_input import InputSource, iter_lines
+from advent_of_code_2025.registry import print_answers
 
 
-def parse_problems_file(file_name: str) -> t.List[MathProblem]:
+def parse_problems_file(source: InputSource) -> t.List[MathProblem]:
     """Parse problems file and generate problems object
 
     Args:
-        file_name (str): Name of the file to parse.
+        source (InputSource): File name or stream to parse.
 
     Returns:
         t.List[MathProblem]: List of parsed problems.
     """
     problems: t.List[MathProblem] = []
     problems_idx: int = -1
-    file_path: Path = Path(__file__).parent / file_name
-    with open(file_path, "r", encoding="utf-8") as input_fd:
-        lines: t.List[str] = input_fd.read().splitlines()
+    lines: t.List[str] = list(iter_lines(source, Path(__file__).parent))
 
-        # My pretty stupid linter is removing the spaces at the end of lines
-        # So I need to pad them again :(
-        width: int = max(len(line) for line in lines)
-        lines = [line.ljust(width) for line in lines]
+    # My pretty stupid linter is removing the spaces at the end of lines
+    # So I need to pad them again :(
+    width: int = max(len(line) for line in lines)
+    lines = [line.ljust(width) for line in lines]
 
-        columns: t.List[str] = [
-            "".join(line[x] for line in lines) for x in range(len(lines[0]))
-        ]
+    columns: t.List[str] = [
+        "".join(line[x] for line in lines) for x in range(len(lines[0]))
+    ]
 
-        for column in columns:
-            number: re.Match[str] | None = re.search(r"\d+", column)
-            operator: re.Match[str] | None = re.search(r"[\+\*]", column)
+    for column in columns:
+        number: re.Match[str] | None = re.search(r"\d+", column)
+        operator: re.Match[str] | None = re.search(r"[\+\*]", column)
 
-            if operator is not None:
-                problems_idx += 1
-                problems.append(MathProblem(operator=operator.group(0)))
+        if operator is not None:
+            problems_idx += 1
+            problems.append(MathProblem(operator=operator.group(0)))
 
-            if number is not None:
-                problems[problems_idx].add_operand(
-                    int("".join(number.group(0)))
-                )
+        if number is not None:
+            problems[problems_idx].add_operand(int("".join(number.group(0))))
 
     return problems
 
 
+parse = parse_problems_file
+
+
+def solve(problems: t.List[MathProblem]) -> int:
+    """Solve the part from the parsed input.
+
+    Args:
+        problems (t.List[MathProblem]): Parsed problems.
+
+    Returns:
+        int: Sum of the problems results.
+    """
+    return evaluate_and_sum_problems(problems)
+
+
 def main() -> None:
     """Main function."""
-    solution: int
-
-    solution = evaluate_and_sum_problems(
-        parse_problems_file(
-            file_name="inputs/example.txt",
-        )
-    )
-    print(f"Example output: {solution}")
-
-    solution = evaluate_and_sum_problems(
-        parse_problems_file(
-            file_name="inputs/real.txt",
-        )
-    )
-    print(f"Real output: {solution}")
+    print_answers(parse, solve)
 
 
 if __name__ == "__main__":
@@ -3,20 +3,21 @@
 import typing as t
 from pathlib import Path
 
+from advent_of_code_2025.puzzle_input import InputSource, map_input
 
-def parse_diagram_file(file_name: str) -> t.List[t.List[str]]:
+START: int = ord("S")
+SPLITTER: int = ord("^")
+
+
+def parse_diagram_file(source: InputSource) -> t.List[bytes]:
     """Parse TXT input file and generate diagram.
+    The file is memory-mapped, cells are never decoded.
 
     Args:
-        file_name (str): Name of the file to parse.
+        source (InputSource): File name or stream to parse.
 
     Returns:
-        t.List[t.List[str]]: Diagram as a list of list of characters.
+        t.List[bytes]: Diagram as a list of byte rows.
     """
-    diagram: t.List[t.List[str]] = []
-    file_path: Path = Path(__file__).parent / file_name
-    with open(file_path, "r", encoding="utf-8") as input_fd:
-        diagram = list(
-            list(line) for line in map(str.strip, input_fd.readlines())
-        )
-    return diagram
+    with map_input(source, Path(__file__).parent) as mapped:
+        return [bytes(line).strip() for line in mapped.iter_lines()]
@@ -0,0 +1,41 @@
+"""Synthetic input generator for the Day 07"""
+
+import random
+import typing as t
+
+DIAGRAM_WIDTH: int = 141
+SPLITTER_DENSITY: float = 0.7
+
+
+def generate(scale: int, rng: random.Random) -> t.Iterator[str]:
+    """Generate a diagram with the beam source (`S`) in the middle of the
+    first row, and rows of splitters (`^`) every other row.
+    Splitters are only placed where a beam could reach them, like in the
+    real inputs, and never on the borders.
+
+    Args:
+        scale (int): Number of diagram rows.
+        rng (random.Random): Seeded random generator.
+
+    Yields:
+        str: Lines of the input.
+    """
+    center: int = DIAGRAM_WIDTH // 2
+    empty_row: str = "." * DIAGRAM_WIDTH + "\n"
+    yield "." * center + "S" + "." * (DIAGRAM_WIDTH - center - 1) + "\n"
+    for row_index in range(1, scale):
+        if row_index % 2:
+            yield empty_row
+            continue
+        spread: int = row_index // 2 - 1
+        yield "".join(
+            (
+                "^"
+                if 0 < column < DIAGRAM_WIDTH - 1
+                and abs(column - center) <= spread
+                and (column - center + spread) % 2 == 0
+                and rng.random() < SPLITTER_DENSITY
+                else "."
+            )
+            for column in range(DIAGRAM_WIDTH)
+        ) + "\n"
@@ -2,24 +2,26 @@
 
 import typing as t
 
-from advent_of_code_2025.day_07.common import parse_diagram_file
+from advent_of_code_2025.day_07.common import SPLITTER, START
+from advent_of_code_2025.day_07.common import parse_diagram_file as parse
+from advent_of_code_2025.registry import print_answers
 
 
-def count_splits(diagram: t.List[t.List[str]]) -> int:
+def count_splits(diagram: t.List[bytes]) -> int:
     """Count the number of beam splits in the input diagram
 
     Args:
-        diagram (t.List[t.List[str]]): Input diagram.
+        diagram (t.List[bytes]): Input diagram.
 
     Returns:
         int: Number of beam splits in the diagram.
     """
     tachyons_idx: t.Set[int] = set()
-    tachyons_idx.add(diagram[0].index("S"))
+    tachyons_idx.add(diagram[0].index(START))
     splits: int = 0
     for line in diagram:
         for x, char in enumerate(line):
-            if char == "^" and x in tachyons_idx:
+            if char == SPLITTER and x in tachyons_idx:
                 splits += 1
                 tachyons_idx.remove(x)
                 if x - 1 >= 0:
@@ -29,16 +31,21 @@ def count_splits(diagram: t.List[t.List[str]]) -> int:
     return splits
 
 
+def solve(diagram: t.List[bytes]) -> int:
+    """Solve the part from the parsed input.
+
+    Args:
+        diagram (t.List[bytes]): Parsed diagram.
+
+    Returns:
+        int: Number of beam splits.
+    """
+    return count_splits(diagram)
+
+
 def main() -> None:
     """Main function."""
-    splits_count: int
-    splits_count = count_splits(
-        parse_diagram_file(file_name="inputs/example.txt")
-    )
-    print(f"Example output: {splits_count}")
-
-    splits_count = count_splits(parse_diagram_file(file_name="inputs/real.txt"))
-    print(f"Real output: {splits_count}")
+    print_answers(parse, solve)
 
 
 if __name__ == "__main__":
@@ -2,13 +2,17 @@
 
 import typing as t
 
-import networkx as nx
+from advent_of_code_2025.day_07.common import SPLITTER, START
+from advent_of_code_2025.day_07.common import parse_diagram_file as parse
+from advent_of_code_2025.registry import print_answers
 
-from advent_of_code_2025.day_07.common import parse_diagram_file
+# networkx is slow to import, it is only loaded when a diagram is solved
+if t.TYPE_CHECKING:
+    import networkx as nx
 
 
 def rec_count_paths(
-    graph: nx.DiGraph,
+    graph: "nx.DiGraph",
     current: t.Tuple[int, int],
     targets: t.Set[t.Tuple[int, int]],
     cache: t.Dict[t.Tuple[int, int], int] | None = None,
@@ -48,20 +52,22 @@ def rec_count_paths(
     return paths_count
 
 
-def count_timelines(diagram: t.List[t.List[str]]) -> int:
+def count_timelines(diagram: t.List[bytes]) -> int:
     """Count the number of possible timelines through the diagram.
 
     Args:
-        diagram (t.List[t.List[str]]):
+        diagram (t.List[bytes]):
             Input diagram.
 
     Returns:
         int:
             Number of possible timelines through the diagram.
     """
+    import networkx as nx  # pylint: disable=import-outside-toplevel
+
     rows: int = len(diagram)
     columns: int = len(diagram[0])
-    start_node: t.Tuple[int, int] = (diagram[0].index("S"), 0)
+    start_node: t.Tuple[int, int] = (diagram[0].index(START), 0)
 
     # Graph of all possible paths
     graph: nx.DiGraph = nx.DiGraph()
@@ -74,7 +80,7 @@ def count_timelines(diagram: t.List[t.List[str]]) -> int:
     # Compute all possible paths through the diagram
     for y, line in enumerate(diagram):
         for x, char in enumerate(line):
-            if char == "^" and x in tachyons_idx:
+            if char == SPLITTER and x in tachyons_idx:
                 tachyons_idx.remove(x)
                 if x - 1 >= 0:
                     graph.add_edge((x, y), (x - 1, y + 1))
@@ -93,18 +99,21 @@ def count_timelines(diagram: t.List[t.List[str]]) -> int:
     return rec_count_paths(graph, start_node, bottom_nodes)
 
 
+def solve(diagram: t.List[bytes]) -> int:
+    """Solve the part from the parsed input.
+
+    Args:
+        diagram (t.List[bytes]): Parsed diagram.
+
+    Returns:
+        int: Number of timelines.
+    """
+    return count_timelines(diagram)
+
+
 def main() -> None:
     """Main function."""
-    timelines_count: int
-    timelines_count = count_timelines(
-        parse_diagram_file(file_name="inputs/example.txt")
-    )
-    print(f"Example output: {timelines_count}")
-
-    timelines_count = count_timelines(
-        parse_diagram_file(file_name="inputs/real.txt")
-    )
-    print(f"Real output: {timelines_count}")
+    print_answers(parse, solve)
 
 
 if __name__ == "__main__":
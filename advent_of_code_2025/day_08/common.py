@@ -6,6 +6,9 @@ import typing as t
 import uuid
 from pathlib import Path
 
+from advent_of_code_2025.metrics import METRICS
+from advent_of_code_2025.puzzle_input import InputSource, iter_lines
+
 
 class Position(t.NamedTuple):
     """3D Position representation."""
@@ -15,23 +18,29 @@ class Position(t.NamedTuple):
     z: int
 
 
-def parse_positions_file(file_name: str) -> t.List[Position]:
+def iter_positions(source: InputSource) -> t.Iterator[Position]:
+    """Lazily parse 3D positions from an input source.
+
+    Args:
+        source (InputSource): File name or stream containing 3D positions.
+
+    Yields:
+        Position: 3D position.
+    """
+    for line in iter_lines(source, Path(__file__).parent):
+        yield Position(*map(int, line.split(",")))
+
+
+def parse_positions_file(source: InputSource) -> t.List[Position]:
     """Parse list of 3D positions from a TXT file.
 
     Args:
-        file_name (str): Name of the file containing 3D positions.
+        source (InputSource): File name or stream containing 3D positions.
 
     Returns:
         t.List[Position]: List of Position objects representing 3D positions.
     """
-    positions: t.List[Position] = []
-    file_path: Path = Path(__file__).parent / file_name
-    with open(file_path, "r", encoding="utf-8") as input_fd:
-        positions = [
-            Position(*map(int, line.split(",")))
-            for line in input_fd.read().splitlines()
-        ]
-    return positions
+    return list(iter_positions(source))
 
 
 def compute_distance(point_a: Position, point_b: Position) -> float:
@@ -84,6 +93,8 @@ def find_in_circuit(
     Returns:
         t.Optional[uuid.UUID] | None: Circuit ID if found, otherwise None.
     """
+    if METRICS.enabled:
+        METRICS.increment("day08.circuit_lookups")
     return next(
         (k for k, circuit in circuits.items() if point in circuit), None
     )
@@ -0,0 +1,22 @@
+"""Synthetic input generator for the Day 08"""
+
+import random
+import typing as t
+
+MAX_COORDINATE: int = 99_999
+
+
+def generate(scale: int, rng: random.Random) -> t.Iterator[str]:
+    """Generate 3D positions of junction boxes, one per line.
+
+    Args:
+        scale (int): Number of junction boxes.
+        rng (random.Random): Seeded random generator.
+
+    Yields:
+        str: Lines of the input.
+    """
+    for _ in range(scale):
+        yield ",".join(
+            str(rng.randint(0, MAX_COORDINATE)) for _ in range(3)
+        ) + "\n"
@@ -8,8 +8,17 @@ from advent_of_code_2025.day_08.common import (
     Position,
     compute_sorted_distances,
     find_in_circuit,
-    parse_positions_file,
 )
+from advent_of_code_2025.day_08.common import parse_positions_file as parse
+from advent_of_code_2025.metrics import METRICS
+from advent_of_code_2025.registry import print_answers
+
+MAX_CONNECTIONS: int = 1000
+
+# The example only connects its 10 closest pairs of junction boxes
+INPUT_OPTIONS: t.Dict[str, t.Dict[str, t.Any]] = {
+    "inputs/example.txt": {"max_connections": 10},
+}
 
 
 def compute_result(  # pylint: disable=duplicate-code
@@ -44,6 +53,8 @@ def compute_result(  # pylint: disable=duplicate-code
                 continue
             # Both points are in different circuits -> Merge circuits
             if circuit_a != circuit_b:
+                if METRICS.enabled:
+                    METRICS.increment("day08.unions")
                 circuits[circuit_a].update(circuits[circuit_b])
                 del circuits[circuit_b]
                 connections += 1
@@ -67,18 +78,25 @@ def compute_result(  # pylint: disable=duplicate-code
     )
 
 
+def solve(
+    positions: t.List[Position], max_connections: int = MAX_CONNECTIONS
+) -> int:
+    """Solve the part from the parsed input.
+
+    Args:
+        positions (t.List[Position]): Parsed positions.
+        max_connections (int, optional): Number of closest pairs to connect.
+            Defaults to MAX_CONNECTIONS.
+
+    Returns:
+        int: Product of the sizes of the three largest circuits.
+    """
+    return compute_result(positions, max_connections=max_connections)
+
+
 def main() -> None:
     """Main function."""
-    result: int
-    result = compute_result(
-        parse_positions_file(file_name="inputs/example.txt"), max_connections=10
-    )
-    print(f"Example output: {result}")
-
-    result = compute_result(
-        parse_positions_file(file_name="inputs/real.txt"), max_connections=1000
-    )
-    print(f"Real output: {result}")
+    print_answers(parse, solve, options=INPUT_OPTIONS)
 
 
 if __name__ == "__main__":
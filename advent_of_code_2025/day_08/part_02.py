@@ -7,8 +7,10 @@ from advent_of_code_2025.day_08.common import (
     Position,
     compute_sorted_distances,
     find_in_circuit,
-    parse_positions_file,
 )
+from advent_of_code_2025.day_08.common import parse_positions_file as parse
+from advent_of_code_2025.metrics import METRICS
+from advent_of_code_2025.registry import print_answers
 
 
 def compute_result(
@@ -43,6 +45,8 @@ def compute_result(
                 continue
             # Both points are in different circuits -> Merge circuits
             if circuit_a != circuit_b:
+                if METRICS.enabled:
+                    METRICS.increment("day08.unions")
                 circuits[circuit_a].update(circuits[circuit_b])
                 del circuits[circuit_b]
                 connections += 1
@@ -64,16 +68,21 @@ def compute_result(
     return -1
 
 
+def solve(positions: t.List[Position]) -> int:
+    """Solve the part from the parsed input.
+
+    Args:
+        positions (t.List[Position]): Parsed positions.
+
+    Returns:
+        int: Product of the X coordinates of the last connected pair.
+    """
+    return compute_result(positions)
+
+
 def main() -> None:
     """Main function."""
-    result: int
-    result = compute_result(
-        parse_positions_file(file_name="inputs/example.txt")
-    )
-    print(f"Example output: {result}")
-
-    result = compute_result(parse_positions_file(file_name="inputs/real.txt"))
-    print(f"Real output: {result}")
+    print_answers(parse, solve)
 
 
 if __name__ == "__main__":
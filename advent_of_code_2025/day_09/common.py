@@ -3,6 +3,8 @@
 import typing as t
 from pathlib import Path
 
+from advent_of_code_2025.puzzle_input import InputSource, iter_lines
+
 
 class Position(t.NamedTuple):
     """2D Position representation."""
@@ -18,23 +20,29 @@ class Segment(t.NamedTuple):
     b: Position
 
 
-def parse_tiles_positions_file(file_name: str) -> t.List[Position]:
+def iter_tiles_positions(source: InputSource) -> t.Iterator[Position]:
+    """Lazily parse 2D positions from an input source.
+
+    Args:
+        source (InputSource): File name or stream containing 2D positions.
+
+    Yields:
+        Position: 2D position.
+    """
+    for line in iter_lines(source, Path(__file__).parent):
+        yield Position(*map(int, line.split(",")))
+
+
+def parse_tiles_positions_file(source: InputSource) -> t.List[Position]:
     """Parse list of 2D positions from a TXT file.
 
     Args:
-        file_name (str): Name of the file containing 2D positions.
+        source (InputSource): File name or stream containing 2D positions.
 
     Returns:
         t.List[Position]: List of Position objects representing 2D positions.
     """
-    tiles_positions: t.List[Position] = []
-    file_path: Path = Path(__file__).parent / file_name
-    with open(file_path, "r", encoding="utf-8") as input_fd:
-        tiles_positions = [
-            Position(*map(int, line.split(",")))
-            for line in input_fd.read().splitlines()
-        ]
-    return tiles_positions
+    return list(iter_tiles_positions(source))
 
 
 def compute_rectangle_area(point_a: Position, point_b: Position) -> int:
@@ -0,0 +1,77 @@
+"""Synthetic input generator for the Day 09"""
+
+import random
+import typing as t
+
+# Coordinates span a few cells per step, so that the cost of the part 2,
+# which follows the perimeter of the polygon, grows with the scale
+GRID_SIZE_PER_STEP: int = 4
+MIN_GRID_SIZE: int = 16
+
+
+def generate_rows(
+    steps: int, rows_range: t.Tuple[int, int], rng: random.Random
+) -> t.List[int]:
+    """Generate the distinct rows of the steps of a profile, rising then
+    falling so that its vertical edges stay short.
+
+    Args:
+        steps (int): Number of horizontal steps.
+        rows_range (t.Tuple[int, int]): Lowest and highest rows of the steps.
+        rng (random.Random): Seeded random generator.
+
+    Returns:
+        t.List[int]: Row of each step.
+    """
+    rising: t.List[int] = []
+    falling: t.List[int] = []
+    for row in sorted(
+        rng.sample(range(rows_range[0], rows_range[1] + 1), steps)
+    ):
+        (rising if rng.random() < 0.5 else falling).append(row)
+    return rising + falling[::-1]
+
+
+def generate(scale: int, rng: random.Random) -> t.Iterator[str]:
+    """Generate the red tiles of a closed rectilinear polygon, in order,
+    so that two consecutive tiles always share a row or a column.
+    The polygon is bounded by a top and a bottom staircase profile.
+
+    Args:
+        scale (int): Number of red tiles, rounded to a multiple of 4.
+        rng (random.Random): Seeded random generator.
+
+    Yields:
+        str: Lines of the input.
+    """
+    steps: int = max(1, scale // 4)
+    grid_size: int = max(MIN_GRID_SIZE, GRID_SIZE_PER_STEP * steps)
+    first_column: int = rng.randint(0, grid_size // 10)
+    last_column: int = grid_size - 1 - rng.randint(0, grid_size // 10)
+    # Every row and column holds a single edge, as in the puzzle inputs
+    inner_columns: t.List[int] = rng.sample(
+        range(first_column + 1, last_column), 2 * (steps - 1)
+    )
+    top_columns: t.List[int] = [
+        first_column,
+        *sorted(inner_columns[: steps - 1]),
+        last_column,
+    ]
+    bottom_columns: t.List[int] = [
+        first_column,
+        *sorted(inner_columns[steps - 1 :]),
+        last_column,
+    ]
+    top_rows: t.List[int] = generate_rows(steps, (0, grid_size // 2 - 1), rng)
+    bottom_rows: t.List[int] = generate_rows(
+        steps, (grid_size // 2, grid_size - 1), rng
+    )
+
+    # Top profile from left to right
+    for index, row in enumerate(top_rows):
+        yield f"{top_columns[index]},{row}\n"
+        yield f"{top_columns[index + 1]},{row}\n"
+    # Bottom profile from right to left
+    for index in reversed(range(steps)):
+        yield f"{bottom_columns[index + 1]},{bottom_rows[index]}\n"
+        yield f"{bottom_columns[index]},{bottom_rows[index]}\n"
@@ -3,11 +3,11 @@
 import itertools
 import typing as t
 
+from advent_of_code_2025.day_09.common import Position, compute_rectangle_area
 from advent_of_code_2025.day_09.common import (
-    Position,
-    compute_rectangle_area,
-    parse_tiles_positions_file,
+    parse_tiles_positions_file as parse,
 )
+from advent_of_code_2025.registry import print_answers
 
 
 def compute_biggest_rectangle_area(positions: t.List[Position]) -> int:
@@ -31,18 +31,21 @@ def compute_biggest_rectangle_area(positions: t.List[Position]) -> int:
     return sorted_areas[0][0]
 
 
+def solve(positions: t.List[Position]) -> int:
+    """Solve the part from the parsed input.
+
+    Args:
+        positions (t.List[Position]): Parsed red tiles positions.
+
+    Returns:
+        int: Area of the biggest rectangle.
+    """
+    return compute_biggest_rectangle_area(positions)
+
+
 def main() -> None:
     """Main function."""
-    biggest_rectangle_area: int
-    biggest_rectangle_area = compute_biggest_rectangle_area(
-        parse_tiles_positions_file(file_name="inputs/example.txt")
-    )
-    print(f"Example output: {biggest_rectangle_area}")
-
-    biggest_rectangle_area = compute_biggest_rectangle_area(
-        parse_tiles_positions_file(file_name="inputs/real.txt")
-    )
-    print(f"Real output: {biggest_rectangle_area}")
+    print_answers(parse, solve)
 
 
 if __name__ == "__main__":
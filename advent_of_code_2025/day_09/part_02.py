@@ -7,8 +7,11 @@ from advent_of_code_2025.day_09.common import (
     Position,
     Segment,
     compute_rectangle_area,
-    parse_tiles_positions_file,
 )
+from advent_of_code_2025.day_09.common import (
+    parse_tiles_positions_file as parse,
+)
+from advent_of_code_2025.registry import print_answers
 
 SHAPE_EDGES: t.Set[Position] = set()
 
@@ -131,12 +134,14 @@ def compute_lines_and_columns(
 
 def compute_shape_edges(red_points: t.List[Position]) -> None:
     """Compute edges of the shape defined by all red points.
+    Edges of any previously computed shape are discarded.
 
     Args:
         red_points (t.List[Position]): List of 2D positions of red points
     """
     global SHAPE_EDGES  # pylint: disable=global-statement
 
+    SHAPE_EDGES = set()
     for point_a, point_b in itertools.combinations(red_points, 2):
         if point_a[1] == point_b[1]:
             min_x_pair = min(point_a[0], point_b[0])
@@ -216,19 +221,21 @@ def compute_biggest_rectangle_area_in_shape(
     return -1
 
 
+def solve(red_points: t.List[Position]) -> int:
+    """Solve the part from the parsed input.
+
+    Args:
+        red_points (t.List[Position]): Parsed red tiles positions.
+
+    Returns:
+        int: Area of the biggest rectangle fully inside the shape.
+    """
+    return compute_biggest_rectangle_area_in_shape(red_points)
+
+
 def main() -> None:
     """Main function."""
-    biggest_rectangle_area_in_shape: int
-    biggest_rectangle_area_in_shape = compute_biggest_rectangle_area_in_shape(
-        parse_tiles_positions_file(file_name="inputs/example.txt")
-    )
-    print(f"Example output: {biggest_rectangle_area_in_shape}")
-
-    biggest_rectangle_area_in_shape = compute_biggest_rectangle_area_in_shape(
-        parse_tiles_positions_file(file_name="inputs/real.txt")
-    )
-    print(f"Real output: {biggest_rectangle_area_in_shape}")
-    # Result is 1652344888
+    print_answers(parse, solve)
 
 
 if __name__ == "__main__":
@@ -4,6 +4,8 @@ import re
 import typing as t
 from pathlib import Path
 
+from advent_of_code_2025.puzzle_input import InputSource, iter_lines
+
 
 class Machine:  # pylint: disable=too-few-public-methods
     """Class representing a machine
@@ -44,17 +46,26 @@ class Machine:  # pylint: disable=too-few-public-methods
         )
 
 
-def parse_machines_file(file_name: str) -> t.List[Machine]:
+def iter_machines(source: InputSource) -> t.Iterator[Machine]:
+    """Lazily parse machines from an input source.
+
+    Args:
+        source (InputSource): File name or stream to parse.
+
+    Yields:
+        Machine: Machine instance.
+    """
+    for line in iter_lines(source, Path(__file__).parent):
+        yield Machine(line)
+
+
+def parse_machines_file(source: InputSource) -> t.List[Machine]:
     """Parse TXT input file and generate list of machines.
 
     Args:
-        file_name (str): Name of the file to parse.
+        source (InputSource): File name or stream to parse.
 
     Returns:
         t.List[Machine]: List of Machine instances.
     """
-    machines: t.List[Machine]
-    file_path: Path = Path(__file__).parent / file_name
-    with open(file_path, "r", encoding="utf-8") as input_fd:
-        machines = [Machine(line) for line in input_fd.read().splitlines()]
-    return machines
+    return list(iter_machines(source))
@@ -0,0 +1,63 @@
+"""Synthetic input generator for the Day 10"""
+
+import random
+import typing as t
+
+MIN_LIGHTS: int = 4
+MAX_LIGHTS: int = 10
+MAX_PRESSES: int = 20
+
+
+def generate_machine(rng: random.Random) -> str:
+    """Generate a machine that is solvable for both parts.
+    Its lights diagram is the result of pressing a subset of its buttons
+    once, and its joltage the result of pressing each button a random
+    number of times.
+
+    Args:
+        rng (random.Random): Seeded random generator.
+
+    Returns:
+        str: Line describing the machine.
+    """
+    lights_count: int = rng.randint(MIN_LIGHTS, MAX_LIGHTS)
+    buttons: t.List[t.List[int]] = [
+        sorted(rng.sample(range(lights_count), rng.randint(1, lights_count)))
+        for _ in range(rng.randint(3, lights_count + 3))
+    ]
+    # Every light is wired to at least one button
+    for light in set(range(lights_count)).difference(*buttons):
+        rng.choice(buttons).append(light)
+    for button in buttons:
+        button.sort()
+
+    lights: t.List[int] = [0] * lights_count
+    joltage: t.List[int] = [0] * lights_count
+    for button in buttons:
+        toggled: bool = rng.random() < 0.5
+        presses: int = rng.randint(0, MAX_PRESSES)
+        for light in button:
+            lights[light] ^= toggled
+            joltage[light] += presses
+
+    return " ".join(
+        [
+            "[" + "".join(".#"[light] for light in lights) + "]",
+            *("(" + ",".join(map(str, button)) + ")" for button in buttons),
+            "{" + ",".join(map(str, joltage)) + "}",
+        ]
+    )
+
+
+def generate(scale: int, rng: random.Random) -> t.Iterator[str]:
+    """Generate machines, one per line.
+
+    Args:
+        scale (int): Number of machines.
+        rng (random.Random): Seeded random generator.
+
+    Yields:
+        str: Lines of the input.
+    """
+    for _ in range(scale):
+        yield generate_machine(rng) + "\n"
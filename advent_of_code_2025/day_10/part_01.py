@@ -3,7 +3,10 @@
 import typing as t
 from itertools import product
 
-from advent_of_code_2025.day_10.common import Machine, parse_machines_file
+from advent_of_code_2025.day_10.common import Machine
+from advent_of_code_2025.day_10.common import iter_machines as parse
+from advent_of_code_2025.metrics import METRICS
+from advent_of_code_2025.registry import print_answers
 
 
 def bruteforce_min_pressed_buttons(machine: Machine) -> int:
@@ -17,6 +20,8 @@ def bruteforce_min_pressed_buttons(machine: Machine) -> int:
         int: Minimum number of buttons to press.
     """
     pressed_buttons: t.List[int] = []
+    if METRICS.enabled:
+        METRICS.increment("day10.combinations_tried", 2 ** len(machine.buttons))
     for solution in product([0, 1], repeat=len(machine.buttons)):
         initial_state = [0] * len(machine.indicator_lights_diagram)
         for button_index, pressed in enumerate(solution):
@@ -29,12 +34,12 @@ def bruteforce_min_pressed_buttons(machine: Machine) -> int:
     return sorted_pressed_buttons[0]
 
 
-def compute_min_pressed_sum(machines: t.List[Machine]) -> int:
+def compute_min_pressed_sum(machines: t.Iterable[Machine]) -> int:
     """Compute the sum of minimum number
         of pressed buttons for a list of machines.
 
     Args:
-        machines (t.List[Machine]): List of machines to process.
+        machines (t.Iterable[Machine]): Machines to process.
 
     Returns:
         int: Minimum number of pressed buttons across all machines.
@@ -42,18 +47,21 @@ def compute_min_pressed_sum(machines: t.List[Machine]) -> int:
     return sum(bruteforce_min_pressed_buttons(machine) for machine in machines)
 
 
+def solve(machines: t.Iterable[Machine]) -> int:
+    """Solve the part from the parsed input.
+
+    Args:
+        machines (t.Iterable[Machine]): Parsed machines.
+
+    Returns:
+        int: Minimum number of button presses to configure the lights.
+    """
+    return compute_min_pressed_sum(machines)
+
+
 def main() -> None:
     """Main function."""
-    min_pressed_sum: int
-    min_pressed_sum = compute_min_pressed_sum(
-        parse_machines_file(file_name="inputs/example.txt")
-    )
-    print(f"Example output: {min_pressed_sum}")
-
-    min_pressed_sum = compute_min_pressed_sum(
-        parse_machines_file(file_name="inputs/real.txt")
-    )
-    print(f"Real output: {min_pressed_sum}")
+    print_answers(parse, solve)
 
 
 if __name__ == "__main__":
@@ -2,10 +2,10 @@
 
 import typing as t
 
-import numpy as np
-import pulp
-
-from advent_of_code_2025.day_10.common import Machine, parse_machines_file
+from advent_of_code_2025.day_10.common import Machine
+from advent_of_code_2025.day_10.common import iter_machines as parse
+from advent_of_code_2025.metrics import METRICS
+from advent_of_code_2025.registry import print_answers
 
 
 def list_min_buttons_pressed_count(machine: Machine) -> t.List[int]:
@@ -21,6 +21,11 @@ def list_min_buttons_pressed_count(machine: Machine) -> t.List[int]:
     Returns:
         t.List[int]: Number of times each button should be pressed
     """
+    # numpy and pulp are slow to import, they are only loaded when needed
+    # pylint: disable-next=import-outside-toplevel
+    import numpy as np
+    import pulp  # pylint: disable=import-outside-toplevel
+
     joltage_count: int = len(machine.joltage)
     buttons_count: int = len(machine.buttons)
 
@@ -62,17 +67,20 @@ def list_min_buttons_pressed_count(machine: Machine) -> t.List[int]:
         )
 
     # Solve the optimization problem
-    optimization_problem.solve(pulp.PULP_CBC_CMD(msg=0))
+    with METRICS.timer("day10.lp_solve"):
+        optimization_problem.solve(pulp.PULP_CBC_CMD(msg=0))
 
     # Extract and return the minimum button press counts
     return [int(var.value()) for var in button_press_counts]
 
 
-def compute_min_pressed_buttons_count_2(machines: t.List[Machine]) -> int:
+def compute_min_pressed_buttons_count_2(
+    machines: t.Iterable[Machine],
+) -> int:
     """Compute the minimum number of pressed buttons for a list of machines.
 
     Args:
-        machines (t.List[Machine]): List of machines to process.
+        machines (t.Iterable[Machine]): Machines to process.
 
     Returns:
         int: Minimum number of pressed buttons across all machines.
@@ -85,18 +93,21 @@ def compute_min_pressed_buttons_count_2(machines: t.List[Machine]) -> int:
     return pressed_count
 
 
+def solve(machines: t.Iterable[Machine]) -> int:
+    """Solve the part from the parsed input.
+
+    Args:
+        machines (t.Iterable[Machine]): Parsed machines.
+
+    Returns:
+        int: Minimum number of button presses to configure the joltage.
+    """
+    return compute_min_pressed_buttons_count_2(machines)
+
+
 def main() -> None:
     """Main function."""
-    min_pressed_count: int
-    min_pressed_count = compute_min_pressed_buttons_count_2(
-        parse_machines_file(file_name="inputs/example.txt")
-    )
-    print(f"Example output: {min_pressed_count}")
-
-    min_pressed_count = compute_min_pressed_buttons_count_2(
-        parse_machines_file(file_name="inputs/real.txt")
-    )
-    print(f"Real output: {min_pressed_count}")
+    print_answers(parse, solve)
 
 
 if __name__ == "__main__":
@@ -3,23 +3,21 @@
 import typing as t
 from pathlib import Path
 
+from advent_of_code_2025.puzzle_input import InputSource, iter_lines
 
-def parse_mapping_file(file_name: str) -> t.Dict[str, t.List[str]]:
+
+def parse_mapping_file(source: InputSource) -> t.Dict[str, t.List[str]]:
     """Parse TXT input file and generate a mapping of nodes to their neighbors.
 
     Args:
-        file_name (str): Name of the file to parse.
+        source (InputSource): File name or stream to parse.
 
     Returns:
         t.Dict[str, t.List[str]]:
             Dictionary where keys are node names
             and values are lists of neighboring node names.
     """
-    mapping: t.Dict[str, t.List[str]] = {}
-    file_path: Path = Path(__file__).parent / file_name
-    with open(file_path, "r", encoding="utf-8") as input_fd:
-        mapping = {
-            line.split(": ")[0]: list(line.split(": ")[1].split(" "))
-            for line in input_fd.read().splitlines()
-        }
-    return mapping
+    return {
+        line.split(": ")[0]: list(line.split(": ")[1].split(" "))
+        for line in iter_lines(source, Path(__file__).parent)
+    }
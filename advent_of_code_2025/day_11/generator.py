@@ -0,0 +1,81 @@
+"""Synthetic input generator for the Day 11"""
+
+import random
+import string
+import typing as t
+
+RESERVED_DEVICES: t.Tuple[str, ...] = ("svr", "you", "fft", "dac", "out")
+# Weights of having 0, 1 or 2 shortcuts to one of the next devices
+SHORTCUTS_WEIGHTS: t.Tuple[int, ...] = (6, 3, 1)
+SHORTCUTS_WINDOW: int = 8
+
+
+def generate_names(count: int, rng: random.Random) -> t.List[str]:
+    """Generate unique random device names, distinct from the reserved ones.
+
+    Args:
+        count (int): Number of names.
+        rng (random.Random): Seeded random generator.
+
+    Returns:
+        t.List[str]: Device names.
+    """
+    letters: str = string.ascii_lowercase
+    length: int = 3
+    while len(letters) ** length < 2 * (count + len(RESERVED_DEVICES)):
+        length += 1
+
+    names: t.List[str] = []
+    for code in rng.sample(range(len(letters) ** length), count + 5):
+        name: str = ""
+        for _ in range(length):
+            code, letter = divmod(code, len(letters))
+            name += letters[letter]
+        if name not in RESERVED_DEVICES:
+            names.append(name)
+    return names[:count]
+
+
+def generate(scale: int, rng: random.Random) -> t.Iterator[str]:
+    """Generate a directed acyclic graph of devices and their outputs,
+    one device per line, in random order.
+    Devices are chained in topological order, with a few shortcuts to the
+    next devices, so every device leads to `out` and `svr` reaches `fft`,
+    which reaches `dac`. The number of paths grows exponentially with the
+    scale, `you` sits near the end to keep the first part tractable.
+
+    Args:
+        scale (int): Number of devices (at least 5).
+        rng (random.Random): Seeded random generator.
+
+    Yields:
+        str: Lines of the input.
+    """
+    count: int = max(scale, len(RESERVED_DEVICES))
+    devices: t.List[str] = generate_names(count - 5, rng)
+    # Devices are listed in topological order
+    devices.insert(0, "svr")
+    devices.insert(len(devices) // 3, "fft")
+    devices.insert(2 * len(devices) // 3, "dac")
+    devices.insert(9 * len(devices) // 10, "you")
+    devices.append("out")
+
+    lines: t.List[str] = []
+    for index, device in enumerate(devices[:-1]):
+        # Chaining every device to the next one keeps them all connected
+        outputs: t.List[str] = [devices[index + 1]]
+        shortcuts: t.List[str] = devices[index + 2 : index + SHORTCUTS_WINDOW]
+        outputs += rng.sample(
+            shortcuts,
+            min(
+                len(shortcuts),
+                rng.choices(range(len(SHORTCUTS_WEIGHTS)), SHORTCUTS_WEIGHTS)[
+                    0
+                ],
+            ),
+        )
+        rng.shuffle(outputs)
+        lines.append(f"{device}: {' '.join(outputs)}\n")
+
+    rng.shuffle(lines)
+    yield from lines
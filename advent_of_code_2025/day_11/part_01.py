@@ -2,7 +2,14 @@
 
 import typing as t
 
-from advent_of_code_2025.day_11.common import parse_mapping_file
+from advent_of_code_2025.day_11.common import parse_mapping_file as parse
+from advent_of_code_2025.metrics import METRICS
+from advent_of_code_2025.registry import print_answers
+
+INPUTS: t.Dict[str, str] = {
+    "Example": "inputs/example_1.txt",
+    "Real": "inputs/real.txt",
+}
 
 
 def rec_count_valid_paths(
@@ -20,6 +27,8 @@ def rec_count_valid_paths(
     Returns:
         int: The number of valid paths found.
     """
+    if METRICS.enabled:
+        METRICS.increment("day11.recursive_calls")
     for neighbor in mapping[current_path[-1]]:
         if neighbor == "out":
             validated_paths.append(current_path + [neighbor])
@@ -32,18 +41,21 @@ def rec_count_valid_paths(
     return len(validated_paths)
 
 
+def solve(mapping: t.Dict[str, t.List[str]]) -> int:
+    """Solve the part from the parsed input.
+
+    Args:
+        mapping (t.Dict[str, t.List[str]]): Parsed devices mapping.
+
+    Returns:
+        int: Number of valid paths.
+    """
+    return rec_count_valid_paths(mapping, [], ["you"])
+
+
 def main() -> None:
     """Main function."""
-    valid_paths_count: int
-    valid_paths_count = rec_count_valid_paths(
-        parse_mapping_file(file_name="inputs/example_1.txt"), [], ["you"]
-    )
-    print(f"Example output: {valid_paths_count}")
-
-    valid_paths_count = rec_count_valid_paths(
-        parse_mapping_file(file_name="inputs/real.txt"), [], ["you"]
-    )
-    print(f"Real output: {valid_paths_count}")
+    print_answers(parse, solve, INPUTS)
 
 
 if __name__ == "__main__":
@@ -3,7 +3,14 @@
 import typing as t
 from collections import defaultdict
 
-from advent_of_code_2025.day_11.common import parse_mapping_file
+from advent_of_code_2025.day_11.common import parse_mapping_file as parse
+from advent_of_code_2025.metrics import METRICS
+from advent_of_code_2025.registry import print_answers
+
+INPUTS: t.Dict[str, str] = {
+    "Example": "inputs/example_2.txt",
+    "Real": "inputs/real.txt",
+}
 
 
 def reverse_graph(graph: t.Dict[str, t.List[str]]) -> t.Dict[str, t.List[str]]:
@@ -85,6 +92,8 @@ def list_paths_in_graph(
     stack: t.List[t.Tuple[str, t.List[str]]] = [(start, [start])]
     while stack:
         node, path = stack.pop()
+        if METRICS.enabled:
+            METRICS.increment("day11.explored_nodes")
         if node == end:
             yield list(path)
         for neighbor in graph.get(node, []):
@@ -132,18 +141,21 @@ def optimize_graph_and_count_paths(graph: t.Dict[str, t.List[str]]) -> int:
     return paths_count
 
 
+def solve(mapping: t.Dict[str, t.List[str]]) -> int:
+    """Solve the part from the parsed input.
+
+    Args:
+        mapping (t.Dict[str, t.List[str]]): Parsed devices mapping.
+
+    Returns:
+        int: Number of valid paths.
+    """
+    return optimize_graph_and_count_paths(mapping)
+
+
 def main() -> None:
     """Main function."""
-    valid_paths_count: int
-    valid_paths_count = optimize_graph_and_count_paths(
-        parse_mapping_file(file_name="inputs/example_2.txt")
-    )
-    print(f"Example output: {valid_paths_count}")
-
-    valid_paths_count = optimize_graph_and_count_paths(
-        parse_mapping_file(file_name="inputs/real.txt")
-    )
-    print(f"Real output: {valid_paths_count}")
+    print_answers(parse, solve, INPUTS)
 
 
 if __name__ == "__main__":
@@ -3,6 +3,8 @@
 import typing as t
 from pathlib import Path
 
+from advent_of_code_2025.puzzle_input import InputSource, iter_records
+
 
 class GiftShape:  # pylint: disable=too-few-public-methods
     """Gift 2D shape representation."""
@@ -211,12 +213,12 @@ class Region:  # pylint: disable=too-few-public-methods
 
 
 def parse_gifts_and_regions_file(
-    file_name: str,
+    source: InputSource,
 ) -> t.Tuple[t.List[Gift], t.List[Region]]:
     """Parse gifts and regions from file.
 
     Args:
-        file_name (str): File name.
+        source (InputSource): File name or stream to parse.
 
     Returns:
         t.Tuple[t.List[Gift], t.List[Region]]:
@@ -224,12 +226,12 @@ def parse_gifts_and_regions_file(
     """
     gifts: t.List[Gift] = []
     regions: t.List[Region] = []
-    file_path: Path = Path(__file__).parent / file_name
-    with open(file_path, "r", encoding="utf-8") as input_fd:
-        raw_blocks: t.List[str] = input_fd.read().split("\n\n")
-        for raw_gift in raw_blocks[:-1]:
-            gifts.append(Gift(raw_gift.split("\n")))
-        for region_id, raw_region in enumerate(raw_blocks[-1].split("\n")):
-            if len(raw_region):
-                regions.append(Region(region_id, raw_region))
+    raw_blocks: t.List[str] = list(
+        iter_records(source, Path(__file__).parent, "\n\n")
+    )
+    for raw_gift in raw_blocks[:-1]:
+        gifts.append(Gift(raw_gift.split("\n")))
+    for region_id, raw_region in enumerate(raw_blocks[-1].split("\n")):
+        if len(raw_region):
+            regions.append(Region(region_id, raw_region))
     return gifts, regions
@@ -0,0 +1,73 @@
+"""Synthetic input generator for the Day 12"""
+
+import random
+import typing as t
+
+GIFTS_COUNT: int = 6
+SHAPE_SIZE: int = 3
+SHAPE_AREA: int = 7
+MIN_REGION_SIZE: int = 35
+MAX_REGION_SIZE: int = 50
+
+
+def generate_shape(rng: random.Random) -> t.List[str]:
+    """Generate a gift shape: a 3x3 square with 2 empty cells.
+
+    Args:
+        rng (random.Random): Seeded random generator.
+
+    Returns:
+        t.List[str]: Rows of the shape.
+    """
+    cells: t.Set[int] = set(rng.sample(range(SHAPE_SIZE**2), SHAPE_AREA))
+    return [
+        "".join(
+            "#" if row * SHAPE_SIZE + column in cells else "."
+            for column in range(SHAPE_SIZE)
+        )
+        for row in range(SHAPE_SIZE)
+    ]
+
+
+def generate_region(rng: random.Random) -> str:
+    """Generate a region and the number of gifts of each shape to fit in.
+    Half of the regions are trivially valid, with fewer gifts than
+    3x3 slots, and the other half trivially invalid, with more gift
+    cells than region cells.
+
+    Args:
+        rng (random.Random): Seeded random generator.
+
+    Returns:
+        str: Line describing the region.
+    """
+    width: int = rng.randint(MIN_REGION_SIZE, MAX_REGION_SIZE)
+    height: int = rng.randint(MIN_REGION_SIZE, MAX_REGION_SIZE)
+    gifts_count: int
+    if rng.random() < 0.5:
+        slots: int = (width // SHAPE_SIZE) * (height // SHAPE_SIZE)
+        gifts_count = rng.randint(slots // 2, 9 * slots // 10)
+    else:
+        cells: int = width * height // SHAPE_AREA
+        gifts_count = rng.randint(cells + 1, cells + 10)
+
+    counts: t.List[int] = [0] * GIFTS_COUNT
+    for gift_id in rng.choices(range(GIFTS_COUNT), k=gifts_count):
+        counts[gift_id] += 1
+    return f"{width}x{height}: {' '.join(map(str, counts))}"
+
+
+def generate(scale: int, rng: random.Random) -> t.Iterator[str]:
+    """Generate gift shapes, then regions to fill with gifts.
+
+    Args:
+        scale (int): Number of regions.
+        rng (random.Random): Seeded random generator.
+
+    Yields:
+        str: Lines of the input.
+    """
+    for gift_id in range(GIFTS_COUNT):
+        yield f"{gift_id}:\n" + "\n".join(generate_shape(rng)) + "\n\n"
+    for _ in range(scale):
+        yield generate_region(rng) + "\n"
@@ -2,12 +2,12 @@
 
 import typing as t
 
+from advent_of_code_2025.day_12.common import Gift, GiftShape, Region
 from advent_of_code_2025.day_12.common import (
-    Gift,
-    GiftShape,
-    Region,
-    parse_gifts_and_regions_file,
+    parse_gifts_and_regions_file as parse,
 )
+from advent_of_code_2025.metrics import METRICS
+from advent_of_code_2025.registry import print_answers
 
 
 def print_board(board: t.List[t.List[int]]) -> None:
@@ -126,6 +126,8 @@ def rec_backtrack_fits(
     Returns:
         bool: True all gifts fit, False otherwise.
     """
+    if METRICS.enabled:
+        METRICS.increment("day12.backtrack_nodes")
     if not remaining:
         return True
 
@@ -136,6 +138,8 @@ def rec_backtrack_fits(
         for pos_y in range(region.height - shape.height + 1):
             for pos_x in range(region.width - shape.width + 1):
                 if fits(board, shape, pos_x, pos_y):
+                    if METRICS.enabled:
+                        METRICS.increment("day12.placements")
                     place(board, shape, pos_x, pos_y)
 
                     if free_cells(board) >= sum(
@@ -190,18 +194,22 @@ def count_valid_regions(gifts: t.List[Gift], regions: t.List[Region]) -> int:
     return valid_regions
 
 
+def solve(gifts_and_regions: t.Tuple[t.List[Gift], t.List[Region]]) -> int:
+    """Solve the part from the parsed input.
+
+    Args:
+        gifts_and_regions (t.Tuple[t.List[Gift], t.List[Region]]):
+            Parsed gifts and regions.
+
+    Returns:
+        int: Number of regions that can fit their gifts.
+    """
+    return count_valid_regions(*gifts_and_regions)
+
+
 def main() -> None:
     """Main function."""
-    invalid_ids_sum: int
-    invalid_ids_sum = count_valid_regions(
-        *parse_gifts_and_regions_file(file_name="inputs/example.txt")
-    )
-    print(f"Example output: {invalid_ids_sum}")
-
-    invalid_ids_sum = count_valid_regions(
-        *parse_gifts_and_regions_file(file_name="inputs/real.txt")
-    )
-    print(f"Real output: {invalid_ids_sum}")
+    print_answers(parse, solve)
 
 
 if __name__ == "__main__":
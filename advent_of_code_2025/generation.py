@@ -0,0 +1,47 @@
+"""Synthetic puzzle inputs of the Advent of Code 2025 solutions.
+
+Each `day_XX/generator.py` module exposes a
+`generate(scale, rng) -> Iterator[str]` function lazily yielding the text
+of an input in the format of the day, so that inputs of millions of records
+can be written without holding them in memory.
+"""
+
+import importlib
+import random
+import typing as t
+from types import ModuleType
+
+Generator = t.Callable[[int, random.Random], t.Iterator[str]]
+
+
+def get_generator(day: int) -> Generator:
+    """Import the input generator of a day.
+
+    Args:
+        day (int): Day number.
+
+    Raises:
+        ValueError: If the day has no input generator.
+
+    Returns:
+        Generator: Input generator of the day.
+    """
+    module_path: str = f"advent_of_code_2025.day_{day:02d}.generator"
+    try:
+        module: ModuleType = importlib.import_module(module_path)
+    except ModuleNotFoundError as error:
+        raise ValueError(f"No input generator for day {day}") from error
+    return t.cast(Generator, module.generate)
+
+
+def write_input(day: int, scale: int, seed: int, output: t.IO[str]) -> None:
+    """Write a synthetic input of a day.
+    The same day, scale and seed always give the same input.
+
+    Args:
+        day (int): Day number.
+        scale (int): Number of records of the input (lines, ranges, ...).
+        seed (int): Seed of the random generator.
+        output (t.IO[str]): Text stream to write the input to.
+    """
+    output.writelines(get_generator(day)(scale, random.Random(seed)))
@@ -0,0 +1,89 @@
+"""Opt-in counters and timers of the algorithmic work of the solutions.
+
+Solutions bump metrics in their hot paths behind a single attribute check,
+so they cost next to nothing while disabled:
+
+    if METRICS.enabled:
+        METRICS.increment("day12.backtrack_nodes")
+"""
+
+import contextlib
+import time
+import typing as t
+
+
+class TimerStats(t.NamedTuple):
+    """Accumulated durations of a timer."""
+
+    calls: int
+    total: float
+
+
+class Metrics:
+    """Registry of named counters and timers."""
+
+    enabled: bool
+    counters: t.Dict[str, int]
+    timers: t.Dict[str, TimerStats]
+
+    def __init__(self) -> None:
+        """Initialize a disabled and empty registry."""
+        self.enabled = False
+        self.counters = {}
+        self.timers = {}
+
+    def reset(self) -> None:
+        """Clear every counter and timer."""
+        self.counters = {}
+        self.timers = {}
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """Increment a counter.
+        Callers check `enabled` beforehand, to keep hot paths cheap.
+
+        Args:
+            name (str): Counter name, prefixed by the day (e.g. `day08.`).
+            value (int, optional): Increment. Defaults to 1.
+        """
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    @contextlib.contextmanager
+    def timer(self, name: str) -> t.Iterator[None]:
+        """Time the enclosed code, if metrics are enabled.
+
+        Args:
+            name (str): Timer name, prefixed by the day (e.g. `day10.`).
+
+        Yields:
+            None: Nothing.
+        """
+        if not self.enabled:
+            yield
+            return
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            stats: TimerStats = self.timers.get(name, TimerStats(0, 0.0))
+            self.timers[name] = TimerStats(
+                calls=stats.calls + 1,
+                total=stats.total + time.perf_counter() - start,
+            )
+
+    def snapshot(self) -> t.Dict[str, t.Any]:
+        """Get a JSON serializable copy of the metrics.
+
+        Returns:
+            t.Dict[str, t.Any]: Counters, and timers with their call counts
+                and total durations in seconds.
+        """
+        return {
+            "counters": dict(sorted(self.counters.items())),
+            "timers": {
+                name: stats._asdict()
+                for name, stats in sorted(self.timers.items())
+            },
+        }
+
+
+METRICS: Metrics = Metrics()
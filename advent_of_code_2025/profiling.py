@@ -0,0 +1,141 @@
+"""CPU and memory profiling of Advent of Code 2025 solutions."""
+
+import cProfile
+import io
+import pstats
+import tracemalloc
+import typing as t
+from pathlib import Path
+
+ResultT = t.TypeVar("ResultT")
+
+PROFILE_KINDS: t.Tuple[str, ...] = ("cpu", "mem")
+TOP_ENTRIES: int = 20
+
+# Allocations made by the profiler itself or by the import system are noise
+MEMORY_FILTERS: t.List[tracemalloc.Filter] = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+def get_report_path(output_dir: Path, day: int, part: int, suffix: str) -> Path:
+    """Get the path of a profiling report of a day/part.
+
+    Args:
+        output_dir (Path): Folder storing the reports.
+        day (int): Day number.
+        part (int): Part number.
+        suffix (str): Suffix of the report file.
+
+    Returns:
+        Path: Path of the report file.
+    """
+    return output_dir / f"day_{day:02d}_part_{part:02d}.{suffix}"
+
+
+def profile_cpu(
+    run: t.Callable[[], ResultT], dump_path: Path, top: int = TOP_ENTRIES
+) -> t.Tuple[ResultT, t.List[str]]:
+    """Run a function under cProfile.
+
+    Args:
+        run (t.Callable[[], ResultT]): Function to profile.
+        dump_path (Path): File to dump the raw pstats data to.
+        top (int, optional): Number of functions to report.
+            Defaults to TOP_ENTRIES.
+
+    Returns:
+        t.Tuple[ResultT, t.List[str]]: Result of the function, and report
+            of the functions with the highest cumulative time.
+    """
+    profiler: cProfile.Profile = cProfile.Profile()
+    result: ResultT = profiler.runcall(run)
+    profiler.dump_stats(dump_path)
+
+    report: io.StringIO = io.StringIO()
+    stats: pstats.Stats = pstats.Stats(profiler, stream=report)
+    stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    return result, report.getvalue().strip("\n").splitlines()
+
+
+def profile_memory(
+    run: t.Callable[[], ResultT], top: int = TOP_ENTRIES
+) -> t.Tuple[ResultT, t.List[str]]:
+    """Run a function under tracemalloc.
+
+    Args:
+        run (t.Callable[[], ResultT]): Function to profile.
+        top (int, optional): Number of allocation sites to report.
+            Defaults to TOP_ENTRIES.
+
+    Returns:
+        t.Tuple[ResultT, t.List[str]]: Result of the function, and report
+            of the peak memory and of the biggest allocation sites.
+    """
+    tracemalloc.start()
+    try:
+        result: ResultT = run()
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    report: t.List[str] = [
+        f"Peak memory: {peak / (1 << 20):.3f} MiB",
+        "",
+        f"Top {top} allocation sites still alive at the end of the run:",
+    ]
+    for statistic in snapshot.filter_traces(MEMORY_FILTERS).statistics(
+        "lineno"
+    )[:top]:
+        frame: tracemalloc.Frame = statistic.traceback[0]
+        report.append(
+            f"{statistic.size / 1024:>10.1f} KiB {statistic.count:>8} blocks"
+            f"  {frame.filename}:{frame.lineno}"
+        )
+    return result, report
+
+
+def profile_run(
+    kind: str,
+    run: t.Callable[[], ResultT],
+    output_dir: Path,
+    day: int,
+    part: int,
+) -> t.Tuple[ResultT, t.List[str], Path]:
+    """Profile the run of a day/part and write its report.
+
+    Args:
+        kind (str): Kind of profiling, one of `PROFILE_KINDS`.
+        run (t.Callable[[], ResultT]): Function running the day/part.
+        output_dir (Path): Folder to write the reports to.
+        day (int): Day number.
+        part (int): Part number.
+
+    Raises:
+        ValueError: If the kind of profiling is unknown.
+
+    Returns:
+        t.Tuple[ResultT, t.List[str], Path]:
+            Result of the run, report and path of the written report.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    report: t.List[str]
+    if kind == "cpu":
+        result, report = profile_cpu(
+            run, get_report_path(output_dir, day, part, "prof")
+        )
+    elif kind == "mem":
+        result, report = profile_memory(run)
+    else:
+        raise ValueError(
+            f"Unknown profile kind {kind!r}, expected one of {PROFILE_KINDS}"
+        )
+
+    report_path: Path = get_report_path(output_dir, day, part, f"{kind}.txt")
+    with open(report_path, "w", encoding="utf-8") as report_fd:
+        report_fd.write("\n".join(report) + "\n")
+    return result, report, report_path
@@ -0,0 +1,297 @@
+"""Input sources shared by every day parser.
+
+A source is either a file name (relative to the day folder, or absolute)
+or an already opened text/binary stream such as `sys.stdin.buffer`.
+Records are always read lazily so that inputs larger than memory
+can be processed by single-pass solutions. Files can also be memory-mapped,
+so parsers work on their bytes without decoding or copying them.
+"""
+
+import contextlib
+import io
+import mmap
+import typing as t
+from pathlib import Path
+
+# numpy is slow to import, it is only loaded when an array view is requested
+if t.TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+InputSource = t.Union[str, Path, t.IO[str], t.IO[bytes]]
+
+CHUNK_SIZE: int = 1 << 16
+
+
+@contextlib.contextmanager
+def open_input(source: InputSource, base_path: Path) -> t.Iterator[t.IO[str]]:
+    """Open an input source as a text stream.
+    Streams given by the caller are left open.
+
+    Args:
+        source (InputSource): Input source to open.
+        base_path (Path): Folder relative file names are resolved from.
+
+    Yields:
+        t.IO[str]: Text stream of the input.
+    """
+    if isinstance(source, (str, Path)):
+        with open(base_path / source, "r", encoding="utf-8") as input_fd:
+            yield input_fd
+    elif isinstance(source.read(0), str):
+        yield t.cast(t.IO[str], source)
+    else:
+        text_fd: io.TextIOWrapper = io.TextIOWrapper(
+            t.cast(t.IO[bytes], source), encoding="utf-8"
+        )
+        try:
+            yield text_fd
+        finally:
+            text_fd.detach()
+
+
+def iter_lines(source: InputSource, base_path: Path) -> t.Iterator[str]:
+    """Lazily yield lines of an input source, without their line ending.
+
+    Args:
+        source (InputSource): Input source to read.
+        base_path (Path): Folder relative file names are resolved from.
+
+    Yields:
+        str: Lines of the input.
+    """
+    with open_input(source, base_path) as input_fd:
+        for line in input_fd:
+            yield line.rstrip("\r\n")
+
+
+def iter_byte_lines(source: InputSource, base_path: Path) -> t.Iterator[bytes]:
+    """Lazily yield lines of an input source as bytes, without their line
+    ending. Files and binary streams are never decoded.
+
+    Args:
+        source (InputSource): Input source to read.
+        base_path (Path): Folder relative file names are resolved from.
+
+    Yields:
+        bytes: Lines of the input.
+    """
+    if isinstance(source, (str, Path)):
+        with open(base_path / source, "rb") as input_fd:
+            for byte_line in input_fd:
+                yield byte_line.rstrip(b"\r\n")
+    elif isinstance(source.read(0), str):
+        for line in t.cast(t.IO[str], source):
+            yield line.rstrip("\r\n").encode()
+    else:
+        for byte_line in t.cast(t.IO[bytes], source):
+            yield byte_line.rstrip(b"\r\n")
+
+
+def iter_records(
+    source: InputSource, base_path: Path, separator: str
+) -> t.Iterator[str]:
+    """Lazily yield the records of an input source split by a separator.
+    The input is read by chunks, so a single huge line never has
+    to fit in memory.
+
+    Args:
+        source (InputSource): Input source to read.
+        base_path (Path): Folder relative file names are resolved from.
+        separator (str): Separator between two records.
+
+    Yields:
+        str: Records of the input.
+    """
+    with open_input(source, base_path) as input_fd:
+        pending: str = ""
+        while chunk := input_fd.read(CHUNK_SIZE):
+            *records, pending = (pending + chunk).split(separator)
+            yield from records
+        yield pending
+
+
+class MappedInput:
+    """Read-only bytes of an input, memory-mapped when it is a file.
+    Views outliving the mapping keep the file mapped until they are
+    garbage collected, parsers should copy whatever they keep.
+    """
+
+    buffer: memoryview
+    __line_offsets: t.List[int] | None
+
+    def __init__(self, buffer: memoryview) -> None:
+        """Initialize the input from its bytes.
+
+        Args:
+            buffer (memoryview): Bytes of the input.
+        """
+        self.buffer = buffer
+        self.__line_offsets = None
+
+    @property
+    def line_offsets(self) -> t.List[int]:
+        """Offsets of the start of each line, computed on first access.
+        A final line ending does not start a new line.
+
+        Returns:
+            t.List[int]: Offset of each line in the buffer.
+        """
+        if self.__line_offsets is None:
+            data: bytes | mmap.mmap = t.cast(bytes | mmap.mmap, self.buffer.obj)
+            offsets: t.List[int] = [0] if len(self.buffer) else []
+            position: int = data.find(b"\n")
+            while position != -1 and position + 1 < len(self.buffer):
+                offsets.append(position + 1)
+                position = data.find(b"\n", position + 1)
+            self.__line_offsets = offsets
+        return self.__line_offsets
+
+    def __len__(self) -> int:
+        """Get the number of lines of the input.
+
+        Returns:
+            int: Number of lines.
+        """
+        return len(self.line_offsets)
+
+    def line(self, index: int) -> memoryview:
+        """Get a line of the input, without its line ending.
+
+        Args:
+            index (int): Line number, starting at 0.
+
+        Returns:
+            memoryview: View of the line bytes.
+        """
+        offsets: t.List[int] = self.line_offsets
+        start: int = offsets[index]
+        end: int = (
+            offsets[index + 1] - 1
+            if index + 1 < len(offsets)
+            else len(self.buffer)
+        )
+        while end > start and self.buffer[end - 1] in b"\r\n":
+            end -= 1
+        return self.buffer[start:end]
+
+    def iter_lines(self) -> t.Iterator[memoryview]:
+        """Yield the lines of the input, without their line ending.
+
+        Yields:
+            memoryview: View of each line bytes.
+        """
+        for index in range(len(self)):
+            yield self.line(index)
+
+    def iter_blocks(
+        self, block_size: int, start: int = 0, end: int | None = None
+    ) -> t.Iterator[t.Tuple[int, int]]:
+        """Split the input, or a range of whole lines of the input,
+        into blocks of whole lines.
+
+        Args:
+            block_size (int): Approximate size of the blocks in bytes.
+            start (int, optional): Offset of the range. Defaults to 0.
+            end (int | None, optional):
+                Offset following the range. Defaults to the input end.
+
+        Yields:
+            t.Tuple[int, int]: Start and end offsets of each block.
+        """
+        data: bytes | mmap.mmap = t.cast(bytes | mmap.mmap, self.buffer.obj)
+        size: int = len(self.buffer) if end is None else end
+        while start < size:
+            # Blocks end after the first line ending past their size
+            block_end: int = (
+                data.find(b"\n", min(start + block_size, size) - 1, size) + 1
+            )
+            yield start, block_end or size
+            start = block_end or size
+
+    def as_array(self) -> "npt.NDArray[np.uint8]":
+        """Get a NumPy view of the input bytes, line endings included.
+
+        Returns:
+            npt.NDArray[np.uint8]: Bytes of the input.
+        """
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        return np.frombuffer(self.buffer, dtype=np.uint8)
+
+    def as_grid(self) -> "npt.NDArray[np.uint8]":
+        """Get a 2D NumPy view of an input whose lines all have the same
+        length, line endings excluded.
+
+        Raises:
+            ValueError: If the lines do not all have the same length.
+
+        Returns:
+            npt.NDArray[np.uint8]: Bytes of the input, one row per line.
+        """
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        data: npt.NDArray[np.uint8] = self.as_array()
+        if len(data) == 0:
+            return np.zeros((0, 0), dtype=np.uint8)
+        line_ends: npt.NDArray[np.intp] = np.flatnonzero(data == ord("\n"))
+        # Lines are a line ending apart, a missing final one included
+        stride: int = int(line_ends[0]) + 1 if len(line_ends) else len(data) + 1
+        ending: int = 2 if stride >= 2 and data[stride - 2] == ord("\r") else 1
+        width: int = stride - ending
+        has_final_ending: bool = bool(data[-1] == ord("\n"))
+        rows: int = len(line_ends) + int(not has_final_ending)
+        if (
+            len(data) != rows * stride - (0 if has_final_ending else ending)
+            or not np.array_equal(
+                line_ends,
+                np.arange(stride - 1, len(line_ends) * stride, stride),
+            )
+            or (ending == 2 and not np.all(data[line_ends - 1] == ord("\r")))
+        ):
+            raise ValueError("Input lines do not all have the same length")
+        return np.lib.stride_tricks.as_strided(
+            data,
+            shape=(rows, width),
+            strides=(stride, 1),
+            writeable=False,
+        )
+
+
+@contextlib.contextmanager
+def map_input(source: InputSource, base_path: Path) -> t.Iterator[MappedInput]:
+    """Memory-map an input source.
+    Streams cannot be mapped, they are read in memory instead.
+
+    Args:
+        source (InputSource): Input source to map.
+        base_path (Path): Folder relative file names are resolved from.
+
+    Yields:
+        MappedInput: Bytes of the input.
+    """
+    if not isinstance(source, (str, Path)):
+        data: bytes | str = source.read()
+        yield MappedInput(
+            memoryview(data.encode() if isinstance(data, str) else data)
+        )
+        return
+
+    with open(base_path / source, "rb") as input_fd:
+        # Empty files cannot be mapped
+        if not input_fd.seek(0, io.SEEK_END):
+            yield MappedInput(memoryview(b""))
+            return
+        mapped: mmap.mmap = mmap.mmap(
+            input_fd.fileno(), 0, access=mmap.ACCESS_READ
+        )
+        buffer: memoryview = memoryview(mapped)
+        try:
+            yield MappedInput(buffer)
+        finally:
+            buffer.release()
+            try:
+                mapped.close()
+            except BufferError:
+                # Views still alive, the mapping is closed once they are gone
+                pass
@@ -0,0 +1,321 @@
+"""Registry of the Advent of Code 2025 solutions.
+
+Each `day_XX/part_YY.py` module exposes two stages:
+    - `parse(source)`: parse an input source into a reusable object,
+      or into a lazy iterator of records for single-pass solutions,
+    - `solve(parsed) -> int`: compute the answer from the parsed input.
+Parts sharing the same `parse` function can reuse the same parsed input,
+so `solve` must never mutate it. Parts may also expose
+`solve_parallel(source, workers) -> int`, solving an input source with
+worker processes, and `INPUT_OPTIONS`, the keyword arguments of `solve`
+for some of their named input files.
+"""
+
+import importlib
+import typing as t
+from pathlib import Path
+from types import ModuleType
+
+from advent_of_code_2025.cache import AnswerStore, ParsedInputCache
+from advent_of_code_2025.puzzle_input import InputSource
+
+ParsedT = t.TypeVar("ParsedT")
+
+# Static registry of the available solutions: day number -> part numbers
+SOLUTIONS: t.Dict[int, t.Tuple[int, ...]] = {
+    1: (1, 2),
+    2: (1, 2),
+    3: (1, 2),
+    4: (1, 2),
+    5: (1, 2),
+    6: (1, 2),
+    7: (1, 2),
+    8: (1, 2),
+    9: (1, 2),
+    10: (1, 2),
+    11: (1, 2),
+    12: (1,),
+}
+
+DEFAULT_INPUTS: t.Dict[str, str] = {
+    "Example": "inputs/example.txt",
+    "Real": "inputs/real.txt",
+}
+
+
+class Solution(t.NamedTuple):
+    """Solution of a day/part."""
+
+    day: int
+    part: int
+    module: ModuleType
+
+    @property
+    def inputs(self) -> t.Dict[str, str]:
+        """Named input files of the solution, relative to the day folder.
+
+        Returns:
+            t.Dict[str, str]: Input file names by input name.
+        """
+        return t.cast(
+            t.Dict[str, str], getattr(self.module, "INPUTS", DEFAULT_INPUTS)
+        )
+
+    def get_file_path(self, file_name: str | Path) -> Path:
+        """Resolve an input file name from the day folder.
+
+        Args:
+            file_name (str | Path): Input file name, or absolute path.
+
+        Returns:
+            Path: Path of the input file.
+        """
+        return Path(str(self.module.__file__)).parent / file_name
+
+    def get_options(self, source: InputSource) -> t.Dict[str, t.Any]:
+        """Get the keyword arguments of `solve` for an input source.
+        Only named input files of the module have options.
+
+        Args:
+            source (InputSource): Input file name or stream.
+
+        Returns:
+            t.Dict[str, t.Any]: Keyword arguments of `solve`.
+        """
+        if not isinstance(source, (str, Path)):
+            return {}
+        input_options: t.Dict[str, t.Dict[str, t.Any]] = getattr(
+            self.module, "INPUT_OPTIONS", {}
+        )
+        return dict(input_options.get(str(source), {}))
+
+    def get_cache_key(
+        self, source: InputSource, cache: ParsedInputCache | None
+    ) -> str | None:
+        """Get the parsed input cache key of an input source.
+
+        Args:
+            source (InputSource): Input file name or stream.
+            cache (ParsedInputCache | None): Parsed input cache, if any.
+
+        Returns:
+            str | None: Cache key, None if the input is not cacheable.
+        """
+        if cache is None or not isinstance(source, (str, Path)):
+            return None
+        return cache.get_key(self.module.parse, self.get_file_path(source))
+
+    def parse(
+        self, source: InputSource, cache: ParsedInputCache | None = None
+    ) -> t.Any:
+        """Parse an input source into a reusable object.
+        Lazy iterators of records are materialized into lists.
+
+        Args:
+            source (InputSource): Input file name or stream.
+            cache (ParsedInputCache | None, optional):
+                Cache to load/store the parsed input from/to.
+                Defaults to None.
+
+        Returns:
+            t.Any: Parsed input.
+        """
+        return self.__parse(source, cache, self.get_cache_key(source, cache))
+
+    def __parse(
+        self,
+        source: InputSource,
+        cache: ParsedInputCache | None,
+        cache_key: str | None,
+    ) -> t.Any:
+        """Parse an input source, going through the cache if possible.
+
+        Args:
+            source (InputSource): Input file name or stream.
+            cache (ParsedInputCache | None): Parsed input cache, if any.
+            cache_key (str | None): Cache key of the input, if cacheable.
+
+        Returns:
+            t.Any: Parsed input.
+        """
+        if cache is not None and cache_key is not None:
+            found, parsed = cache.get(cache_key)
+            if found:
+                return parsed
+
+        parsed = self.module.parse(source)
+        if isinstance(parsed, t.Iterator):
+            parsed = list(parsed)
+
+        if cache is not None and cache_key is not None:
+            cache.set(cache_key, parsed)
+        return parsed
+
+    def solve(self, parsed: t.Any, **options: t.Any) -> int:
+        """Solve the part from a parsed input.
+
+        Args:
+            parsed (t.Any): Parsed input, as returned by `parse`.
+            **options (t.Any): Keyword arguments of the input, as returned
+                by `get_options`.
+
+        Returns:
+            int: Answer.
+        """
+        return int(self.module.solve(parsed, **options))
+
+    @property
+    def parallel(self) -> bool:
+        """Whether the part can be solved with worker processes.
+
+        Returns:
+            bool: True if the module exposes `solve_parallel`.
+        """
+        return callable(getattr(self.module, "solve_parallel", None))
+
+    def run(
+        self,
+        source: InputSource,
+        cache: ParsedInputCache | None = None,
+        answers: AnswerStore | None = None,
+        workers: int | None = None,
+    ) -> int:
+        """Parse an input source and solve the part.
+        Inputs that cannot be cached are streamed by lazy parsers,
+        so memory stays bounded.
+
+        Args:
+            source (InputSource): Input file name or stream.
+            cache (ParsedInputCache | None, optional):
+                Cache to load/store the parsed input from/to.
+                Defaults to None.
+            answers (AnswerStore | None, optional):
+                Store to load/store the answer from/to. Defaults to None.
+            workers (int | None, optional):
+                Number of worker processes of parts exposing
+                `solve_parallel`, the parsed input cache is then unused.
+                Defaults to None (solved in the current process).
+
+        Returns:
+            int: Answer.
+        """
+        options: t.Dict[str, t.Any] = self.get_options(source)
+        answer_key: str | None = None
+        if answers is not None and isinstance(source, (str, Path)):
+            answer_key = answers.get_key(
+                self.day,
+                self.part,
+                self.module,
+                self.get_file_path(source),
+                options,
+            )
+            found, answer = answers.get(answer_key)
+            if found:
+                return int(answer)
+
+        cache_key: str | None = self.get_cache_key(source, cache)
+        if workers is not None and self.parallel:
+            answer = self.module.solve_parallel(
+                (
+                    self.get_file_path(source)
+                    if isinstance(source, (str, Path))
+                    else source
+                ),
+                workers,
+            )
+        elif cache_key is not None:
+            answer = self.solve(
+                self.__parse(source, cache, cache_key), **options
+            )
+        else:
+            answer = self.solve(self.module.parse(source), **options)
+
+        if answers is not None and answer_key is not None:
+            answers.set(answer_key, answer)
+        return int(answer)
+
+
+def get_available_days() -> t.List[t.Tuple[int, str]]:
+    """Get list of available day folders from the solutions registry.
+
+    Returns:
+        t.List[t.Tuple[int, str]]:
+            List of tuples containing day number and folder name.
+    """
+    return [(day, f"day_{day:02d}") for day in sorted(SOLUTIONS)]
+
+
+def get_available_parts(day_folder: str) -> t.List[t.Tuple[int, str]]:
+    """Get list of available parts for a given day from the solutions registry.
+
+    Args:
+        day_folder (str): Day folder name.
+
+    Returns:
+        t.List[t.Tuple[int, str]]:
+            List of tuples containing part number and file name.
+    """
+    return [
+        (part, f"part_{part:02d}")
+        for part in SOLUTIONS.get(int(day_folder.split("_")[1]), ())
+    ]
+
+
+def get_module_path(day: int, part: int) -> str:
+    """Get the import path of a day/part module.
+
+    Args:
+        day (int): Day number.
+        part (int): Part number.
+
+    Returns:
+        str: Import path of the module.
+    """
+    return f"advent_of_code_2025.day_{day:02d}.part_{part:02d}"
+
+
+def get_solution(day: int, part: int) -> Solution:
+    """Import and register the solution of a day/part.
+
+    Args:
+        day (int): Day number.
+        part (int): Part number.
+
+    Raises:
+        ValueError: If the module does not expose `parse` and `solve`.
+
+    Returns:
+        Solution: Solution of the day/part.
+    """
+    module: ModuleType = importlib.import_module(get_module_path(day, part))
+    for stage in ("parse", "solve"):
+        if not callable(getattr(module, stage, None)):
+            raise ValueError(
+                f"No {stage}() function found in {module.__name__}"
+            )
+    return Solution(day=day, part=part, module=module)
+
+
+def print_answers(
+    parse: t.Callable[[InputSource], ParsedT],
+    solve: t.Callable[..., int],
+    inputs: t.Dict[str, str] | None = None,
+    options: t.Dict[str, t.Dict[str, t.Any]] | None = None,
+) -> None:
+    """Solve and print the answer of each named input.
+    Used by the `main()` function of every part module.
+
+    Args:
+        parse (t.Callable[[InputSource], ParsedT]): Parsing stage of the part.
+        solve (t.Callable[..., int]): Solving stage of the part.
+        inputs (t.Dict[str, str] | None, optional):
+            Input file names by input name. Defaults to `DEFAULT_INPUTS`.
+        options (t.Dict[str, t.Dict[str, t.Any]] | None, optional):
+            Keyword arguments of `solve` by input file name.
+            Defaults to None.
+    """
+    for input_name, file_name in (inputs or DEFAULT_INPUTS).items():
+        answer: int = solve(
+            parse(file_name), **(options or {}).get(file_name, {})
+        )
+        print(f"{input_name} output: {answer}")
@@ -0,0 +1,159 @@
+"""Parallel runner for Advent of Code 2025 solutions."""
+
+import contextlib
+import signal
+import time
+import typing as t
+from concurrent.futures import Future, ProcessPoolExecutor
+from types import FrameType
+
+from advent_of_code_2025.cache import AnswerStore, ParsedInputCache
+from advent_of_code_2025.registry import Solution, get_solution
+
+
+class RunResult(t.NamedTuple):
+    """Result of a day/part run."""
+
+    day: int
+    part: int
+    status: str
+    duration: float
+    answers: t.Dict[str, int]
+    error: str | None
+
+
+def parse_days(days_spec: str) -> t.List[int]:
+    """Parse a days specification such as `3,7-12`.
+
+    Args:
+        days_spec (str): Comma separated list of days or ranges of days.
+
+    Raises:
+        ValueError: If the specification is malformed.
+
+    Returns:
+        t.List[int]: Sorted list of unique day numbers.
+    """
+    days: t.Set[int] = set()
+    for chunk in days_spec.split(","):
+        chunk = chunk.strip()
+        if not chunk:
+            continue
+        bounds: t.List[str] = chunk.split("-")
+        if len(bounds) > 2 or not all(bound.isdigit() for bound in bounds):
+            raise ValueError(f"Invalid days specification: {chunk}")
+        first_day, last_day = int(bounds[0]), int(bounds[-1])
+        if first_day > last_day:
+            raise ValueError(f"Invalid days range: {chunk}")
+        days.update(range(first_day, last_day + 1))
+    return sorted(days)
+
+
+def _raise_timeout(signum: int, frame: FrameType | None) -> None:
+    """Signal handler interrupting a solution that exceeded its timeout.
+
+    Args:
+        signum (int): Received signal number.
+        frame (FrameType | None): Interrupted stack frame.
+
+    Raises:
+        TimeoutError: Always.
+    """
+    raise TimeoutError(f"Interrupted by signal {signum}")
+
+
+@contextlib.contextmanager
+def time_limit(timeout: float | None) -> t.Iterator[None]:
+    """Interrupt the enclosed code with a `TimeoutError` once it exceeded
+    a duration. Relies on `SIGALRM`, so only works in the main thread.
+
+    Args:
+        timeout (float | None): Maximum duration in seconds, if any.
+
+    Yields:
+        None: Nothing.
+    """
+    if timeout is None:
+        yield
+        return
+    signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def run_part(
+    day: int, part: int, timeout: float | None, use_cache: bool
+) -> RunResult:
+    """Run a day/part solution on each of its inputs.
+    Meant to be executed in a worker process.
+
+    Args:
+        day (int): Day number.
+        part (int): Part number.
+        timeout (float | None): Maximum duration in seconds, if any.
+        use_cache (bool): Whether to use the parsed input and answer caches.
+
+    Returns:
+        RunResult: Result of the run.
+    """
+    answers: t.Dict[str, int] = {}
+    status: str = "ok"
+    error_message: str | None = None
+    start: float = time.perf_counter()
+
+    try:
+        with time_limit(timeout):
+            solution: Solution = get_solution(day, part)
+            for input_name, file_name in solution.inputs.items():
+                answers[input_name] = solution.run(
+                    file_name,
+                    ParsedInputCache() if use_cache else None,
+                    AnswerStore() if use_cache else None,
+                )
+    except TimeoutError:
+        status = "timeout"
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        status = "error"
+        error_message = f"{type(error).__name__}: {error}"
+
+    return RunResult(
+        day=day,
+        part=part,
+        status=status,
+        duration=time.perf_counter() - start,
+        answers=answers,
+        error=error_message,
+    )
+
+
+def run_all(
+    tasks: t.List[t.Tuple[int, int]],
+    workers: int | None = None,
+    timeout: float | None = None,
+    use_cache: bool = True,
+) -> t.Iterator[RunResult]:
+    """Run day/part solutions in a pool of worker processes.
+
+    Args:
+        tasks (t.List[t.Tuple[int, int]]): Day and part numbers to run.
+        workers (int | None, optional):
+            Number of worker processes. Defaults to the number of CPUs.
+        timeout (float | None, optional):
+            Maximum duration of each task in seconds. Defaults to None.
+        use_cache (bool, optional):
+            Whether to use the parsed input and answer caches.
+            Defaults to True.
+
+    Yields:
+        RunResult: Results, in the same order as the tasks.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures: t.List[Future[RunResult]] = [
+            executor.submit(run_part, day, part, timeout, use_cache)
+            for day, part in tasks
+        ]
+        for future in futures:
+            yield future.result()
@@ -0,0 +1,306 @@
+"""Persistent solver daemon of the Advent of Code 2025 solutions.
+
+The daemon listens on a Unix domain socket and dispatches requests to a pool
+of worker processes forked at startup, which import every solution and its
+heavy dependencies once. Both requests and responses are JSON objects,
+one per line:
+    - request: `{"id": ..., "day": 8, "part": 1, "input": "<input text>"}`
+      (or `"path": "<input file>"` instead of `"input"`, and an optional
+      `"timeout"` in seconds),
+    - response: `{"id": ..., "day": 8, "part": 1, "status": "ok",
+      "answer": 40, "parse_time": 0.001, "solve_time": 0.01,
+      "error": null}`.
+Responses are streamed back as soon as they are computed, so they may not
+follow the order of the requests of a connection.
+"""
+
+import importlib
+import io
+import json
+import multiprocessing
+import multiprocessing.pool
+import os
+import signal
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+import typing as t
+from pathlib import Path
+from types import FrameType
+
+from advent_of_code_2025.puzzle_input import InputSource
+from advent_of_code_2025.registry import SOLUTIONS, Solution, get_solution
+from advent_of_code_2025.runner import time_limit
+
+DEFAULT_SOCKET_PATH: Path = (
+    Path(tempfile.gettempdir()) / f"advent_of_code_2025-{os.getuid()}.sock"
+)
+
+# Dependencies lazily imported by some solutions, loaded once per worker
+WARM_MODULES: t.Tuple[str, ...] = ("networkx", "numpy", "pulp")
+
+
+def warm_worker() -> None:
+    """Pool initializer importing every solution and heavy dependency."""
+    # Interrupting the daemon terminates the pool, workers just stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # Workers killed while waiting for a task would keep the lock of the
+    # task queue, and the termination of the pool would wait for it forever
+    signal.signal(signal.SIGTERM, _exit_worker)
+    for module in WARM_MODULES:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            pass
+    for day, parts in SOLUTIONS.items():
+        for part in parts:
+            get_solution(day, part)
+
+
+def make_response(
+    request: t.Dict[str, t.Any], status: str, **fields: t.Any
+) -> t.Dict[str, t.Any]:
+    """Build the response of a request.
+
+    Args:
+        request (t.Dict[str, t.Any]): Answered request.
+        status (str): Status of the request (ok, error or timeout).
+        **fields (t.Any): Answer, timings and error of the request.
+
+    Returns:
+        t.Dict[str, t.Any]: Response of the request.
+    """
+    return {
+        "id": request.get("id"),
+        "day": request.get("day"),
+        "part": request.get("part"),
+        "status": status,
+        "answer": fields.get("answer"),
+        "parse_time": fields.get("parse_time"),
+        "solve_time": fields.get("solve_time"),
+        "error": fields.get("error"),
+    }
+
+
+def validate_request(request: t.Any) -> str | None:
+    """Validate a request before dispatching it to the workers.
+
+    Args:
+        request (t.Any): Decoded request.
+
+    Returns:
+        str | None: Error message, None if the request is valid.
+    """
+    if not isinstance(request, dict):
+        return "Request must be a JSON object"
+    if request.get("day") not in SOLUTIONS:
+        return f"Day {request.get('day')} not found"
+    if request.get("part") not in SOLUTIONS[request["day"]]:
+        return f"Part {request.get('part')} not found"
+    if not isinstance(request.get("input"), str) and not isinstance(
+        request.get("path"), str
+    ):
+        return "Request must have an input text or an input path"
+    return None
+
+
+def solve_request(request: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
+    """Parse and solve the input of a request.
+    Executed by the worker processes.
+
+    Args:
+        request (t.Dict[str, t.Any]): Validated request.
+
+    Returns:
+        t.Dict[str, t.Any]: Response of the request.
+    """
+    source: InputSource = (
+        io.StringIO(request["input"])
+        if isinstance(request.get("input"), str)
+        else Path(request["path"]).absolute()
+    )
+    timings: t.Dict[str, float] = {}
+    try:
+        with time_limit(request.get("timeout")):
+            solution: Solution = get_solution(request["day"], request["part"])
+            start: float = time.perf_counter()
+            parsed: t.Any = solution.parse(source)
+            timings["parse_time"] = time.perf_counter() - start
+            answer: int = solution.solve(parsed)
+            timings["solve_time"] = (
+                time.perf_counter() - start - timings["parse_time"]
+            )
+    except TimeoutError:
+        return make_response(request, "timeout", **timings)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        return make_response(
+            request, "error", error=f"{type(error).__name__}: {error}"
+        )
+    return make_response(request, "ok", answer=answer, **timings)
+
+
+class SolverServer(socketserver.ThreadingUnixStreamServer):
+    """Unix socket server dispatching requests to a pool of workers."""
+
+    daemon_threads = True
+    pool: multiprocessing.pool.Pool
+
+    def __init__(
+        self, socket_path: Path, pool: multiprocessing.pool.Pool
+    ) -> None:
+        """Initialize the server.
+
+        Args:
+            socket_path (Path): Path of the Unix socket to listen on.
+            pool (multiprocessing.pool.Pool): Pool of warm workers.
+        """
+        self.pool = pool
+        super().__init__(str(socket_path), SolverRequestHandler)
+
+
+class SolverRequestHandler(socketserver.StreamRequestHandler):
+    """Handler of a client connection, streaming back the responses."""
+
+    server: SolverServer
+
+    def handle(self) -> None:
+        """Dispatch every request of the connection, then wait for all
+        the responses to be sent.
+        """
+        write_lock: threading.Lock = threading.Lock()
+        pending: t.List[multiprocessing.pool.AsyncResult[t.Any]] = []
+
+        def send(response: t.Dict[str, t.Any]) -> None:
+            """Send a response to the client.
+
+            Args:
+                response (t.Dict[str, t.Any]): Response to send.
+            """
+            with write_lock:
+                try:
+                    self.wfile.write(json.dumps(response).encode() + b"\n")
+                    self.wfile.flush()
+                except OSError:
+                    # The client went away, nothing left to answer
+                    pass
+
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request: t.Any = json.loads(line)
+            except json.JSONDecodeError as error:
+                send(make_response({}, "error", error=f"Invalid JSON: {error}"))
+                continue
+            error_message: str | None = validate_request(request)
+            if error_message is not None:
+                send(
+                    make_response(
+                        request if isinstance(request, dict) else {},
+                        "error",
+                        error=error_message,
+                    )
+                )
+                continue
+            pending.append(
+                self.server.pool.apply_async(
+                    solve_request, (request,), callback=send
+                )
+            )
+
+        for result in pending:
+            result.wait()
+
+
+def _exit_worker(signum: int, frame: FrameType | None) -> None:
+    """Signal handler making a worker exit, releasing its locks.
+
+    Args:
+        signum (int): Received signal number.
+        frame (FrameType | None): Interrupted stack frame.
+
+    Raises:
+        SystemExit: Always.
+    """
+    raise SystemExit(128 + signum)
+
+
+def _interrupt(signum: int, frame: FrameType | None) -> None:
+    """Signal handler stopping the daemon like Ctrl+C does.
+
+    Args:
+        signum (int): Received signal number.
+        frame (FrameType | None): Interrupted stack frame.
+
+    Raises:
+        KeyboardInterrupt: Always.
+    """
+    raise KeyboardInterrupt(f"Interrupted by signal {signum}")
+
+
+def remove_stale_socket(socket_path: Path) -> None:
+    """Remove a socket left over by a daemon which is not running anymore,
+    as it would prevent binding.
+
+    Args:
+        socket_path (Path): Path of the Unix socket.
+
+    Raises:
+        FileExistsError: If a daemon is still listening on the socket.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(socket_path))
+        except FileNotFoundError:
+            return
+        except ConnectionRefusedError:
+            socket_path.unlink(missing_ok=True)
+            return
+    raise FileExistsError(f"A daemon is already running on {socket_path}")
+
+
+def serve(socket_path: Path, workers: int | None = None) -> None:
+    """Serve requests until interrupted by SIGINT or SIGTERM.
+
+    Args:
+        socket_path (Path): Path of the Unix socket to listen on.
+        workers (int | None, optional):
+            Number of worker processes. Defaults to the number of CPUs.
+
+    Raises:
+        FileExistsError: If a daemon is already running on the socket.
+    """
+    remove_stale_socket(socket_path)
+    with multiprocessing.Pool(workers, initializer=warm_worker) as pool:
+        # Installed after forking, workers keep the default handler
+        signal.signal(signal.SIGTERM, _interrupt)
+        try:
+            with SolverServer(socket_path, pool) as server:
+                server.serve_forever()
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+def submit(
+    socket_path: Path, requests: t.Iterable[t.Dict[str, t.Any]]
+) -> t.Iterator[t.Dict[str, t.Any]]:
+    """Send requests to a running daemon and yield its responses.
+
+    Args:
+        socket_path (Path): Path of the Unix socket of the daemon.
+        requests (t.Iterable[t.Dict[str, t.Any]]): Requests to send.
+
+    Yields:
+        t.Dict[str, t.Any]: Responses, in completion order.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(socket_path))
+        with client.makefile("wb") as request_fd:
+            for request in requests:
+                request_fd.write(json.dumps(request).encode() + b"\n")
+        client.shutdown(socket.SHUT_WR)
+        with client.makefile("rb") as response_fd:
+            for line in response_fd:
+                yield json.loads(line)
@@ -0,0 +1,99 @@
+"""Startup time report of the `aoc` entry point."""
+
+import subprocess
+import sys
+import time
+import typing as t
+
+
+class ImportTime(t.NamedTuple):
+    """Import time of a module, as reported by `python -X importtime`."""
+
+    module: str
+    depth: int
+    self_us: int
+    cumulative_us: int
+
+
+def measure_import_times(modules: t.List[str]) -> t.List[ImportTime]:
+    """Import modules in a fresh interpreter and collect their import times.
+
+    Args:
+        modules (t.List[str]): Modules to import, in order.
+
+    Returns:
+        t.List[ImportTime]: Import time of every imported module.
+    """
+    completed: subprocess.CompletedProcess[str] = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "; ".join(f"import {module}" for module in modules),
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    import_times: t.List[ImportTime] = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        import_times.append(
+            ImportTime(
+                module=name.strip(),
+                depth=(len(name) - len(name.lstrip()) - 1) // 2,
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+            )
+        )
+    return import_times
+
+
+def measure_startup(modules: t.List[str], runs: int = 5) -> float:
+    """Measure the startup duration of an interpreter importing modules.
+
+    Args:
+        modules (t.List[str]): Modules to import, none for a bare interpreter.
+        runs (int, optional): Number of runs, the fastest is kept.
+            Defaults to 5.
+
+    Returns:
+        float: Startup duration in seconds.
+    """
+    durations: t.List[float] = []
+    for _ in range(runs):
+        start: float = time.perf_counter()
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "; ".join(f"import {module}" for module in modules) or "pass",
+            ],
+            check=True,
+        )
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def format_report(import_times: t.List[ImportTime], top: int) -> t.List[str]:
+    """Format the slowest imports as an `-X importtime` table.
+
+    Args:
+        import_times (t.List[ImportTime]): Import times to report.
+        top (int): Number of modules to report.
+
+    Returns:
+        t.List[str]: Formatted rows.
+    """
+    rows: t.List[str] = [f"{'self [us]':>10} | {'cumulative':>10} | module"]
+    for import_time in sorted(
+        import_times, key=lambda import_time: -import_time.cumulative_us
+    )[:top]:
+        rows.append(
+            f"{import_time.self_us:>10} | {import_time.cumulative_us:>10} | "
+            f"{'  ' * import_time.depth}{import_time.module}"
+        )
+    return rows